@@ -0,0 +1,56 @@
+"""Benchmarks for filters and fractional octave smoothing."""
+import numpy as np
+
+from pyfar import Signal
+import pyfar.dsp.classes as fo
+from pyfar.dsp import filter as filt
+from pyfar.dsp import fractional_octave_smoothing as fs
+
+
+class FilterProcess:
+    """Applying filters to signals."""
+    params = ([1, 8, 32], [1, 64], [4096, 48000])
+    param_names = ['n_filter_channels', 'n_channels', 'n_samples']
+
+    def setup(self, n_filter_channels, n_channels, n_samples):
+        np.random.seed(0)
+        self.signal = Signal(np.random.randn(n_channels, n_samples), 44100)
+        sos = filt.butter(None, 8, 1000, sampling_rate=44100)._coefficients
+        self.sos = fo.FilterSOS(
+            np.repeat(sos, n_filter_channels, axis=0), 44100)
+        self.fir = fo.FilterFIR(
+            np.random.randn(n_filter_channels, 256), 44100)
+        iir = np.array([[1, -.5, .25], [1, -.2, .1]])
+        self.iir = fo.FilterIIR(
+            np.repeat(iir[np.newaxis], n_filter_channels, axis=0), 44100)
+
+    def time_sos(self, n_filter_channels, n_channels, n_samples):
+        self.sos.process(self.signal)
+
+    def time_fir(self, n_filter_channels, n_channels, n_samples):
+        self.fir.process(self.signal)
+
+    def time_iir(self, n_filter_channels, n_channels, n_samples):
+        self.iir.process(self.signal)
+
+    def peakmem_sos(self, n_filter_channels, n_channels, n_samples):
+        self.sos.process(self.signal)
+
+
+class FractionalSmoothing:
+    """Fractional octave smoothing of signals."""
+    params = ([1, 16], [256, 2048], [1, 1/3])
+    param_names = ['n_channels', 'n_samples', 'smoothing_width']
+    timeout = 300
+
+    def setup(self, n_channels, n_samples, smoothing_width):
+        np.random.seed(0)
+        self.signal = Signal(np.random.randn(n_channels, n_samples), 44100)
+        self.signal.domain = 'freq'
+
+    def time_frac_smooth_signal(self, n_channels, n_samples, smoothing_width):
+        fs.frac_smooth_signal(self.signal, smoothing_width)
+
+    def peakmem_frac_smooth_signal(
+            self, n_channels, n_samples, smoothing_width):
+        fs.frac_smooth_signal(self.signal, smoothing_width)
@@ -0,0 +1,48 @@
+"""Benchmarks for the FFT and its normalization."""
+import numpy as np
+
+from pyfar import fft
+
+
+class FFT:
+    """Forward and inverse FFT with all backends."""
+    params = (fft.get_backends(), [1, 64], [1021, 1024, 48000])
+    param_names = ['backend', 'n_channels', 'n_samples']
+
+    def setup(self, backend, n_channels, n_samples):
+        np.random.seed(0)
+        self.data = np.random.randn(n_channels, n_samples)
+        self.spec = np.fft.rfft(self.data)
+        self.backend = fft.get_backend()
+        fft.set_backend(backend)
+
+    def teardown(self, backend, n_channels, n_samples):
+        fft.set_backend(self.backend)
+
+    def time_rfft(self, backend, n_channels, n_samples):
+        fft.rfft(self.data, n_samples, 44100, 'none')
+
+    def time_irfft(self, backend, n_channels, n_samples):
+        fft.irfft(self.spec, n_samples, 44100, 'none')
+
+
+class Normalization:
+    """Normalization of single sided spectra."""
+    params = (['unitary', 'amplitude', 'rms', 'power', 'psd'],
+              [1, 64], [1024, 48000])
+    param_names = ['fft_norm', 'n_channels', 'n_samples']
+
+    def setup(self, fft_norm, n_channels, n_samples):
+        np.random.seed(0)
+        self.spec = np.fft.rfft(np.random.randn(n_channels, n_samples))
+        self.window = np.hanning(n_samples)
+
+    def time_normalization(self, fft_norm, n_channels, n_samples):
+        fft.normalization(self.spec, n_samples, 44100, fft_norm)
+
+    def time_normalization_inverse(self, fft_norm, n_channels, n_samples):
+        fft.normalization(self.spec, n_samples, 44100, fft_norm, inverse=True)
+
+    def time_normalization_window(self, fft_norm, n_channels, n_samples):
+        fft.normalization(
+            self.spec, n_samples, 44100, fft_norm, window=self.window)
@@ -0,0 +1,76 @@
+"""Benchmarks for the Signal class and signal arithmetic."""
+import numpy as np
+
+from pyfar import Signal
+import pyfar.signal as signal
+
+
+class SignalDomain:
+    """Switching the domain of signals."""
+    params = ([1, 64, 512], [1023, 1024, 48000], ['none', 'rms'])
+    param_names = ['n_channels', 'n_samples', 'fft_norm']
+
+    def setup(self, n_channels, n_samples, fft_norm):
+        np.random.seed(0)
+        self.signal = Signal(
+            np.random.randn(n_channels, n_samples), 44100, fft_norm=fft_norm)
+
+    def time_time_to_freq(self, n_channels, n_samples, fft_norm):
+        self.signal.domain = 'time'
+        self.signal.domain = 'freq'
+
+    def time_round_trip(self, n_channels, n_samples, fft_norm):
+        self.signal.time
+        self.signal.freq
+        self.signal.time
+
+    def peakmem_round_trip(self, n_channels, n_samples, fft_norm):
+        self.signal.freq
+        self.signal.time
+
+
+class SignalIndexing:
+    """Selecting channels from a signal."""
+    params = [1, 64, 2048]
+    param_names = ['n_channels']
+
+    def setup(self, n_channels):
+        self.signal = Signal(np.ones((n_channels, 256)), 44100)
+        self.mask = np.arange(n_channels) % 2 == 0
+
+    def time_getitem_int(self, n_channels):
+        self.signal[0]
+
+    def time_getitem_mask(self, n_channels):
+        self.signal[self.mask]
+
+    def time_iterate(self, n_channels):
+        for _ in self.signal:
+            pass
+
+
+class SignalArithmetic:
+    """Arithmetic operations on signals."""
+    params = ([1, 64, 512], [1024, 48000], ['time', 'freq'])
+    param_names = ['n_channels', 'n_samples', 'domain']
+
+    def setup(self, n_channels, n_samples, domain):
+        np.random.seed(0)
+        self.signals = [
+            Signal(np.random.randn(n_channels, n_samples), 44100,
+                   fft_norm='rms')
+            for _ in range(3)]
+        for s in self.signals:
+            s.domain = domain
+
+    def time_add(self, n_channels, n_samples, domain):
+        signal.add(tuple(self.signals), domain)
+
+    def time_multiply(self, n_channels, n_samples, domain):
+        signal.multiply(tuple(self.signals), domain)
+
+    def time_divide_scalar(self, n_channels, n_samples, domain):
+        signal.divide((self.signals[0], 2), domain)
+
+    def peakmem_add(self, n_channels, n_samples, domain):
+        signal.add(tuple(self.signals), domain)
@@ -0,0 +1,42 @@
+"""Benchmarks for Coordinates and spatial samplings."""
+import numpy as np
+
+from pyfar import Coordinates
+from pyfar.spatial import samplings
+
+
+class NearestNeighbors:
+    """Searching the nearest neighbors of points."""
+    params = ([100, 2000, 20000], [1, 10])
+    param_names = ['n_points', 'k']
+
+    def setup(self, n_points, k):
+        np.random.seed(0)
+        points = np.random.randn(3, n_points)
+        self.coords = Coordinates(points[0], points[1], points[2])
+        self.points = np.random.randn(3, 100)
+
+    def time_get_nearest_k(self, n_points, k):
+        self.coords.get_nearest_k(
+            self.points[0], self.points[1], self.points[2], k)
+
+
+class Samplings:
+    """Generating spatial sampling grids."""
+    params = [3, 15, 35]
+    param_names = ['sh_order']
+
+    def time_sph_equiangular(self, sh_order):
+        samplings.sph_equiangular(sh_order=sh_order)
+
+    def time_sph_gaussian(self, sh_order):
+        samplings.sph_gaussian(sh_order=sh_order)
+
+    def time_sph_lebedev(self, sh_order):
+        samplings.sph_lebedev(sh_order=sh_order)
+
+    def time_sph_fliege(self, sh_order):
+        samplings.sph_fliege(sh_order=min(sh_order, 29))
+
+    def time_sph_equal_area(self, sh_order):
+        samplings.sph_equal_area((sh_order + 1)**2)
@@ -1476,10 +1476,14 @@ class Coordinates(object):
         if system is None:
             system = self._system
 
-        # cast to numpy array
-        pts = [np.atleast_2d(np.asarray(points_1, dtype=np.float64)),
-               np.atleast_2d(np.asarray(points_2, dtype=np.float64)),
-               np.atleast_2d(np.asarray(points_3, dtype=np.float64))]
+        # cast to numpy array (single precision is kept if all non-scalar
+        # points are single precision)
+        pts = [np.asarray(points_1), np.asarray(points_2),
+               np.asarray(points_3)]
+        dtypes = [p.dtype for p in pts if p.size > 1]
+        dtype = np.float32 if dtypes and \
+            all(d == np.float32 for d in dtypes) else np.float64
+        pts = [np.atleast_2d(np.asarray(p, dtype=dtype)) for p in pts]
 
         # transpose
         for nn, p in enumerate(pts):
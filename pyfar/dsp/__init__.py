@@ -1,9 +1,12 @@
 from .classes import (Filter, FilterFIR, FilterIIR, FilterSOS)
+from .partitioned_convolution import PartitionedConvolution
 from .dsp import (
-    phase, group_delay, wrap_to_2pi, nextpow2, spectrogram)
+    phase, group_delay, wrap_to_2pi, nextpow2, pad_zeros, crop, convolve,
+    spectrogram, iter_spectrogram, stft, istft, iter_stft, iter_istft)
 
 
 __all__ = [
-    Filter, FilterFIR, FilterIIR, FilterSOS,
-    phase, group_delay, wrap_to_2pi, nextpow2, spectrogram
+    Filter, FilterFIR, FilterIIR, FilterSOS, PartitionedConvolution,
+    phase, group_delay, wrap_to_2pi, nextpow2, pad_zeros, crop, convolve,
+    spectrogram, iter_spectrogram, stft, istft, iter_stft, iter_istft
 ]
@@ -5,6 +5,7 @@ import numpy as np
 import scipy.signal as spsignal
 
 from pyfar import Signal
+import pyfar.fft as fft
 from .. import utils
 
 
@@ -31,6 +32,52 @@ def lfilter(coefficients, signal, zi):
     return spsignal.lfilter(coefficients[0], coefficients[1], signal, zi=zi)
 
 
+def fftfilt(coefficients, signal, zi):
+    """FIR filtering by FFT based block convolution using the overlap-add
+    method. The input and output are the same as for `lfilter`, and the state
+    holds the tail of the convolution that overlaps the next block. The
+    coefficients can have leading dimensions that are broadcasted against the
+    channels of the signal to apply multiple filters at once.
+    """
+    b = coefficients[..., 0, :]
+    n_taps = b.shape[-1]
+    n_samples = signal.shape[-1]
+    shape = np.broadcast(b[..., 0], signal[..., 0]).shape
+
+    # the blocks are about three times the length of the filter, which is a
+    # good tradeoff between the FFT length and the number of blocks
+    n_fft = fft.next_fast_len(min(n_samples, 3 * n_taps) + n_taps - 1)
+    block_size = n_fft - n_taps + 1
+    n_blocks = -(-n_samples // block_size)
+
+    # transform all blocks of all channels at once in the precision of the
+    # signal
+    dtype = fft._real_dtype(signal.dtype)
+    blocks = np.zeros((*signal.shape[:-1], n_blocks * block_size), dtype)
+    blocks[..., :n_samples] = signal
+    blocks = blocks.reshape((*signal.shape[:-1], n_blocks, block_size))
+    spec = fft.rfft(blocks, n_fft, None, 'none')
+    spec = spec * fft.rfft(b.astype(dtype), n_fft, None, 'none')[
+        ..., np.newaxis, :]
+    blocks = fft.irfft(spec, n_fft, None, 'none')
+
+    # overlap-add the blocks. Signals with multiple blocks are at least
+    # twice as long as the filter and the blocks only overlap their neighbors
+    if n_blocks == 1:
+        filtered = blocks[..., 0, :]
+    else:
+        filtered = np.zeros((*shape, n_blocks + 1, block_size), dtype)
+        filtered[..., :-1, :] = blocks[..., :block_size]
+        filtered[..., 1:, :n_taps - 1] += blocks[..., block_size:]
+        filtered = filtered.reshape((*shape, -1))
+    if zi is None:
+        return filtered[..., :n_samples]
+
+    filtered[..., :n_taps - 1] += zi
+    return filtered[..., :n_samples], filtered[
+        ..., n_samples:n_samples + n_taps - 1]
+
+
 def filtfilt(coefficients, signal, **kwargs):
     kwargs = pop_state_from_kwargs(kwargs)
     return spsignal.filtfilt(
@@ -52,6 +99,9 @@ class Filter(object):
     This is an abstract class method, only used for the shared processing
     method used for the application of a filter on a signal.
     """
+    # axis of the channels of the signal in the state of a filter channel
+    _STATE_CHANNEL_AXIS = 0
+
     def __init__(
             self,
             coefficients=None,
@@ -104,7 +154,40 @@ class Filter(object):
 
         self._comment = comment
 
-    def initialize(self):
+    def initialize(self, cshape=1, state='zeros'):
+        """Initialize the filter state for signals of a given channel shape.
+
+        Parameters
+        ----------
+        cshape : int, tuple
+            The channel shape of the signals that will be filtered. The
+            default is 1.
+        state : 'zeros', 'step'
+            'zeros' initializes the filter at rest. 'step' initializes the
+            filter with the steady state of its step response, i.e., as if a
+            signal of constant amplitude one had been filtered forever. Scale
+            the state by the first sample of the signal to avoid transients at
+            the beginning of signals with a large offset. The default is
+            'zeros'.
+        """
+        if state not in ['zeros', 'step']:
+            raise ValueError("state must be 'zeros' or 'step'")
+        cshape = tuple(np.atleast_1d(cshape))
+
+        # steady state of each filter channel with the channel shape of the
+        # signal inserted before the last dimension
+        zi = np.array([self._steady_state(coeff)
+                       for coeff in self._coefficients])
+        shape = (*zi.shape[:-1], *cshape, zi.shape[-1])
+        if state == 'zeros':
+            self._state = np.zeros(shape)
+        else:
+            zi = zi.reshape(
+                (*zi.shape[:-1], *(1, ) * len(cshape), zi.shape[-1]))
+            self._state = np.broadcast_to(zi, shape).copy()
+        self._initialized = True
+
+    def _steady_state(self, coefficients):
         raise NotImplementedError("Abstract class method")
 
     @property
@@ -132,7 +215,9 @@ class Filter(object):
     def state(self):
         """
         The current state of the filter as an array with dimensions
-        corresponding to the order of the filter and number of filter channels.
+        corresponding to the number of filter channels, the cshape of the
+        filtered signal and the order of the filter. For FilterSOS, the
+        number of sections is the second dimension.
         """
         return self._state
 
@@ -170,31 +255,97 @@ class Filter(object):
         if reset is True:
             self.reset()
 
-        if self.size > 1:
-            filtered_signal_data = np.broadcast_to(
-                signal.time,
-                (self.shape[0], *signal.time.shape))
-            filtered_signal_data = filtered_signal_data.copy()
-        else:
-            filtered_signal_data = signal.time.copy()
+        if self._state is not None and self._state.shape[
+                -1 - len(signal.cshape):-1] != tuple(signal.cshape):
+            raise ValueError(
+                "The filter state does not match the shape of the signal. "
+                "Initialize the filter with the cshape of the signal.")
 
-        if self.state is not None:
-            for idx, (coeff, state) in enumerate(
-                    zip(self._coefficients, self._state)):
-                filtered_signal_data[idx, ...], new_state = self.filter_func(
-                    coeff, filtered_signal_data[idx, ...], state)
+        time = signal.time
+        if self.filter_func is fftfilt:
+            filtered_signal_data = self._process_broadcast(time)
         else:
-            for idx, coeff in enumerate(self._coefficients):
-                filtered_signal_data[idx, ...] = self.filter_func(
-                    coeff, filtered_signal_data[idx, ...], zi=None)
+            filtered_signal_data = self._process_grouped(time)
+        if self.size == 1:
+            filtered_signal_data = filtered_signal_data[0]
 
-        filtered_signal = copy.deepcopy(signal)
-        if (signal.time.ndim == 2) and (signal.cshape[0] == 1):
+        # Shallow copy, the data of the signal is replaced
+        filtered_signal = copy.copy(signal)
+        if (time.ndim == 2) and (signal.cshape[0] == 1):
             filtered_signal_data = np.squeeze(filtered_signal_data)
         filtered_signal.time = filtered_signal_data
 
         return filtered_signal
 
+    def _process_broadcast(self, time):
+        """Apply all filter channels at once by broadcasting the coefficients
+        against the channels of the signal."""
+        coefficients = self._coefficients.reshape(
+            (-1, *(1, ) * (time.ndim - 1), *self._coefficients.shape[-2:]))
+        if self._state is None:
+            return self.filter_func(coefficients, time, zi=None)
+
+        filtered, self._state = self.filter_func(
+            coefficients, time, self._state)
+        return filtered
+
+    def _process_grouped(self, time):
+        """Apply all filter channels with identical coefficients at once.
+
+        The filter functions take a single set of coefficients and filter all
+        channels of the signal in compiled code. Filter channels with
+        different coefficients thus require a call each.
+        """
+        coefficients, groups = np.unique(
+            self._coefficients, axis=0, return_inverse=True)
+        filtered = np.empty(
+            (self._coefficients.shape[0], *time.shape), dtype=time.dtype)
+        if self._state is not None:
+            new_state = np.empty_like(self._state)
+
+        for idx, coeff in enumerate(coefficients):
+            channels = np.flatnonzero(groups == idx)
+            if self._state is None:
+                # the result is identical for all channels in the group
+                filtered[channels] = self.filter_func(coeff, time, zi=None)
+                continue
+
+            # stack the signal for the filter channels, which can have
+            # different states
+            data = np.broadcast_to(time, (channels.size, *time.shape))
+            zi = np.moveaxis(
+                self._state[channels], 0, self._STATE_CHANNEL_AXIS)
+            filtered[channels], zf = self.filter_func(coeff, data, zi)
+            new_state[channels] = np.moveaxis(
+                zf, self._STATE_CHANNEL_AXIS, 0)
+
+        if self._state is not None:
+            self._state = new_state
+        return filtered
+
+    def process_block(self, signal_block):
+        """Apply the filter to a block of a signal in a stream of blocks.
+
+        The filter state is kept between the blocks, so that filtering a
+        signal block by block yields the same result as filtering the entire
+        signal at once. If the filter was not initialized before, it is
+        initialized at rest with the cshape of the first block (see
+        `initialize`).
+
+        Parameters
+        ----------
+        signal_block : Signal
+            The current block of the signal.
+
+        Returns
+        -------
+        filtered : Signal
+            The filtered block.
+        """
+        if self._state is None:
+            self.initialize(signal_block.cshape)
+        return self.process(signal_block, reset=False)
+
     def reset(self):
         if self._state is not None:
             self._state = np.zeros_like(self._state)
@@ -225,7 +376,8 @@ class FilterFIR(Filter):
             self,
             coefficients,
             sampling_rate,
-            filter_func=lfilter):
+            filter_func=None,
+            state=None):
         """
         Initialize a general Filter object.
 
@@ -234,25 +386,33 @@ class FilterFIR(Filter):
         coefficients : array, double
             The filter coefficients as an array with dimensions
             (n_channels_filter, num_coefficients)
-        filter_func : default, zerophase
+        filter_func : default, fft, zerophase
             Default applies a direct form II transposed time domain filter
-            based on the standard difference equation. Zerophase uses
-            the same filter twice, first forward, then backwards resulting
-            in zero phase.
+            based on the standard difference equation. Fft applies the filter
+            by FFT based block convolution, which is faster for long filters.
+            Zerophase uses the same filter twice, first forward, then
+            backwards resulting in zero phase. If None, fft is used for
+            filters with more than 64 coefficients and default otherwise.
         state : array, optional
-            The state of the filter from a priory knowledge.
+            The state of the filter from a priory knowledge with dimensions
+            (n_filter_channels, *cshape, order), where cshape is the
+            channel shape of the filtered signal. See also `initialize`.
         """
         b = np.atleast_2d(coefficients)
         a = np.zeros_like(b)
         a[..., 0] = 1
         coeff = np.stack((b, a), axis=-2)
 
-        super().__init__(coefficients=coeff, sampling_rate=sampling_rate)
+        super().__init__(
+            coefficients=coeff, sampling_rate=sampling_rate, state=state)
 
         self._FILTER_FUNCS = {
             'default': lfilter,
+            'fft': fftfilt,
             'zerophase': filtfilt}
-        self._filter_func = filter_func
+        if filter_func is None:
+            filter_func = 'fft' if b.shape[-1] > 64 else 'default'
+        self.filter_func = filter_func
 
     @property
     def filter_func(self):
@@ -260,10 +420,13 @@ class FilterFIR(Filter):
 
     @filter_func.setter
     def filter_func(self, filter_func):
-        if type('filter_func') == str:
+        if isinstance(filter_func, str):
             filter_func = self._FILTER_FUNCS[filter_func]
         self._filter_func = filter_func
 
+    def _steady_state(self, coefficients):
+        return spsignal.lfilter_zi(coefficients[0], coefficients[1])
+
 
 class FilterIIR(Filter):
     """
@@ -274,7 +437,8 @@ class FilterIIR(Filter):
             self,
             coefficients,
             sampling_rate,
-            filter_func=lfilter):
+            filter_func=lfilter,
+            state=None):
         """IIR filter
         Initialize a general Filter object.
 
@@ -289,10 +453,13 @@ class FilterIIR(Filter):
             the same filter twice, first forward, then backwards resulting
             in zero phase.
         state : array, optional
-            The state of the filter from a priory knowledge.
+            The state of the filter from a priory knowledge with dimensions
+            (n_filter_channels, *cshape, order), where cshape is the
+            channel shape of the filtered signal. See also `initialize`.
         """
         coeff = np.atleast_2d(coefficients)
-        super().__init__(coefficients=coeff, sampling_rate=sampling_rate)
+        super().__init__(
+            coefficients=coeff, sampling_rate=sampling_rate, state=state)
 
         self._FILTER_FUNCS = {
             'default': lfilter,
@@ -305,20 +472,27 @@ class FilterIIR(Filter):
 
     @filter_func.setter
     def filter_func(self, filter_func):
-        if type('filter_func') == str:
+        if isinstance(filter_func, str):
             filter_func = self._FILTER_FUNCS[filter_func]
         self._filter_func = filter_func
 
+    def _steady_state(self, coefficients):
+        return spsignal.lfilter_zi(coefficients[0], coefficients[1])
+
 
 class FilterSOS(Filter):
     """
     Filter object for IIR filters as second order sections.
     """
+    # the state of a filter channel has the shape (n_sections, *cshape, 2)
+    _STATE_CHANNEL_AXIS = 1
+
     def __init__(
             self,
             coefficients,
             sampling_rate,
-            filter_func=sosfilt):
+            filter_func=sosfilt,
+            state=None):
         """
         Initialize a general Filter object.
 
@@ -333,7 +507,9 @@ class FilterSOS(Filter):
             the same filter twice, first forward, then backwards resulting
             in zero phase.
         state : array, optional
-            The state of the filter from a priory knowledge.
+            The state of the filter from a priory knowledge with dimensions
+            (n_filter_chan, n_sections, *cshape, 2), where cshape is the
+            channel shape of the filtered signal. See also `initialize`.
 
         """
         coeff = np.atleast_2d(coefficients)
@@ -342,7 +518,7 @@ class FilterSOS(Filter):
                 "The coefficients are not in line with a second order",
                 "section filter structure.")
         super().__init__(
-            coefficients=coeff, sampling_rate=sampling_rate)
+            coefficients=coeff, sampling_rate=sampling_rate, state=state)
 
         self._FILTER_FUNCS = {
             'default': sosfilt,
@@ -353,3 +529,6 @@ class FilterSOS(Filter):
     @property
     def filter_func(self):
         return self._filter_func
+
+    def _steady_state(self, coefficients):
+        return spsignal.sosfilt_zi(coefficients)
@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 from scipy import signal as sgn
 from pyfar import Signal
@@ -63,20 +65,36 @@ def group_delay(signal, frequencies=None):
     if not isinstance(signal, Signal):
         raise TypeError('Input data has to be of type: Signal.')
 
-    frequencies = signal.frequencies if frequencies is None \
-        else np.asarray(frequencies)
-
-    # get time signal and reshape for easy looping
     time = signal.time
-    time = time.reshape((-1, signal.n_samples))
-    # initialize group delay
-    group_delay = np.zeros((np.prod(signal.cshape), frequencies.size))
-    # calculate the group delay
-    for cc in range(time.shape[0]):
-        group_delay[cc] = sgn.group_delay(
-            (time[cc], 1), frequencies, fs=signal.sampling_rate)[1]
-    # reshape to match signal
-    group_delay = group_delay.reshape(signal.cshape + (-1, ))
+    n = np.arange(signal.n_samples)
+
+    if frequencies is None:
+        # spectra of the signal and the time weighted signal at all bins
+        spec = fft.rfft(time, signal.n_samples, signal.sampling_rate, 'none')
+        spec_n = fft.rfft(
+            n * time, signal.n_samples, signal.sampling_rate, 'none')
+    else:
+        # evaluate the spectra at the given frequencies in blocks of
+        # frequencies to limit the memory of the DFT matrix
+        frequencies = np.asarray(frequencies)
+        omega = 2 * np.pi * frequencies.flatten() / signal.sampling_rate
+        spec = np.empty(signal.cshape + omega.shape, dtype=complex)
+        spec_n = np.empty_like(spec)
+        block_size = max(1, 2**20 // signal.n_samples)
+        for idx in range(0, omega.size, block_size):
+            dft = np.exp(-1j * np.outer(n, omega[idx:idx + block_size]))
+            spec[..., idx:idx + block_size] = time @ dft
+            spec_n[..., idx:idx + block_size] = (n * time) @ dft
+
+    # the group delay is the real part of the ratio of the spectra
+    singular = np.abs(spec) < 10 * np.finfo(float).eps
+    if np.any(singular):
+        warnings.warn(
+            "The group delay is singular at some frequencies and set to 0.")
+    group_delay = np.real(np.divide(
+        spec_n, spec, out=np.zeros_like(spec), where=~singular))
+    if frequencies is not None:
+        group_delay = group_delay.reshape(signal.cshape + frequencies.shape)
 
     # flatten in numpy fashion if a single channel is returned
     if signal.cshape == (1, ):
@@ -121,8 +139,145 @@ def nextpow2(x):
     return np.ceil(np.log2(x))
 
 
+def pad_zeros(signal, pad_width=None, mode='after'):
+    """Pad a signal with zeros in the time domain.
+
+    Parameters
+    ----------
+    signal : Signal
+        pyfar Signal object.
+    pad_width : int, None
+        Number of zeros to be padded. The default is None, which pads the
+        signal to the next number of samples for which the FFT can be computed
+        efficiently (see pyfar.fft.next_fast_len). This speeds up changing the
+        domain of signals with an unfavorable number of samples, e.g., prime
+        numbers.
+    mode : 'after', 'before'
+        Pad the zeros after the end or before the beginning of the signal.
+        The default is 'after'.
+
+    Returns
+    -------
+    padded_signal : Signal
+        The zero padded signal. Use `crop` with the number of samples of the
+        original signal to remove the padding after processing::
+
+            padded = pyfar.dsp.pad_zeros(signal)
+            # process the padded signal in the frequency domain
+            cropped = pyfar.dsp.crop(padded, signal.n_samples)
+    """
+
+    if not isinstance(signal, Signal):
+        raise TypeError('Input data has to be of type: Signal.')
+
+    if pad_width is None:
+        pad_width = fft.next_fast_len(signal.n_samples) - signal.n_samples
+    if pad_width < 0:
+        raise ValueError("pad_width must be positive.")
+
+    pad = [(0, 0)] * (signal.time.ndim - 1)
+    if mode == 'after':
+        pad.append((0, pad_width))
+    elif mode == 'before':
+        pad.append((pad_width, 0))
+    else:
+        raise ValueError(f"mode must be 'after' or 'before' but is '{mode}'")
+
+    padded_signal = Signal(
+        np.pad(signal.time, pad), signal.sampling_rate, domain='time',
+        fft_norm=signal.fft_norm, dtype=signal.dtype, comment=signal.comment)
+    return padded_signal
+
+
+def crop(signal, n_samples, mode='after'):
+    """Crop a signal in the time domain, e.g., to remove zero padding added
+    by `pad_zeros`.
+
+    Parameters
+    ----------
+    signal : Signal
+        pyfar Signal object.
+    n_samples : int
+        The number of samples of the cropped signal.
+    mode : 'after', 'before'
+        Remove the samples after the first `n_samples` samples or before the
+        last `n_samples` samples of the signal. Use the `mode` that was passed
+        to `pad_zeros`. The default is 'after'.
+
+    Returns
+    -------
+    cropped_signal : Signal
+        The cropped signal.
+    """
+
+    if not isinstance(signal, Signal):
+        raise TypeError('Input data has to be of type: Signal.')
+    if not 0 < n_samples <= signal.n_samples:
+        raise ValueError(
+            f"n_samples must be between 1 and {signal.n_samples}.")
+
+    if mode == 'after':
+        time = signal.time[..., :n_samples]
+    elif mode == 'before':
+        time = signal.time[..., signal.n_samples - n_samples:]
+    else:
+        raise ValueError(f"mode must be 'after' or 'before' but is '{mode}'")
+
+    return Signal(time.copy(), signal.sampling_rate, domain='time',
+                  fft_norm=signal.fft_norm, dtype=signal.dtype,
+                  comment=signal.comment)
+
+
+def convolve(signal_1, signal_2, mode='full'):
+    """Linear convolution of two signals in the frequency domain.
+
+    The signals are zero padded to the next number of samples for which the
+    FFT can be computed efficiently (see `pad_zeros`) and the result is
+    cropped afterwards.
+
+    Parameters
+    ----------
+    signal_1 : Signal
+        The first signal.
+    signal_2 : Signal
+        The second signal. The cshapes of the signals must be broadcastable.
+    mode : 'full', 'cut'
+        'full' returns the complete convolution with
+        ``signal_1.n_samples + signal_2.n_samples - 1`` samples. 'cut'
+        returns the first ``signal_1.n_samples`` samples, as when filtering
+        `signal_1` with the impulse response `signal_2`. The default is
+        'full'.
+
+    Returns
+    -------
+    signal : Signal
+        The convolved signal with the `fft_norm` and `comment` of
+        `signal_1`.
+    """
+
+    if not isinstance(signal_1, Signal) or not isinstance(signal_2, Signal):
+        raise TypeError('Input data has to be of type: Signal.')
+    if signal_1.sampling_rate != signal_2.sampling_rate:
+        raise ValueError("The sampling rates of the signals do not match.")
+    if mode not in ['full', 'cut']:
+        raise ValueError(f"mode must be 'full' or 'cut' but is '{mode}'")
+
+    n_samples = signal_1.n_samples + signal_2.n_samples - 1
+    padded = pad_zeros(signal_1, n_samples - signal_1.n_samples)
+    padded = pad_zeros(padded)
+
+    spec = fft.rfft(padded.time, padded.n_samples, None, 'none') * \
+        fft.rfft(signal_2.time, padded.n_samples, None, 'none')
+    padded.time = fft.irfft(spec, padded.n_samples, None, 'none')
+
+    if mode == 'cut':
+        n_samples = signal_1.n_samples
+    return crop(padded, n_samples)
+
+
 def spectrogram(signal, dB=True, log_prefix=20, log_reference=1,
-                window='hann', window_length=1024, window_overlap_fct=0.5):
+                window='hann', window_length=1024, window_overlap_fct=0.5,
+                n_fft=None):
     """Compute the magnitude spectrum versus time.
 
     This is a wrapper for scipy.signal.spectogram with two differences. First,
@@ -134,7 +289,7 @@ def spectrogram(signal, dB=True, log_prefix=20, log_reference=1,
     Parameters
     ----------
     signal : Signal
-        pyfar Signal object.
+        pyfar Signal object of arbitrary cshape.
     db : Boolean
         Falg to plot the logarithmic magnitude specturm. The default is True.
     log_prefix : integer, float
@@ -149,6 +304,12 @@ def spectrogram(signal, dB=True, log_prefix=20, log_reference=1,
     window_overlap_fct : double
         Ratio of points to overlap between fft segments [0...1]. The default is
         0.5
+    n_fft : integer
+        Number of samples of the FFT of each segment. Segments are zero padded
+        if `n_fft` is larger than `window_length`. Use
+        ``n_fft=pyfar.fft.next_fast_len(window_length)`` to speed up the
+        computation for window lengths with large prime factors. The default
+        is None, which uses `window_length`.
 
     Returns
     -------
@@ -157,6 +318,12 @@ def spectrogram(signal, dB=True, log_prefix=20, log_reference=1,
     times : numpy array
         Times in seconds at which the magnitude spectrum was computed
     spectrogram : numpy array
+        The magnitude spectrum with dimensions (*cshape, n_bins, n_times).
+        The channel dimension is removed for signals of cshape (1, ).
+
+    See also
+    --------
+    iter_spectrogram : spectrogram of signals given in blocks.
     """
 
     # check input
@@ -166,24 +333,410 @@ def spectrogram(signal, dB=True, log_prefix=20, log_reference=1,
     if window_length > signal.n_samples:
         raise ValueError("window_length exceeds signal length")
 
-    # get spectrogram from scipy.signal
+    window, window_overlap, n_fft = _spectrogram_parameters(
+        window, window_length, window_overlap_fct, n_fft)
+
+    frequencies, spectrogram = _spectrogram(
+        signal, signal.time, window, window_overlap, n_fft)
+
+    # we take the beginning of the DFT blocks as time stamp instead of the
+    # center as scipy.signal does (looks nicer in plots, both conventions are
+    # used)
+    times = np.arange(spectrogram.shape[-1]) * \
+        (window_length - window_overlap) / signal.sampling_rate
+
+    return frequencies, times, spectrogram
+
+
+def iter_spectrogram(blocks, window='hann', window_length=1024,
+                     window_overlap_fct=0.5, n_fft=None):
+    """Compute the magnitude spectrum versus time of a signal given in blocks.
+
+    The spectrogram of each FFT segment is computed as soon as all its
+    samples were passed, which limits the memory to the size of the blocks and
+    FFT segments. Use this to compute spectrograms of long signals that are
+    read incrementally, e.g., from a file. Concatenating the spectrograms that
+    are yielded along the last axis gives the same result as `spectrogram`.
+
+    Parameters
+    ----------
+    blocks : iterable of Signal
+        Consecutive blocks of the signal of arbitrary but constant cshape and
+        arbitrary number of samples.
+    window : str
+        Specifies the window (See scipy.signal.get_window). The default is
+        'hann'.
+    window_length : integer
+        Specifies the window length in samples. The default ist 1024.
+    window_overlap_fct : double
+        Ratio of points to overlap between fft segments [0...1]. The default is
+        0.5
+    n_fft : integer
+        Number of samples of the FFT of each segment. The default is None,
+        which uses `window_length`. See `spectrogram`.
+
+    Yields
+    ------
+    frequencies : numpy array
+        Frequencies in Hz at which the magnitude spectrum was computed
+    times : numpy array
+        Times in seconds relative to the start of the first block at which
+        the magnitude spectrum of the current FFT segments was computed
+    spectrogram : numpy array
+        The magnitude spectrum of the FFT segments that were completed by the
+        current block with dimensions (*cshape, n_bins, n_times). Blocks
+        that complete no segment are skipped.
+    """
+    window, window_overlap, n_fft = _spectrogram_parameters(
+        window, window_length, window_overlap_fct, n_fft)
+    hop = window_length - window_overlap
+
+    # samples that were not yet used by all their FFT segments
+    buffer = None
+    n_times = 0
+    for block in blocks:
+        if not isinstance(block, Signal):
+            raise TypeError('Input data has to be of type: Signal.')
+        buffer = block.time if buffer is None else \
+            np.concatenate((buffer, block.time), axis=-1)
+        if buffer.shape[-1] < window_length:
+            continue
+
+        n_segments = (buffer.shape[-1] - window_length) // hop + 1
+        frequencies, spectrogram = _spectrogram(
+            block, buffer[..., :(n_segments - 1) * hop + window_length],
+            window, window_overlap, n_fft)
+        times = (n_times + np.arange(n_segments)) * hop / block.sampling_rate
+
+        buffer = buffer[..., n_segments * hop:]
+        n_times += n_segments
+
+        yield frequencies, times, spectrogram
+
+
+def _spectrogram_parameters(window, window_length, window_overlap_fct,
+                            n_fft):
+    """Check the parameters and get the window samples for spectrograms."""
+    if n_fft is None:
+        n_fft = window_length
+    elif n_fft < window_length:
+        raise ValueError("n_fft must not be smaller than window_length")
+
     window_overlap = int(window_length * window_overlap_fct)
     window = sgn.get_window(window, window_length)
 
-    frequencies, times, spectrogram = sgn.spectrogram(
-            x=signal.time.squeeze(), fs=signal.sampling_rate, window=window,
-            noverlap=window_overlap, mode='magnitude', scaling='spectrum')
+    return window, window_overlap, n_fft
+
+
+def _spectrogram(signal, time, window, window_overlap, n_fft):
+    """Normalized magnitude spectrogram of the time data of a signal."""
+    # get spectrogram of all channels from scipy.signal
+    frequencies, _, spectrogram = sgn.spectrogram(
+            x=time, fs=signal.sampling_rate, window=window,
+            noverlap=window_overlap, nfft=n_fft, mode='magnitude',
+            scaling='spectrum', axis=-1)
 
     # remove normalization from scipy.signal.spectrogram
     spectrogram /= np.sqrt(1 / window.sum()**2)
 
-    # apply normalization from signal
-    spectrogram = fft.normalization(
-        spectrogram, window_length, signal.sampling_rate,
-        signal.fft_norm, window=window)
+    # apply normalization from signal along the frequency axis
+    spectrum = np.swapaxes(spectrogram, -1, -2)
+    fft.normalization(
+        spectrum, n_fft, signal.sampling_rate, signal.fft_norm,
+        window=np.pad(window, (0, n_fft - window.size)), out=spectrum)
+
+    # remove channel dimension for single channel signals
+    if signal.cshape == (1, ):
+        spectrogram = spectrogram[0]
 
-    # scipy.signal takes the center of the DFT blocks as time stamp we take the
-    # beginning (looks nicer in plots, both conventions are used)
-    times -= times[0]
+    return frequencies, spectrogram
 
-    return frequencies, times, spectrogram
+
+def stft(signal, window='hann', window_length=1024, window_overlap_fct=0.5,
+         n_fft=None):
+    """Compute the complex short-time Fourier transform (STFT).
+
+    The signal is zero padded at the beginning and end to obtain a perfect
+    reconstruction of all samples with `istft`. The spectra are normalized
+    according to `signal.fft_norm` (see `pyfar.fft.normalization`).
+
+    Parameters
+    ----------
+    signal : Signal
+        pyfar Signal object of arbitrary cshape.
+    window : str
+        Specifies the window (See scipy.signal.get_window). The default is
+        'hann'.
+    window_length : integer
+        Specifies the window length in samples. The default ist 1024.
+    window_overlap_fct : double
+        Ratio of points to overlap between fft segments [0...1]. The default is
+        0.5
+    n_fft : integer
+        Number of samples of the FFT of each segment. The default is None,
+        which uses `window_length`. See `spectrogram`.
+
+    Returns
+    -------
+    frequencies : numpy array
+        Frequencies in Hz of the STFT
+    times : numpy array
+        Start times of the FFT segments in seconds. The first segments start
+        before the signal due to the zero padding.
+    stft : numpy array
+        The complex STFT with dimensions (*cshape, n_bins, n_times).
+
+    See also
+    --------
+    istft, iter_stft
+    """
+    if not isinstance(signal, Signal):
+        raise TypeError('Input data has to be of type: Signal.')
+
+    window, window_overlap, n_fft = _spectrogram_parameters(
+        window, window_length, window_overlap_fct, n_fft)
+    hop = window_length - window_overlap
+    padding = window_length - hop
+
+    # zero pad to cover the first and last samples with all their segments
+    n_segments = -(-(signal.n_samples + padding) // hop)
+    time = np.zeros(
+        signal.cshape + ((n_segments - 1) * hop + window_length,),
+        dtype=fft._real_dtype(signal.dtype))
+    time[..., padding:padding + signal.n_samples] = signal.time
+
+    spec = _stft_segments(time, window, hop, n_fft, signal)
+    times = (np.arange(n_segments) * hop - padding) / signal.sampling_rate
+
+    return fft.rfftfreq(n_fft, signal.sampling_rate), times, spec
+
+
+def istft(stft, sampling_rate, window='hann', window_length=1024,
+          window_overlap_fct=0.5, n_fft=None, fft_norm='none',
+          n_samples=None):
+    """Compute the inverse short-time Fourier transform (STFT).
+
+    The time signal is obtained by overlap-add of the inverse FFTs of all
+    segments. This requires windows that satisfy the constant overlap-add
+    (COLA) constraint (see scipy.signal.check_COLA), e.g., the default Hann
+    window with an overlap of 0.5.
+
+    Parameters
+    ----------
+    stft : numpy array
+        The complex STFT with dimensions (*cshape, n_bins, n_times) as
+        returned by `stft`.
+    sampling_rate : number
+        The sampling rate in Hz.
+    window, window_length, window_overlap_fct, n_fft
+        The parameters that were used to compute the STFT. See `stft`.
+    fft_norm : str
+        The normalization of the STFT (see `pyfar.fft.normalization`). The
+        default is 'none'.
+    n_samples : int
+        The number of samples of the time signal. The default is None, which
+        returns all samples including the zero padding at the end.
+
+    Returns
+    -------
+    signal : Signal
+        The time signal.
+    """
+    window, window_overlap, n_fft = _spectrogram_parameters(
+        window, window_length, window_overlap_fct, n_fft)
+    _check_cola(window, window_overlap)
+    hop = window_length - window_overlap
+
+    stft = np.asarray(stft)
+    time = _overlap_add(_istft_segments(
+        stft, window, n_fft, sampling_rate, fft_norm), hop)
+    time = time[..., window_length - hop:] * float(hop / window.sum())
+    if n_samples is not None:
+        time = time[..., :n_samples]
+
+    return Signal(time, sampling_rate, fft_norm=fft_norm,
+                  dtype=fft._real_dtype(stft.dtype))
+
+
+def iter_stft(blocks, window='hann', window_length=1024,
+              window_overlap_fct=0.5, n_fft=None):
+    """Compute the complex STFT of a signal given in blocks.
+
+    Concatenating the STFTs that are yielded along the last axis gives the
+    same result as `stft`. See `iter_spectrogram` for details.
+
+    Parameters
+    ----------
+    blocks : iterable of Signal
+        Consecutive blocks of the signal of arbitrary but constant cshape and
+        arbitrary number of samples.
+    window, window_length, window_overlap_fct, n_fft
+        See `stft`.
+
+    Yields
+    ------
+    frequencies : numpy array
+        Frequencies in Hz of the STFT
+    times : numpy array
+        Start times of the current FFT segments in seconds
+    stft : numpy array
+        The complex STFT of the FFT segments that were completed by the
+        current block with dimensions (*cshape, n_bins, n_times). The
+        segments containing the end of the signal are yielded after the last
+        block.
+    """
+    window, window_overlap, n_fft = _spectrogram_parameters(
+        window, window_length, window_overlap_fct, n_fft)
+    hop = window_length - window_overlap
+    padding = window_length - hop
+
+    buffer = None
+    n_times = 0
+    for block in blocks:
+        if not isinstance(block, Signal):
+            raise TypeError('Input data has to be of type: Signal.')
+        if buffer is None:
+            # zero padding at the beginning
+            signal = block
+            buffer = np.zeros(block.cshape + (padding, ),
+                              dtype=fft._real_dtype(block.dtype))
+        buffer = np.concatenate((buffer, block.time), axis=-1)
+        if buffer.shape[-1] < window_length:
+            continue
+
+        n_segments = (buffer.shape[-1] - window_length) // hop + 1
+        yield _iter_stft_segments(
+            buffer, n_segments, n_times, window, hop, n_fft, signal)
+        buffer = buffer[..., n_segments * hop:]
+        n_times += n_segments
+
+    if buffer is None:
+        return
+
+    # zero padding at the end
+    n_segments = -(-(buffer.shape[-1]) // hop)
+    buffer = np.concatenate((buffer, np.zeros(signal.cshape + (
+        (n_segments - 1) * hop + window_length - buffer.shape[-1], ),
+        dtype=buffer.dtype)), axis=-1)
+    yield _iter_stft_segments(
+        buffer, n_segments, n_times, window, hop, n_fft, signal)
+
+
+def iter_istft(stfts, sampling_rate, window='hann', window_length=1024,
+               window_overlap_fct=0.5, n_fft=None, fft_norm='none'):
+    """Compute the inverse STFT of consecutive STFT segments.
+
+    This can be used to process signals in the STFT domain in blocks, e.g.,
+    ``iter_istft(process(s) for _, _, s in iter_stft(blocks), 44100)``.
+    Concatenating the yielded signals gives the same result as `istft`.
+
+    Parameters
+    ----------
+    stfts : iterable of numpy arrays
+        Consecutive STFT segments with dimensions (*cshape, n_bins, n_times)
+        as yielded by `iter_stft`.
+    sampling_rate, window, window_length, window_overlap_fct, n_fft, fft_norm
+        See `istft`.
+
+    Yields
+    ------
+    signal : Signal
+        The samples that were completed by the current STFT segments. The
+        samples of the last segments are yielded after the last STFT.
+    """
+    window, window_overlap, n_fft = _spectrogram_parameters(
+        window, window_length, window_overlap_fct, n_fft)
+    _check_cola(window, window_overlap)
+    hop = window_length - window_overlap
+    scale = float(hop / window.sum())
+
+    # samples of the zero padding at the beginning that are not returned
+    padding = window_length - hop
+    overlap = None
+    for spec in stfts:
+        spec = np.asarray(spec)
+        if spec.shape[-1] == 0:
+            continue
+        time = _overlap_add(_istft_segments(
+            spec, window, n_fft, sampling_rate, fft_norm), hop)
+        if overlap is not None:
+            time[..., :overlap.shape[-1]] += overlap
+
+        # samples that are not overlapped by following segments
+        n_complete = spec.shape[-1] * hop
+        overlap = time[..., n_complete:]
+        time = time[..., padding:n_complete] * scale
+        padding = max(0, padding - n_complete)
+        if time.shape[-1]:
+            yield Signal(time, sampling_rate, fft_norm=fft_norm,
+                         dtype=time.dtype)
+
+    if overlap is not None:
+        yield Signal(overlap[..., padding:] * scale, sampling_rate,
+                     fft_norm=fft_norm, dtype=overlap.dtype)
+
+
+def _check_cola(window, window_overlap):
+    if not sgn.check_COLA(window, window.size, window_overlap):
+        raise ValueError(
+            "The window and overlap do not satisfy the constant overlap-add "
+            "(COLA) constraint.")
+
+
+def _iter_stft_segments(time, n_segments, n_times, window, hop, n_fft,
+                        signal):
+    """STFT of the first segments of time data and their frequencies and
+    start times."""
+    spec = _stft_segments(
+        time[..., :(n_segments - 1) * hop + window.size], window, hop, n_fft,
+        signal)
+    times = ((n_times + np.arange(n_segments)) * hop - window.size + hop) \
+        / signal.sampling_rate
+    return fft.rfftfreq(n_fft, signal.sampling_rate), times, spec
+
+
+def _stft_segments(time, window, hop, n_fft, signal):
+    """Normalized STFT of all segments of the time data, which must contain
+    an integer number of segments."""
+    n_segments = (time.shape[-1] - window.size) // hop + 1
+    time = np.ascontiguousarray(time)
+    segments = np.lib.stride_tricks.as_strided(
+        time, time.shape[:-1] + (n_segments, window.size),
+        time.strides[:-1] + (hop * time.strides[-1], time.strides[-1]),
+        writeable=False)
+
+    spec = fft.rfft(segments * window.astype(time.dtype), n_fft,
+                    signal.sampling_rate, 'none')
+    spec = fft.normalization(
+        spec, n_fft, signal.sampling_rate, signal.fft_norm,
+        window=np.pad(window, (0, n_fft - window.size)), out=spec)
+
+    return np.swapaxes(spec, -1, -2)
+
+
+def _istft_segments(stft, window, n_fft, sampling_rate, fft_norm):
+    """Inverse FFT of all STFT segments with dimensions
+    (*cshape, n_times, n_fft)."""
+    spec = fft.normalization(
+        np.swapaxes(stft, -1, -2), n_fft, sampling_rate, fft_norm,
+        inverse=True, window=np.pad(window, (0, n_fft - window.size)))
+    return fft.irfft(spec, n_fft, sampling_rate, 'none')
+
+
+def _overlap_add(segments, hop):
+    """Overlap-add segments with dimensions (..., n_segments, n_fft)."""
+    n_segments, n_fft = segments.shape[-2:]
+    # split the segments into parts of length hop that are added
+    n_parts = -(-n_fft // hop)
+    parts = np.zeros(segments.shape[:-1] + (n_parts * hop, ),
+                     dtype=segments.dtype)
+    parts[..., :n_fft] = segments
+    parts = parts.reshape(segments.shape[:-1] + (n_parts, hop))
+
+    time = np.zeros(segments.shape[:-2] + (n_segments + n_parts - 1, hop),
+                    dtype=segments.dtype)
+    for idx in range(n_parts):
+        time[..., idx:idx + n_segments, :] += parts[..., idx, :]
+    time = time.reshape(segments.shape[:-2] + (-1, ))
+
+    return time[..., :(n_segments - 1) * hop + n_fft]
@@ -0,0 +1,208 @@
+import copy
+
+import numpy as np
+
+from pyfar import Signal
+import pyfar.fft as fft
+
+
+class PartitionedConvolution(object):
+    """
+    Real-time convolution of a signal stream with an impulse response.
+
+    The impulse response is split into partitions that are convolved with
+    the signal in the frequency domain using the overlap-save method and a
+    frequency-domain delay line. The latency equals the block size and does
+    not depend on the length of the impulse response.
+    """
+    def __init__(self, impulse_response, block_size, partitions=None):
+        """
+        Initialize a PartitionedConvolution object.
+
+        Parameters
+        ----------
+        impulse_response : Signal
+            The impulse response of arbitrary cshape. The cshape of the
+            processed signal must be broadcastable to the cshape of the
+            impulse response.
+        block_size : int
+            The number of samples of the blocks that are processed.
+        partitions : array like, optional
+            The sizes of the consecutive partitions of the impulse response
+            in samples. Each size must be a multiple of `block_size` and a
+            partition of size P must start at least P - `block_size` samples
+            after the beginning of the impulse response, e.g.,
+            ``[B, B, 2*B, 2*B, 4*B, 4*B]`` for a block size B. Large
+            partitions reduce the average cost but are processed at once
+            every P / `block_size` blocks. The default is None, which uses
+            partitions of size `block_size` resulting in constant cost per
+            block.
+        """
+        if not isinstance(impulse_response, Signal):
+            raise ValueError(
+                "The impulse response needs to be a pyfar.Signal object.")
+        block_size = int(block_size)
+        if block_size < 1:
+            raise ValueError("The block size must be a positive integer.")
+
+        ir = impulse_response.time
+        n_samples = ir.shape[-1]
+        if partitions is None:
+            partitions = [block_size] * int(np.ceil(n_samples / block_size))
+        partitions = np.asarray(partitions, dtype=int)
+
+        offsets = np.concatenate(([0], np.cumsum(partitions)[:-1]))
+        if np.any(partitions < block_size) or \
+                np.any(partitions % block_size):
+            raise ValueError(
+                "The partition sizes must be multiples of the block size.")
+        if np.any(offsets < partitions - block_size):
+            raise ValueError(
+                "Partitions of size P must start at least P - block_size "
+                "samples after the beginning of the impulse response.")
+        if np.sum(partitions) < n_samples:
+            raise ValueError(
+                "The partitions are shorter than the impulse response.")
+
+        # consecutive partitions of the same size are processed in one stage
+        stages = np.flatnonzero(np.diff(partitions, prepend=0))
+        ends = np.append(stages[1:], partitions.size)
+        self._stages = [
+            _UniformStage(ir, partitions[start], offsets[start], end - start)
+            for start, end in zip(stages, ends)]
+
+        self._block_size = block_size
+        self._partitions = partitions
+        self._sampling_rate = impulse_response.sampling_rate
+        self._ir_cshape = impulse_response.cshape
+        self._cshape = None
+
+    @property
+    def block_size(self):
+        """The number of samples of the processed blocks."""
+        return self._block_size
+
+    @property
+    def partitions(self):
+        """The sizes of the partitions of the impulse response in samples."""
+        return self._partitions
+
+    @property
+    def sampling_rate(self):
+        """Sampling rate of the impulse response in Hz."""
+        return self._sampling_rate
+
+    def process_block(self, signal_block):
+        """Convolve the next block of a signal stream.
+
+        The first block sets the cshape of the stream. Call `reset` to
+        process a new stream.
+
+        Parameters
+        ----------
+        signal_block : Signal
+            The current block of the signal with `block_size` samples.
+
+        Returns
+        -------
+        convolved : Signal
+            The convolved block with `block_size` samples and the cshape
+            resulting from broadcasting the cshapes of the signal and the
+            impulse response.
+        """
+        if not isinstance(signal_block, Signal):
+            raise ValueError("The input needs to be a pyfar.Signal object.")
+        if self.sampling_rate != signal_block.sampling_rate:
+            raise ValueError(
+                "The sampling rates of impulse response and signal do not "
+                "match")
+        if signal_block.n_samples != self.block_size:
+            raise ValueError(
+                f"The signal block must have {self.block_size} samples.")
+
+        data = signal_block.time
+        if self._cshape is None:
+            self._initialize(signal_block.cshape)
+        elif signal_block.cshape != self._cshape:
+            raise ValueError(
+                "The cshape of the signal changed. Reset the convolution "
+                "to process a new signal.")
+
+        # add the output of all stages to the output buffer
+        for stage in self._stages:
+            stage.process(data, self._output, self.block_size)
+
+        # return the current block and advance the output buffer
+        convolved = copy.copy(signal_block)
+        convolved.time = self._output[..., :self.block_size].copy()
+        self._output[..., :-self.block_size] = \
+            self._output[..., self.block_size:]
+        self._output[..., -self.block_size:] = 0
+
+        return convolved
+
+    def reset(self):
+        """Clear the state to process a new signal stream."""
+        self._cshape = None
+        self._output = None
+
+    def _initialize(self, cshape):
+        self._cshape = cshape
+        cshape = np.broadcast(
+            np.empty(cshape + (0, )), np.empty(self._ir_cshape + (0, ))
+            ).shape[:-1]
+        length = max(stage.offset + self.block_size for stage in self._stages)
+        self._output = np.zeros(cshape + (length, ))
+        for stage in self._stages:
+            stage.reset(self._cshape)
+
+
+class _UniformStage(object):
+    """
+    Uniformly partitioned overlap-save convolution with a segment of the
+    impulse response.
+    """
+    def __init__(self, ir, partition_size, offset, n_partitions):
+        self.partition_size = partition_size
+        self.offset = offset
+        # the overlap-save method requires at least 2 * partition_size - 1
+        # samples, which are rounded up to a fast FFT length
+        self.n_fft = fft.next_fast_len(2 * partition_size)
+        # spectra of the partitions with dimensions
+        # (n_partitions, *cshape, n_bins)
+        segment = ir[..., offset:offset + n_partitions * partition_size]
+        segment = np.pad(segment, [(0, 0)] * (ir.ndim - 1) + [
+            (0, n_partitions * partition_size - segment.shape[-1])])
+        segment = np.moveaxis(segment.reshape(
+            ir.shape[:-1] + (n_partitions, partition_size)), -2, 0)
+        self.spectra = fft.rfft(segment, self.n_fft, None, 'none')
+
+    def reset(self, cshape):
+        self.input = np.zeros(cshape + (self.n_fft, ))
+        self.delay_line = np.zeros(
+            (self.spectra.shape[0], ) + cshape
+            + (self.n_fft // 2 + 1, ), dtype=complex)
+        self.position = 0
+
+    def process(self, data, output, block_size):
+        size = self.partition_size
+        start = self.n_fft - size + self.position
+        self.input[..., start:start + block_size] = data
+        self.position += block_size
+        if self.position < size:
+            return
+
+        # shift the frequency-domain delay line and add the current input
+        self.delay_line[1:] = self.delay_line[:-1]
+        self.delay_line[0] = fft.rfft(self.input, self.n_fft, None, 'none')
+        spec = np.einsum('i...,i...->...', self.delay_line, self.spectra)
+        # the last partition_size samples are free of time aliasing
+        result = fft.irfft(spec, self.n_fft, None, 'none')[..., -size:]
+
+        # the result starts size - block_size samples before the current
+        # block, which is compensated by the offset of the partitions
+        start = self.offset + block_size - size
+        output[..., start:start + size] += result
+
+        self.input[..., :-size] = self.input[..., size:]
+        self.position = 0
@@ -88,19 +88,316 @@ References
 
 """
 import multiprocessing
+import os
 import warnings
+from contextlib import contextmanager
+from functools import lru_cache
 
 import numpy as np
+import scipy.fft
 
 try:
     import pyfftw
+    import pyfftw.interfaces.cache
     pyfftw.config.NUM_THREADS = multiprocessing.cpu_count()
+    pyfftw.interfaces.cache.enable()
     from pyfftw.interfaces import numpy_fft as fft_lib
 except ImportError:
+    pyfftw = None
     warnings.warn(
-        "Using numpy FFT implementation.\
+        "Using scipy FFT implementation.\
         Install pyfftw for improved performance.")
-    from numpy import fft as fft_lib
+    fft_lib = None
+
+
+_PLANNER_EFFORTS = [
+    'FFTW_ESTIMATE', 'FFTW_MEASURE', 'FFTW_PATIENT', 'FFTW_EXHAUSTIVE']
+
+# options that are shared by all backends
+_options = {'threads': multiprocessing.cpu_count()}
+
+
+class _ScipyFFT(object):
+    """
+    FFT backend using scipy.fft with the number of workers set by the
+    `threads` option.
+    """
+    __name__ = 'scipy.fft'
+
+    def rfft(self, a, n=None, axis=-1):
+        return scipy.fft.rfft(a, n=n, axis=axis, workers=_options['threads'])
+
+    def irfft(self, a, n=None, axis=-1):
+        return scipy.fft.irfft(
+            a, n=n, axis=axis, workers=_options['threads'])
+
+    def rfftfreq(self, n, d=1.0):
+        return scipy.fft.rfftfreq(n, d=d)
+
+
+# registered FFT backends
+_backends = {'numpy': np.fft, 'scipy': _ScipyFFT()}
+if pyfftw is not None:
+    _backends['pyfftw'] = fft_lib
+else:
+    fft_lib = _backends['scipy']
+
+
+def register_backend(name, backend):
+    """
+    Register an FFT backend.
+
+    Parameters
+    ----------
+    name : str
+        Name of the backend that is used to select it with `set_backend`.
+        Existing backends with the same name are replaced.
+    backend : module, object
+        The backend must provide the functions `rfft(a, n, axis)`,
+        `irfft(a, n, axis)`, and `rfftfreq(n, d)` with the same signature
+        and behavior as in `numpy.fft`.
+    """
+    for function in ['rfft', 'irfft', 'rfftfreq']:
+        if not callable(getattr(backend, function, None)):
+            raise ValueError(f"The backend must provide '{function}'.")
+    _backends[name] = backend
+
+
+def set_backend(name):
+    """
+    Set the backend used for computing FFTs.
+
+    Parameters
+    ----------
+    name : str
+        Name of a backend returned by `get_backends`. 'numpy' uses numpy.fft,
+        'scipy' uses scipy.fft with the number of threads set by
+        `set_options`, and 'pyfftw' uses the numpy interface of pyfftw. The
+        default after importing pyfar is 'pyfftw' if pyfftw is installed and
+        'scipy' otherwise.
+    """
+    global fft_lib
+    if name not in _backends:
+        raise ValueError((
+            f"backend must be {', '.join(_backends)} but is '{name}'"))
+    fft_lib = _backends[name]
+
+
+def get_backend():
+    """
+    Get the name of the backend used for computing FFTs.
+
+    Returns
+    -------
+    name : str, None
+        Name of the current backend, or None if the backend was set without
+        registering it.
+    """
+    for name, backend in _backends.items():
+        if backend is fft_lib:
+            return name
+    return None
+
+
+def get_backends():
+    """
+    Get the names of all registered FFT backends.
+
+    Returns
+    -------
+    names : list of str
+        Names that can be passed to `set_backend`.
+    """
+    return list(_backends)
+
+
+@contextmanager
+def use_backend(name):
+    """
+    Context manager for temporarily using an FFT backend.
+
+    Parameters
+    ----------
+    name : str
+        Name of the backend. See `set_backend`.
+
+    Examples
+    --------
+    >>> from pyfar import fft
+    >>> with fft.use_backend('scipy'):
+    ...     spec = fft.rfft([1, 0, 0, 0], 4, 44100, 'none')
+    """
+    global fft_lib
+    previous = fft_lib
+    set_backend(name)
+    try:
+        yield
+    finally:
+        fft_lib = previous
+
+
+def set_options(threads=None, planner_effort=None, cache=None):
+    """
+    Set the options of the FFT computation.
+
+    Parameters not passed to the function or passed as None are not changed.
+
+    Parameters
+    ----------
+    threads : int, optional
+        Number of threads used for computing the FFT with the 'scipy' and
+        'pyfftw' backends. The default after importing pyfar is the number of
+        CPUs.
+    planner_effort : str, optional
+        Effort that FFTW spends on finding the fastest algorithm for a given
+        transform size: 'FFTW_ESTIMATE', 'FFTW_MEASURE', 'FFTW_PATIENT', or
+        'FFTW_EXHAUSTIVE'. Higher efforts make the first transform of each
+        size slower and all following transforms faster. The plans can be
+        kept across sessions with `save_wisdom` and `load_wisdom`. The
+        default after importing pyfar is 'FFTW_ESTIMATE'. Requires pyfftw.
+    cache : bool, optional
+        Keep the FFTW objects of recently used transforms to avoid planning
+        them again. The default after importing pyfar is True. Requires
+        pyfftw.
+    """
+    if planner_effort is not None or cache is not None:
+        _assert_pyfftw()
+
+    if threads is not None:
+        if not isinstance(threads, (int, np.integer)) or threads < 1:
+            raise ValueError("threads must be a positive integer.")
+        _options['threads'] = int(threads)
+        if pyfftw is not None:
+            pyfftw.config.NUM_THREADS = int(threads)
+
+    if planner_effort is not None:
+        if planner_effort not in _PLANNER_EFFORTS:
+            raise ValueError((
+                f"planner_effort must be {', '.join(_PLANNER_EFFORTS)} but "
+                f"is '{planner_effort}'"))
+        pyfftw.config.PLANNER_EFFORT = planner_effort
+
+    if cache is not None:
+        if cache:
+            pyfftw.interfaces.cache.enable()
+        else:
+            pyfftw.interfaces.cache.disable()
+
+
+def get_options():
+    """
+    Get the options of the FFT computation.
+
+    Returns
+    -------
+    options : dict
+        The current `threads`, `planner_effort`, and `cache`. See
+        `set_options` for more information. `planner_effort` and `cache` are
+        None if pyfftw is not installed.
+    """
+    if pyfftw is None:
+        return {'threads': _options['threads'],
+                'planner_effort': None,
+                'cache': None}
+
+    return {'threads': _options['threads'],
+            'planner_effort': pyfftw.config.PLANNER_EFFORT,
+            'cache': pyfftw.interfaces.cache.is_enabled()}
+
+
+def save_wisdom(filename=None):
+    """
+    Save the FFTW wisdom, i.e., the plans of all transforms computed so far.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Name of the file to which the wisdom is written. The default is None,
+        which uses 'fftw_wisdom.npz' in the pyfar folder of the user cache
+        directory (`$XDG_CACHE_HOME` or `~/.cache`). The wisdom is stored as
+        a numpy archive of byte arrays and not pickled.
+    """
+    _assert_pyfftw()
+
+    filename = _wisdom_file() if filename is None else filename
+    folder = os.path.dirname(filename)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    # the wisdom of each precision is a byte string
+    wisdom = {f'wisdom_{idx}': np.frombuffer(data, dtype=np.uint8)
+              for idx, data in enumerate(pyfftw.export_wisdom())}
+    with open(filename, 'wb') as file:
+        np.savez(file, **wisdom)
+
+
+def load_wisdom(filename=None):
+    """
+    Load FFTW wisdom saved with `save_wisdom`.
+
+    Transforms of sizes contained in the wisdom are not planned again, which
+    makes their first computation faster.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Name of the file from which the wisdom is read. The default is None,
+        which uses the default of `save_wisdom`.
+
+    Returns
+    -------
+    loaded : bool
+        False if the file does not exist and True otherwise.
+    """
+    _assert_pyfftw()
+
+    filename = _wisdom_file() if filename is None else filename
+    if not os.path.isfile(filename):
+        return False
+
+    with np.load(filename, allow_pickle=False) as archive:
+        wisdom = tuple(archive[f'wisdom_{idx}'].tobytes()
+                       for idx in range(len(archive.files)))
+    pyfftw.import_wisdom(wisdom)
+
+    return True
+
+
+def _wisdom_file():
+    """Default file for saving and loading the FFTW wisdom."""
+    cache_dir = os.environ.get(
+        'XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache_dir, 'pyfar', 'fftw_wisdom.npz')
+
+
+def _assert_pyfftw():
+    """Raise an ImportError if pyfftw is not installed."""
+    if pyfftw is None:
+        raise ImportError("This requires pyfftw. Install pyfftw to use it.")
+
+
+def next_fast_len(n_samples):
+    """
+    Returns the smallest number of samples that is larger or equal to
+    `n_samples` and for which the FFT of a real valued time-signal can be
+    computed efficiently.
+
+    This is a wrapper for scipy.fft.next_fast_len. The returned lengths only
+    contain the prime factors 2, 3, and 5, and are thus efficient for all FFT
+    backends. Signals can be padded to this length by
+    `pyfar.dsp.pad_zeros`.
+
+    Parameters
+    ----------
+    n_samples : int
+        The minimum number of samples
+
+    Returns
+    -------
+    n_fast : int
+        The efficient number of samples
+    """
+    return scipy.fft.next_fast_len(int(n_samples), real=True)
 
 
 def rfftfreq(n_samples, sampling_rate):
@@ -153,15 +450,18 @@ def rfft(data, n_samples, sampling_rate, fft_norm):
     -------
     spec : array, complex
         The complex valued right-hand side of the spectrum with dimensions
-        (..., n_bins)
+        (..., n_bins). The spectrum is of type complex64 if `data` is of type
+        float32 and of type complex128 otherwise.
 
     """
 
     # DFT
     spec = fft_lib.rfft(data, n=n_samples, axis=-1)
+    # keep single precision (numpy.fft always returns double precision)
+    spec = spec.astype(_complex_dtype(np.asarray(data).dtype), copy=False)
     # Normalization
     spec = normalization(spec, n_samples, sampling_rate, fft_norm,
-                         inverse=False, single_sided=True)
+                         inverse=False, single_sided=True, out=spec)
 
     return spec
 
@@ -195,7 +495,8 @@ def irfft(spec, n_samples, sampling_rate, fft_norm):
     -------
     data : array, double
         Array containing the time domain signal with dimensions
-        (..., n_samples)
+        (..., n_samples). The data is of type float32 if `spec` is of type
+        complex64 and of type float64 otherwise.
     """
 
     # Inverse normalization
@@ -203,12 +504,14 @@ def irfft(spec, n_samples, sampling_rate, fft_norm):
                          inverse=True, single_sided=True)
     # Inverse DFT
     data = fft_lib.irfft(spec, n=n_samples, axis=-1)
+    # keep single precision (numpy.fft always returns double precision)
+    data = data.astype(_real_dtype(spec.dtype), copy=False)
 
     return data
 
 
 def normalization(spec, n_samples, sampling_rate, fft_norm='none',
-                  inverse=False, single_sided=True, window=None):
+                  inverse=False, single_sided=True, window=None, out=None):
     """
     Normalize spectrum of power signal.
 
@@ -248,12 +551,24 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
         window must be an array like with `n_samples` and affects the
         normalization as in _[2] Eqs. (11-13). The default is None, which
         denotes that no window was applied.
+    out : None, numpy array
+        array of the same shape as `spec` in which the normalized spectrum is
+        stored. Pass `out=spec` to normalize `spec` in place. The default is
+        None, which returns a new array and leaves `spec` unchanged.
 
     Returns
     -------
     spec : numpy array
         normalized version of the input spectrum
 
+    Notes
+    -----
+    The combined normalization factors of each frequency bin are cached for
+    the most recently used combinations of `n_samples`, `sampling_rate`,
+    `fft_norm`, `inverse`, `single_sided`, and the sum of `window`. Repeated
+    normalizations with the same parameters thus only require a single
+    multiplication.
+
     References
     ----------
     .. [2] J. Ahrens, C. Andersson, P. Höstmad, and W. Kropp, “Tutorial on
@@ -264,6 +579,9 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
 
     # check if normalization should be applied
     if fft_norm == 'none':
+        if out is not None and out is not spec:
+            out[...] = spec
+            return out
         return spec
 
     # check input
@@ -274,55 +592,81 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
             raise ValueError((f"window must be {n_samples} long "
                               f"but is {len(window)} long."))
 
-    n_bins = spec.shape[-1]
+    # get the combined normalization of all frequency bins. Only the sum of the
+    # window affects the normalization. The sampling rate only affects the
+    # 'psd' normalization and is ignored otherwise to reuse cached values.
+    norm = _normalization_factors(
+        spec.shape[-1], int(n_samples),
+        np.asarray(sampling_rate).item() if fft_norm == 'psd' else None,
+        fft_norm, bool(inverse), bool(single_sided),
+        None if window is None else float(np.sum(window)),
+        np.dtype(_real_dtype(spec.dtype)))
+
+    if fft_norm in ["power", "psd"] and not inverse:
+        # the phase is kept for being able to switch between normalizations
+        # altoug the power spectrum does usually not have phase information,
+        # i.e., spec = np.abs(spec)**2
+        magnitude = np.abs(spec)
+        out = np.multiply(spec, norm, out=out)
+        out *= magnitude
+    else:
+        out = np.multiply(spec, norm, out=out)
+
+    # reverse the squaring in case of 'power' and 'psd' normalization
+    if inverse and fft_norm in ["power", "psd"]:
+        out /= np.sqrt(np.abs(out))
+
+    return out
+
+
+@lru_cache(maxsize=32)
+def _normalization_factors(n_bins, n_samples, sampling_rate, fft_norm,
+                           inverse, single_sided, window_sum, dtype):
+    """
+    Combined normalization factors of all frequency bins as read-only array.
+
+    See `normalization` for a description of the parameters. `window_sum` is
+    the sum of the window or None, if no window was applied. The results of
+    this function are cached.
+    """
     norm = np.ones(n_bins)
 
     # account for type of normalization
     if fft_norm == "amplitude":
-        if window is None:
+        if window_sum is None:
             # Equation 4 in Ahrens et al. 2020
             norm /= n_samples
         else:
             # Equation 11 in Ahrens et al. 2020
-            norm /= np.sum(window)
+            norm /= window_sum
     elif fft_norm == 'rms':
         if not single_sided:
             raise ValueError(
                 "'rms' normalization does only exist for single-sided spectra")
-        if window is None:
+        if window_sum is None:
             # Equation 10 in Ahrens et al. 2020
             norm /= n_samples
         else:
             # Equation 11 in Ahrens et al. 2020
-            norm /= np.sum(window)
+            norm /= window_sum
         if _is_odd(n_samples):
             norm[1:] /= np.sqrt(2)
         else:
             norm[1:-1] /= np.sqrt(2)
     elif fft_norm == 'power':
-        if window is None:
+        if window_sum is None:
             # Equation 5 in Ahrens et al. 2020
             norm /= n_samples**2
         else:
             # Equation 12 in Ahrens et al. 2020
-            norm /= np.sum(window)**2
-        # the phase is kept for being able to switch between normalizations
-        # altoug the power spectrum does usually not have phase information,
-        # i.e., spec = np.abs(spec)**2
-        if not inverse:
-            spec *= np.abs(spec)
+            norm /= window_sum**2
     elif fft_norm == 'psd':
-        if window is None:
+        if window_sum is None:
             # Equation 6 in Ahrens et al. 2020
             norm /= (n_samples * sampling_rate)
         else:
             # Equation 13 in Ahrens et al. 2020
-            norm /= (np.sum(window)**2 * sampling_rate)
-        # the phase is kept for being able to switch between normalizations
-        # altoug the power spectrum does usually not have phase information,
-        # i.e., spec = np.abs(spec)**2
-        if not inverse:
-            spec *= np.abs(spec)
+            norm /= (window_sum**2 * sampling_rate)
     elif fft_norm != 'unitary':
         raise ValueError(("norm type must be 'unitary', 'amplitude', 'rms', "
                           f"'power', or 'psd' but is '{fft_norm}'"))
@@ -331,24 +675,53 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
     if inverse:
         norm = 1 / norm
 
-    # apply normalization
-    spec = spec * norm
-
     # scaling for single sided spectrum, i.e., to account for the lost
     # energy in the discarded half of the spectrum. Only the bins at 0 Hz
     # and Nyquist remain as they are (Equation 8 in Ahrens et al. 2020).
     if single_sided:
         scale = 2 if not inverse else 1 / 2
         if _is_odd(n_samples):
-            spec[..., 1:] *= scale
+            norm[1:] *= scale
         else:
-            spec[..., 1:-1] *= scale
+            norm[1:-1] *= scale
 
-    # reverse the squaring in case of 'power' and 'psd' normalization
-    if inverse and fft_norm in ["power", "psd"]:
-        spec /= np.sqrt(np.abs(spec))
+    norm = norm.astype(dtype)
+    norm.flags.writeable = False
+    return norm
 
-    return spec
+
+def _is_single_precision(dtype):
+    """
+    Check if a data type is float32 or complex64.
+
+    Parameters
+    ----------
+    dtype : data-type
+        Numpy data type to check
+
+    Returns
+    -------
+    condition : bool
+        True if single precision and False otherwise
+
+    """
+    return np.dtype(dtype) in (np.float32, np.complex64)
+
+
+def _real_dtype(dtype):
+    """
+    Real valued data type matching the precision of `dtype`, i.e., float32
+    for single precision types and float64 otherwise.
+    """
+    return np.float32 if _is_single_precision(dtype) else np.float64
+
+
+def _complex_dtype(dtype):
+    """
+    Complex valued data type matching the precision of `dtype`, i.e.,
+    complex64 for single precision types and complex128 otherwise.
+    """
+    return np.complex64 if _is_single_precision(dtype) else np.complex128
 
 
 def _is_odd(num):
@@ -1,23 +1,48 @@
-import scipy.io.wavfile as wavfile
 import os.path
+import json
+import struct
 import warnings
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import sofa
 
 from pyfar import Signal
 from pyfar import Coordinates
+from pyfar.dsp import FilterFIR, FilterIIR, FilterSOS
 
 
-def read_wav(filename):
+def read_wav(filename, dtype=None, mmap=False, normalize=False):
     """
     Import a WAV file as signal object.
 
-    This method is based on scipy.io.wavfile.read().
-
     Parameters
     ----------
     filename : string or open file handle
         Input wav file.
+    dtype : string, optional
+        Data type of the returned signal. Pass float32 to process the data in
+        single precision. The default is None, which uses float64 or the
+        data type of the WAV file if `mmap` is True.
+    mmap : bool, optional
+        Keep the audio data on disk as a memory-mapped array. Only the
+        channels that are accessed by indexing or iterating the signal are
+        copied into memory. The data is not converted and `dtype` must thus be
+        None or match the data type of the WAV file. Memory mapping is not
+        supported for 24-bit files. The default is False.
+
+        Note that the samples of all channels are interleaved in WAV files.
+        Reading a single channel of a multichannel file thus reads the pages
+        of all channels from disk, and memory mapping mainly saves memory
+        but does not speed up reading single channels. Use `iter_wav` to
+        read long files in blocks of consecutive samples.
+    normalize : bool, optional
+        Scale integer PCM data to the range -1 to 1 as in the table of
+        `write_wav`. The data is scaled and converted to `dtype` in one pass,
+        i.e., reading a 24-bit file with ``dtype='float32'`` does not create
+        an intermediate float64 copy. `dtype` must be a floating point type
+        and `mmap` must be False. Floating point data is not scaled. The
+        default is False, which returns the integer values.
 
     Returns
     -------
@@ -27,15 +52,40 @@ def read_wav(filename):
 
     Notes
     -----
-    * This function is based on scipy.io.wavfile.write().
-    * This function cannot read wav files with 24-bit data.
+    Supported are uncompressed WAV files with 8, 16, 24, and 32-bit PCM or 32
+    and 64-bit floating point data.
     """
-    sampling_rate, data = wavfile.read(filename)
-    signal = Signal(data.T, sampling_rate, domain='time')
+    if mmap and normalize:
+        raise ValueError("normalize must be False if mmap is True.")
+    if not mmap:
+        dtype = _check_wav_dtype(dtype, normalize)
+
+    fid = filename if hasattr(filename, 'read') else open(filename, 'rb')
+    try:
+        sampling_rate, n_channels, wav_dtype, n_frames = \
+            _read_wav_header(fid)
+        if mmap:
+            if wav_dtype == 'int24':
+                raise ValueError(
+                    "24-bit WAV files can not be memory-mapped.")
+            if dtype is not None and np.dtype(dtype) != wav_dtype:
+                raise ValueError(
+                    f"dtype must be None or {wav_dtype} if mmap is True.")
+            dtype = wav_dtype
+            data = np.memmap(
+                fid, wav_dtype, 'r', fid.tell(), (n_frames, n_channels)).T
+        else:
+            data = _read_wav_frames(fid, n_frames, n_channels, wav_dtype)
+            data = _convert_wav_data(data, wav_dtype, dtype, normalize)
+    finally:
+        if fid is not filename:
+            fid.close()
+
+    signal = Signal(data, sampling_rate, domain='time', dtype=dtype)
     return signal
 
 
-def write_wav(signal, filename, overwrite=True):
+def write_wav(signal, filename, overwrite=True, dtype=None, normalize=False):
     """
     Write a signal as a WAV file.
 
@@ -44,16 +94,26 @@ def write_wav(signal, filename, overwrite=True):
     signal : Signal object
         An audio signal object from the pyfar Signal class.
 
-    filename : string or open file handle
+    filename : string
         Output wav file.
 
     overwrite : bool
         Select wether to overwrite the WAV file, if it already exists.
         The default is True.
 
+    dtype : string, optional
+        Data type of the WAV file, which determines the bits-per-sample and
+        PCM/float format according to the table below. Pass ``'int24'`` to
+        write 24-bit PCM data. The default is None, which uses the data type
+        of the signal.
+
+    normalize : bool, optional
+        Scale the data from the range -1 to 1 to the range of the integer PCM
+        format given by `dtype`. Values outside the range are clipped. The
+        default is False, which writes the values without scaling.
+
     Notes
     -----
-    * This function is based on scipy.io.wavfile.write().
     * Writes a simple uncompressed WAV file.
     * Signals of shape larger than 1D are flattened.
     * The bits-per-sample and PCM/float will be determined by the data-type.
@@ -65,6 +125,7 @@ def write_wav(signal, filename, overwrite=True):
     =====================  ===========  ===========  =============
     32-bit floating-point  -1.0         +1.0         float32
     32-bit PCM             -2147483648  +2147483647  int32
+    24-bit PCM             -8388608     +8388607     'int24'
     16-bit PCM             -32768       +32767       int16
     8-bit PCM              0            255          uint8
     =====================  ===========  ===========  =============
@@ -79,28 +140,392 @@ def write_wav(signal, filename, overwrite=True):
        http://www.tactilemedia.com/info/MCI_Control_Info.html
 
     """
-    sampling_rate = signal.sampling_rate
-    data = signal.time
-
     # Reshape to 2D
-    data = data.reshape(-1, data.shape[-1])
-    warnings.warn("Signal flattened to {data.shape[0]} channels.")
+    n_channels = int(np.prod(signal.time.shape[:-1]))
+    warnings.warn(f"Signal flattened to {n_channels} channels.")
 
-    # Check for .wav file extension
-    if filename.split('.')[-1] != 'wav':
-        warnings.warn("Extending filename by .wav.")
-        filename += '.wav'
+    with WavWriter(filename, dtype, overwrite, normalize) as writer:
+        writer.write(signal)
 
-    # Check if file exists and for overwrite
-    if overwrite is False and os.path.isfile(filename):
-        raise FileExistsError(
-                "File already exists,"
-                "use overwrite option to disable error.")
+
+def iter_wav(filename, block_size, overlap=0, dtype=None, normalize=False):
+    """
+    Read a WAV file block by block.
+
+    Only the current block is kept in memory and the next block is read in
+    the background while the current block is processed. This can be used to
+    process long WAV files with bounded memory.
+
+    Parameters
+    ----------
+    filename : string
+        Input wav file.
+    block_size : int
+        Number of samples per block. The last block is shorter if the number
+        of samples in the file is not a multiple of the hop size
+        `block_size - overlap`.
+    overlap : int, optional
+        Number of samples by which consecutive blocks overlap. The default
+        is 0.
+    dtype : string, optional
+        Data type of the returned signals. The default is None, which uses
+        float64. See `read_wav`.
+    normalize : bool, optional
+        Scale integer PCM data to the range -1 to 1. See `read_wav`. The
+        default is False.
+
+    Yields
+    ------
+    block : Signal
+        The current block of the audio data.
+
+    Notes
+    -----
+    Supported are uncompressed WAV files with 8, 16, 24, and 32-bit PCM or 32
+    and 64-bit floating point data.
+    """
+    block_size = int(block_size)
+    overlap = int(overlap)
+    if block_size < 1:
+        raise ValueError("block_size must be a positive integer.")
+    if overlap < 0 or overlap >= block_size:
+        raise ValueError(
+            "overlap must be positive and smaller than block_size.")
+    hop = block_size - overlap
+    dtype = _check_wav_dtype(dtype, normalize)
+
+    with open(filename, 'rb') as fid, ThreadPoolExecutor(1) as executor:
+        sampling_rate, n_channels, wav_dtype, n_frames = \
+            _read_wav_header(fid)
+
+        # read the first block and all following hops in the background
+        n_read = min(block_size, n_frames)
+        future = executor.submit(
+            _read_wav_frames, fid, n_read, n_channels, wav_dtype)
+        block = None
+        while future is not None:
+            data = future.result()
+            n_next = min(hop, n_frames - n_read)
+            if n_next > 0:
+                future = executor.submit(
+                    _read_wav_frames, fid, n_next, n_channels, wav_dtype)
+                n_read += n_next
+            else:
+                future = None
+            data = _convert_wav_data(data, wav_dtype, dtype, normalize)
+
+            if block is not None and overlap:
+                data = np.concatenate(
+                    (block.time[..., -overlap:], data), axis=-1)
+            block = Signal(data, sampling_rate, domain='time', dtype=dtype)
+            yield block
+
+
+class WavWriter(object):
+    """
+    Write a WAV file block by block.
+
+    The file is written as the blocks are passed and the header is completed
+    when the writer is closed. Until then, the header contains the maximum
+    data size and files that were not closed, e.g., due to a crash, can be
+    read up to the last written block. Use the writer as a context manager to
+    close it automatically::
+
+        with pyfar.io.WavWriter('filtered.wav') as writer:
+            for block in pyfar.io.iter_wav('recording.wav', 48000):
+                writer.write(filt.process_block(block))
+    """
+    def __init__(self, filename, dtype=None, overwrite=True, normalize=False):
+        """
+        Open a WAV file for writing.
+
+        Parameters
+        ----------
+        filename : string
+            Output wav file.
+        dtype : string, optional
+            Data type of the WAV file, which determines the bits-per-sample
+            and PCM/float format as in `write_wav`. The default is None,
+            which uses the data type of the first block.
+        overwrite : bool
+            Select wether to overwrite the WAV file, if it already exists.
+            The default is True.
+        normalize : bool, optional
+            Scale the data from the range -1 to 1 to the range of integer
+            PCM formats as in `write_wav`. The default is False.
+        """
+        # Check for .wav file extension
+        if filename.split('.')[-1] != 'wav':
+            warnings.warn("Extending filename by .wav.")
+            filename += '.wav'
+
+        # Check if file exists and for overwrite
+        if overwrite is False and os.path.isfile(filename):
+            raise FileExistsError(
+                    "File already exists,"
+                    "use overwrite option to disable error.")
+
+        self._filename = filename
+        self._fid = open(filename, 'wb')
+        self._dtype = None if dtype is None else _wav_dtype(dtype)
+        self._normalize = normalize
+        self._sampling_rate = None
+        self._n_channels = None
+        self._n_samples = 0
+
+    @property
+    def n_samples(self):
+        """Number of samples written to the file."""
+        return self._n_samples
+
+    def write(self, signal):
+        """
+        Append a signal block to the WAV file.
+
+        Parameters
+        ----------
+        signal : Signal
+            The block to be written. Signals of shape larger than 1D are
+            flattened. The sampling rate and number of channels must be the
+            same for all blocks.
+        """
+        data = signal.time
+        data = data.reshape(-1, data.shape[-1])
+
+        if self._sampling_rate is None:
+            if self._dtype is None:
+                self._dtype = _wav_dtype(data.dtype)
+            _write_wav_header(
+                self._fid, signal.sampling_rate, data.shape[0], self._dtype,
+                None)
+            self._sampling_rate = signal.sampling_rate
+            self._n_channels = data.shape[0]
+        elif signal.sampling_rate != self._sampling_rate:
+            raise ValueError(
+                "The sampling rates of the blocks do not match.")
+        elif data.shape[0] != self._n_channels:
+            raise ValueError(
+                "The number of channels of the blocks do not match.")
+
+        self._fid.write(
+            _wav_bytes(data.T, self._dtype, self._normalize))
+        self._fid.flush()
+        self._n_samples += data.shape[-1]
+
+    def close(self):
+        """Complete the header and close the WAV file. The file is removed
+        if no block was written, because the format of the file is unknown.
+        """
+        if self._fid.closed:
+            return
+        if self._sampling_rate is None:
+            self._fid.close()
+            os.remove(self._filename)
+            warnings.warn(
+                f"No data was written to {self._filename}. The file was "
+                "removed.")
+            return
+
+        # pad byte for data of odd size
+        if (self._n_samples * self._n_channels
+                * _wav_itemsize(self._dtype)) % 2:
+            self._fid.write(b'\x00')
+        self._fid.seek(0)
+        _write_wav_header(
+            self._fid, self._sampling_rate, self._n_channels, self._dtype,
+            self._n_samples)
+        self._fid.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _read_wav_header(fid):
+    """Read the header of a WAV file and move to the start of the data.
+
+    Returns the sampling rate, number of channels, data type, and number of
+    samples.
+    """
+    if fid.read(4) != b'RIFF':
+        raise ValueError("File is not a little endian RIFF WAV file.")
+    fid.read(4)
+    if fid.read(4) != b'WAVE':
+        raise ValueError("File is not a WAV file.")
+
+    wav_format = None
+    while True:
+        chunk_id = fid.read(4)
+        if len(chunk_id) < 4:
+            raise ValueError("WAV file does not contain data.")
+        size = struct.unpack('<I', fid.read(4))[0]
+        if chunk_id == b'fmt ':
+            chunk = fid.read(size)
+            format_tag, n_channels, sampling_rate, _, block_align, \
+                bit_depth = struct.unpack('<HHIIHH', chunk[:16])
+            # WAVE_FORMAT_EXTENSIBLE holds the format in the sub format
+            if format_tag == 0xFFFE and size >= 26:
+                format_tag = struct.unpack('<H', chunk[24:26])[0]
+            wav_format = (format_tag, bit_depth)
+        elif chunk_id == b'data':
+            break
+        else:
+            fid.seek(size, 1)
+        # chunks are padded to an even size
+        if size % 2:
+            fid.seek(1, 1)
+
+    if wav_format is None:
+        raise ValueError("WAV file does not contain a format chunk.")
+    if wav_format not in _WAV_DTYPES:
+        raise ValueError(
+            f"WAV files with format {wav_format[0]} and {wav_format[1]} bit "
+            "are not supported.")
+
+    # the size of the data is unknown for incompletely written files
+    position = fid.tell()
+    fid.seek(0, 2)
+    size = min(size, fid.tell() - position)
+    fid.seek(position)
+
+    return sampling_rate, n_channels, _WAV_DTYPES[wav_format], \
+        size // block_align
+
+
+def _read_wav_frames(fid, n_frames, n_channels, dtype):
+    """Read the next frames of a WAV file as array of shape
+    (n_channels, n_frames). 24-bit data is returned as int32."""
+    if dtype != 'int24':
+        data = np.empty((n_frames, n_channels), dtype=dtype)
+        fid.readinto(data)
+        return data.T
+
+    # read the three bytes of each sample into the upper bytes of int32 and
+    # shift them back to keep the sign
+    raw = np.empty((n_frames, n_channels, 3), dtype=np.uint8)
+    fid.readinto(raw)
+    data = np.empty((n_frames, n_channels), dtype='<i4')
+    data_bytes = data.view(np.uint8).reshape(n_frames, n_channels, 4)
+    data_bytes[..., 0] = 0
+    data_bytes[..., 1:] = raw
+    np.right_shift(data, 8, out=data)
+    return data.T
+
+
+def _convert_wav_data(data, wav_dtype, dtype, normalize):
+    """Convert data read from a WAV file to dtype. Integer PCM data is scaled
+    to the range -1 to 1 if normalize is True. The data is scaled and
+    converted in one pass without intermediate copies."""
+    if not normalize or data.dtype.kind == 'f':
+        return data
+    dtype = np.dtype(dtype)
+    out = np.empty(data.shape, dtype=dtype)
+    scale = dtype.type(2. ** (1 - _wav_bit_depth(wav_dtype)))
+    if data.dtype == np.uint8:
+        # 8-bit PCM is unsigned with an offset of 128
+        np.subtract(data, 128, out=out, dtype=dtype)
+        out *= scale
+    else:
+        np.multiply(data, scale, out=out, dtype=dtype)
+    return out
+
+
+def _wav_bytes(data, dtype, normalize):
+    """Convert data of shape (n_frames, n_channels) to the bytes of a WAV file
+    of type dtype."""
+    if normalize and (dtype == 'int24' or np.dtype(dtype).kind in 'iu'):
+        bit_depth = _wav_bit_depth(dtype)
+        data = np.rint(data * 2. ** (bit_depth - 1))
+        if dtype == np.uint8:
+            data += 128
+            np.clip(data, 0, 255, out=data)
+        else:
+            np.clip(data, -2 ** (bit_depth - 1), 2 ** (bit_depth - 1) - 1,
+                    out=data)
+
+    if dtype != 'int24':
+        return np.ascontiguousarray(data, dtype=dtype).tobytes()
+
+    # write the lower three bytes of each sample
+    data = np.ascontiguousarray(data, dtype='<i4')
+    return data.view(np.uint8).reshape(data.shape + (4, ))[..., :3].tobytes()
+
+
+def _wav_dtype(dtype):
+    """Return the little endian numpy data type of a WAV file or 'int24'."""
+    if isinstance(dtype, str) and dtype == 'int24':
+        return dtype
+    return np.dtype(dtype).newbyteorder('<')
+
+
+def _wav_itemsize(dtype):
+    """Number of bytes per sample of a WAV file of type dtype."""
+    return 3 if dtype == 'int24' else np.dtype(dtype).itemsize
+
+
+def _wav_bit_depth(dtype):
+    """Number of bits per sample of a WAV file of type dtype."""
+    return 8 * _wav_itemsize(dtype)
+
+
+def _check_wav_dtype(dtype, normalize):
+    """Check and return the data type of signals read from WAV files."""
+    if not normalize:
+        return np.double if dtype is None else dtype
+    dtype = np.double if dtype is None else np.dtype(dtype)
+    if np.dtype(dtype).kind != 'f':
+        raise ValueError(
+            "dtype must be a floating point type if normalize is True.")
+    return dtype
+
+
+def _write_wav_header(fid, sampling_rate, n_channels, dtype, n_frames):
+    """Write the header of a WAV file with the given number of samples. If
+    n_frames is None, the maximum size is written, which readers clip to the
+    size of the file."""
+    dtype = _wav_dtype(dtype)
+    formats = {value: key for key, value in _WAV_DTYPES.items()}
+    if dtype not in formats:
+        raise ValueError(f"Writing data of type {dtype} is not supported.")
+    format_tag, bit_depth = formats[dtype]
+
+    block_align = n_channels * _wav_itemsize(dtype)
+    if n_frames is None:
+        data_size = 0xFFFFFFFF
+        n_frames = 0xFFFFFFFF // block_align
+    else:
+        data_size = n_frames * block_align
+    fmt = struct.pack(
+        '<HHIIHH', format_tag, n_channels, int(sampling_rate),
+        int(sampling_rate) * block_align, block_align, bit_depth)
+    # floating point data requires an extended format and a fact chunk
+    if format_tag == 3:
+        fmt += struct.pack('<H', 0)
+        fmt += b'fact' + struct.pack('<II', 4, n_frames)
+        fmt_size = 18
     else:
-        wavfile.write(filename, sampling_rate, data.T)
+        fmt_size = 16
 
+    header = b'WAVE' + b'fmt ' + struct.pack('<I', fmt_size) + fmt + \
+        b'data' + struct.pack('<I', data_size)
+    fid.write(b'RIFF' + struct.pack(
+        '<I', min(len(header) + data_size + data_size % 2, 0xFFFFFFFF)))
+    fid.write(header)
 
-def read_sofa(filename):
+
+# numpy data types of WAV files with PCM (1) and floating point (3) format
+_WAV_DTYPES = {
+    (1, 8): np.dtype('u1'),
+    (1, 16): np.dtype('<i2'),
+    (1, 24): 'int24',
+    (1, 32): np.dtype('<i4'),
+    (3, 32): np.dtype('<f4'),
+    (3, 64): np.dtype('<f8')}
+
+
+def read_sofa(filename, dtype=np.double):
     """
     Import a SOFA file as signal object.
 
@@ -108,6 +533,9 @@ def read_sofa(filename):
     ----------
     filename : string or open file handle
         Input wav file.
+    dtype : string, optional
+        Data type of the returned signal. Pass float32 to process the data in
+        single precision. The default is float64.
 
     Returns
     -------
@@ -127,6 +555,7 @@ def read_sofa(filename):
     -----
     * This function is based on the python-sofa package.
     * Only SOFA files of DataType 'FIR' are supported.
+    * Use `SofaReader` to read only parts of large SOFA files.
 
     References
     ----------
@@ -135,45 +564,363 @@ def read_sofa(filename):
        File Format.”, 2015.
 
     """
-    sofafile = sofa.Database.open(filename)
-    # Check for DataType
-    if sofafile.Data.Type == 'FIR':
-        domain = 'time'
-        data = np.asarray(sofafile.Data.IR)
-        sampling_rate = sofafile.Data.SamplingRate.get_values()
-        # Check for units
-        if sofafile.Data.SamplingRate.Units != 'hertz':
-            raise ValueError(
-                "SamplingRate:Units"
-                "{sofafile.Data.SamplingRate.Units} is not supported.")
-    else:
-        raise ValueError("DataType {sofafile.Data.Type} is not supported.")
-    signal = Signal(data, sampling_rate, domain=domain)
-
-    # Source
-    s_values = sofafile.Source.Position.get_values()
-    s_domain, s_convention, s_unit = _sofa_pos(sofafile.Source.Position.Type)
-    source_coordinates = Coordinates(
-            s_values[:, 0],
-            s_values[:, 1],
-            s_values[:, 2],
-            domain=s_domain,
-            convention=s_convention,
-            unit=s_unit)
-    # Receiver
-    r_values = sofafile.Receiver.Position.get_values()
-    r_domain, r_convention, r_unit = _sofa_pos(sofafile.Receiver.Position.Type)
-    receiver_coordinates = Coordinates(
-            r_values[:, 0],
-            r_values[:, 1],
-            r_values[:, 2],
-            domain=r_domain,
-            convention=r_convention,
-            unit=r_unit)
+    with SofaReader(filename, dtype) as sofa_file:
+        signal = sofa_file.read()
+        source_coordinates = sofa_file.source_coordinates
+        receiver_coordinates = sofa_file.receiver_coordinates
 
     return signal, source_coordinates, receiver_coordinates
 
 
+class SofaReader(object):
+    """
+    Read parts of a SOFA file on demand.
+
+    Opening the file only reads its metadata. The impulse responses are read
+    when they are requested and only the requested measurements and receivers
+    are read from the file. This makes it possible to look up single
+    directions in large HRIR data sets::
+
+        with pyfar.io.SofaReader('hrirs.sofa') as hrirs:
+            # the impulse responses of the third measurement
+            hrir = hrirs[2]
+            # the impulse responses closest to the front
+            hrir, index = hrirs.get_nearest_k(1, 0, 0)
+
+    Indexing the reader with ``[measurements, receivers]`` is equivalent to
+    `read`.
+
+    Notes
+    -----
+    * This class is based on the python-sofa package.
+    * Only SOFA files of DataType 'FIR' are supported.
+    """
+    def __init__(self, filename, dtype=np.double):
+        """
+        Open a SOFA file for reading.
+
+        Parameters
+        ----------
+        filename : string
+            Input SOFA file.
+        dtype : string, optional
+            Data type of the returned signals. Pass float32 to process the
+            data in single precision. The default is float64.
+        """
+        sofafile = sofa.Database.open(filename)
+        try:
+            # Check for DataType
+            if sofafile.Data.Type != 'FIR':
+                raise ValueError(
+                    f"DataType {sofafile.Data.Type} is not supported.")
+            # Check for units
+            if sofafile.Data.SamplingRate.Units != 'hertz':
+                raise ValueError(
+                    "SamplingRate:Units "
+                    f"{sofafile.Data.SamplingRate.Units} is not supported.")
+            sampling_rate = np.unique(
+                sofafile.Data.SamplingRate.get_values())
+            if sampling_rate.size > 1:
+                raise ValueError(
+                    "SOFA files with varying sampling rates are not "
+                    "supported.")
+        except ValueError:
+            sofafile.close()
+            raise
+
+        self._sofafile = sofafile
+        self._sampling_rate = sampling_rate[0]
+        self._dtype = dtype
+        self._source_positions = None
+
+    @property
+    def sampling_rate(self):
+        """Sampling rate of the impulse responses in Hz."""
+        return self._sampling_rate
+
+    @property
+    def n_measurements(self):
+        """Number of measurements in the file."""
+        return self._sofafile.Dimensions.M
+
+    @property
+    def n_receivers(self):
+        """Number of receivers in the file."""
+        return self._sofafile.Dimensions.R
+
+    @property
+    def n_samples(self):
+        """Number of samples of the impulse responses."""
+        return self._sofafile.Dimensions.N
+
+    @property
+    def source_coordinates(self):
+        """The source coordinates with matching domain, convention and
+        unit."""
+        return _sofa_coordinates(self._sofafile.Source.Position)
+
+    @property
+    def receiver_coordinates(self):
+        """The receiver coordinates with matching domain, convention and
+        unit."""
+        return _sofa_coordinates(self._sofafile.Receiver.Position)
+
+    def read(self, measurements=slice(None), receivers=slice(None)):
+        """
+        Read the impulse responses of selected measurements and receivers.
+
+        Parameters
+        ----------
+        measurements : int, slice, array like of ints, optional
+            Indices of the measurements. The default reads all measurements.
+        receivers : int, slice, array like of ints, optional
+            Indices of the receivers. The default reads all receivers.
+
+        Returns
+        -------
+        signal : Signal
+            The impulse responses. As for numpy arrays, the cshape is
+            ``(n_measurements, n_receivers)`` for slices and integers drop
+            the corresponding dimension. Array like indices of arbitrary
+            shape replace the corresponding dimension by their shape.
+        """
+        indices = {}
+        arrays = []
+        for dim, index in zip(('M', 'R'), (measurements, receivers)):
+            if isinstance(index, slice) or np.ndim(index) == 0:
+                indices[dim] = index
+                arrays.append(None)
+            else:
+                # netCDF reads a hyperslab for each index, which are thus
+                # read only once and in increasing order
+                index = np.asarray(index, dtype=int)
+                unique, inverse = np.unique(index, return_inverse=True)
+                indices[dim] = unique.tolist()
+                arrays.append((inverse.reshape(-1), index.shape))
+
+        data = self._sofafile.Data.IR.get_values(indices=indices)
+
+        # restore the order and shape of array like indices
+        axis = 0
+        for index, array in zip(indices.values(), arrays):
+            if array is not None:
+                inverse, shape = array
+                data = np.take(data, inverse, axis=axis)
+                data = data.reshape(
+                    data.shape[:axis] + shape + data.shape[axis + 1:])
+                axis += len(shape)
+            elif isinstance(index, slice):
+                axis += 1
+
+        return Signal(
+            data, self.sampling_rate, domain='time', dtype=self._dtype)
+
+    def get_nearest_k(self, points_1, points_2, points_3, k=1,
+                      domain='cart', convention='right', unit='met'):
+        """
+        Read the impulse responses of the k measurements with the source
+        positions closest to one or more points.
+
+        Only the impulse responses of the nearest measurements are read from
+        the file. The search is done with
+        `pyfar.Coordinates.get_nearest_k`.
+
+        Parameters
+        ----------
+        points_i : array like, number
+            first, second and third coordinate of the points to which the
+            nearest neighbors are searched.
+        k : int
+            Number of measurements to return. The default is 1.
+        domain : string
+            domain of point, see `pyfar.Coordinates.systems`.
+        convention: string
+             coordinate convention of point, see `pyfar.Coordinates.systems`.
+        unit : string
+             unit of point, see `pyfar.Coordinates.systems`.
+
+        Returns
+        -------
+        signal : Signal
+            The impulse responses of the nearest measurements. The cshape is
+            ``(*index.shape, n_receivers)``.
+        index : ndarray of ints
+            The indices of the nearest measurements. If the points have
+            shape ``tuple``, then ``index`` has shape ``tuple+(k,)``. When k
+            == 1, the last dimension is squeezed.
+        """
+        if self._source_positions is None:
+            self._source_positions = _sofa_coordinates(
+                self._sofafile.Source.Position, self.n_measurements)
+        index = self._source_positions.get_nearest_k(
+            points_1, points_2, points_3, k, domain, convention, unit)[1]
+
+        return self.read(index), index
+
+    def close(self):
+        """Close the SOFA file."""
+        self._sofafile.close()
+
+    def __getitem__(self, key):
+        """Read the impulse responses of ``[measurements, receivers]``."""
+        if not isinstance(key, tuple):
+            key = (key, )
+        if len(key) > 2:
+            raise IndexError(
+                "Too many indices: the impulse responses are indexed by "
+                f"measurements and receivers but {len(key)} indices were "
+                "given.")
+        return self.read(*key)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_sofa(signal, source_coordinates, receiver_coordinates, filename,
+               overwrite=True, chunks=1, compression=4):
+    """
+    Write impulse responses as a SOFA file of the GeneralFIR convention.
+
+    Parameters
+    ----------
+    signal : Signal
+        The impulse responses of cshape ``(n_measurements, n_receivers)``.
+        Signals of cshape ``(n_measurements, )`` are written with a single
+        receiver.
+    source_coordinates : Coordinates
+        The source positions of each measurement of csize
+        ``n_measurements`` or a single position that is the same for all
+        measurements.
+    receiver_coordinates : Coordinates
+        The receiver positions of csize ``n_receivers``.
+    filename : string
+        Output SOFA file.
+    overwrite : bool
+        Select wether to overwrite the SOFA file, if it already exists.
+        The default is True.
+    chunks : int, tuple of ints, optional
+        Number of measurements that are stored in one netCDF chunk of the
+        impulse responses or the chunk shape
+        ``(measurements, receivers, samples)``. Chunks are read and
+        decompressed at once, i.e., small chunks are fast for reading single
+        measurements, e.g., with `SofaReader`. The default is 1.
+    compression : int, optional
+        Level of the zlib compression of the impulse responses between 1
+        and 9. Pass 0 to disable the compression. The default is 4.
+
+    Notes
+    -----
+    * This function is based on the python-sofa package.
+    * Positions in spherical coordinates are written in the SOFA spherical
+      system, i.e., the pyfar `top_elev` convention in degree. All other
+      positions are written in cartesian coordinates.
+    """
+    if not isinstance(signal, Signal):
+        raise ValueError("The input needs to be a pyfar.Signal object.")
+    data = signal.time
+    if data.ndim == 2:
+        data = data[:, np.newaxis]
+    elif data.ndim != 3:
+        raise ValueError(
+            "The cshape of the signal must be (n_measurements, n_receivers).")
+    n_measurements, n_receivers, n_samples = data.shape
+
+    if source_coordinates.csize not in (1, n_measurements):
+        raise ValueError(
+            "The source coordinates must contain one position or the "
+            "position of each measurement.")
+    if receiver_coordinates.csize != n_receivers:
+        raise ValueError(
+            "The receiver coordinates must contain the position of each "
+            "receiver.")
+    if isinstance(chunks, (int, np.integer)):
+        chunks = (chunks, n_receivers, n_samples)
+    if len(chunks) != 3 or min(chunks) < 1:
+        raise ValueError("chunks must be a positive integer or three "
+                         "positive integers.")
+    chunks = tuple(min(int(c), n) for c, n in zip(chunks, data.shape))
+
+    # Check for .sofa file extension
+    if filename.split('.')[-1] != 'sofa':
+        warnings.warn("Extending filename by .sofa.")
+        filename += '.sofa'
+
+    # Check if file exists and for overwrite
+    if overwrite is False and os.path.isfile(filename):
+        raise FileExistsError(
+                "File already exists,"
+                "use overwrite option to disable error.")
+
+    sofafile = sofa.Database.create(
+        filename, 'GeneralFIR', dimensions={
+            "M": n_measurements, "R": n_receivers, "N": n_samples})
+    try:
+        sofafile.Listener.initialize(fixed=["Position", "View", "Up"])
+        source_varies = source_coordinates.csize > 1
+        sofafile.Source.initialize(
+            fixed=["View", "Up"] + ([] if source_varies else ["Position"]),
+            variances=["Position"] if source_varies else [])
+        _set_sofa_position(sofafile.Source.Position, source_coordinates)
+        sofafile.Receiver.initialize(fixed=["Position", "View", "Up"])
+        _set_sofa_position(
+            sofafile.Receiver.Position, receiver_coordinates,
+            receiver=True)
+        sofafile.Emitter.initialize(
+            fixed=["Position", "View", "Up"], count=1)
+
+        # the impulse responses are created directly in the netCDF dataset,
+        # which is not possible with sofa.Data.initialize
+        sofafile.dataset.createVariable(
+            'Data.IR', data.dtype.newbyteorder('<').str[1:],
+            ('M', 'R', 'N'), fill_value=0, chunksizes=chunks,
+            zlib=compression > 0, complevel=max(compression, 1),
+            shuffle=compression > 0)
+        sofafile.Data.create_variable('Delay', ('I', 'R'))
+        sofafile.Data.create_variable('SamplingRate', ('I', ))
+        sofafile.Data.SamplingRate.Units = 'hertz'
+        sofafile.Data.SamplingRate = signal.sampling_rate
+        sofafile.Data.IR = data
+    finally:
+        sofafile.close()
+
+
+def _set_sofa_position(position, coordinates, receiver=False):
+    """Write Coordinates to a SOFA position variable."""
+    if coordinates._system['domain'] == 'sph':
+        position.Type = 'spherical'
+        position.Units = 'degree, degree, metre'
+        values = coordinates.get_sph('top_elev', 'deg')
+    else:
+        position.Type = 'cartesian'
+        position.Units = 'metre'
+        values = coordinates.get_cart()
+    values = values.reshape(-1, 3)
+    # receiver positions have the dimensions (R, C, I)
+    position.set_values(values[..., np.newaxis] if receiver else values)
+
+
+def _sofa_coordinates(position, n_measurements=None):
+    """Create Coordinates from a SOFA position variable. Positions that are
+    fixed for all measurements are repeated n_measurements times if
+    n_measurements is not None."""
+    domain, convention, unit = _sofa_pos(position.Type)
+    if n_measurements is None:
+        values = position.get_values()
+    else:
+        values = np.broadcast_to(
+            position.get_values(dim_order=('M', 'C')), (n_measurements, 3))
+    return Coordinates(
+        values[:, 0],
+        values[:, 1],
+        values[:, 2],
+        domain=domain,
+        convention=convention,
+        unit=unit)
+
+
 def _sofa_pos(pos_type):
     if pos_type == 'spherical':
         domain = 'sph'
@@ -184,5 +931,216 @@ def _sofa_pos(pos_type):
         convention = 'right'
         unit = 'met'
     else:
-        raise ValueError("Position:Type {pos_type} is not supported.")
+        raise ValueError(f"Position:Type {pos_type} is not supported.")
     return domain, convention, unit
+
+
+def write(filename, compress=False, overwrite=True, **objs):
+    """
+    Write pyfar objects to disk.
+
+    The objects are stored in a numpy npz archive that contains the data of
+    the objects as arrays and the remaining properties as JSON metadata.
+    Supported are Signal, Coordinates, FilterFIR, FilterIIR, and FilterSOS
+    objects. Use `read` to restore the objects::
+
+        pyfar.io.write('data.npz', hrirs=signal, sampling=coordinates)
+        data = pyfar.io.read('data.npz')
+        signal = data['hrirs']
+
+    Parameters
+    ----------
+    filename : string
+        Output npz file.
+    compress : bool, optional
+        Compress the data. Compressed data can not be memory-mapped by
+        `read`. The default is False.
+    overwrite : bool
+        Select wether to overwrite the file, if it already exists.
+        The default is True.
+    **objs
+        The objects to be written. The keyword is used as the name of the
+        object in the file and must not contain '/'.
+
+    Notes
+    -----
+    * The data of signals is written in the current domain without
+      conversion.
+    * Filter functions are stored by their name, e.g., 'zerophase'. Custom
+      filter functions are not stored and replaced by the default filter
+      function when reading the filter.
+    """
+    arrays = {}
+    for name, obj in objs.items():
+        if '/' in name:
+            raise ValueError(f"The name '{name}' must not contain '/'.")
+        meta, payload = _encode(obj)
+        arrays[f"{name}/meta"] = np.array(json.dumps(meta))
+        for key, value in payload.items():
+            arrays[f"{name}/{key}"] = value
+
+    # Check for .npz file extension
+    if filename.split('.')[-1] != 'npz':
+        warnings.warn("Extending filename by .npz.")
+        filename += '.npz'
+
+    # Check if file exists and for overwrite
+    if overwrite is False and os.path.isfile(filename):
+        raise FileExistsError(
+                "File already exists,"
+                "use overwrite option to disable error.")
+
+    if compress:
+        np.savez_compressed(filename, **arrays)
+    else:
+        np.savez(filename, **arrays)
+
+
+def read(filename, mmap=False):
+    """
+    Read pyfar objects written by `write`.
+
+    Parameters
+    ----------
+    filename : string
+        Input npz file.
+    mmap : bool, optional
+        Keep the data of the objects on disk as memory-mapped arrays. Signals
+        then only read the channels that are accessed by indexing or
+        iterating the signal (see `pyfar.Signal`). This requires a file that
+        was written with ``compress=False``. The default is False.
+
+    Returns
+    -------
+    objs : dict
+        The objects with their names as keys.
+    """
+    with np.load(filename, allow_pickle=False) as archive:
+        names = [key[:-5] for key in archive.files if key.endswith('/meta')]
+        objs = {}
+        for name in names:
+            meta = json.loads(str(archive[f"{name}/meta"]))
+            payload = {}
+            for key in archive.files:
+                if not key.startswith(name + '/') or key.endswith('/meta'):
+                    continue
+                if mmap:
+                    payload[key[len(name) + 1:]] = _npz_memmap(
+                        filename, archive.zip.getinfo(key + '.npy'))
+                else:
+                    payload[key[len(name) + 1:]] = archive[key]
+            objs[name] = _decode(meta, payload)
+
+    return objs
+
+
+def _encode(obj):
+    """Split a pyfar object into JSON metadata and a dict of arrays."""
+    if isinstance(obj, Signal):
+        meta = {
+            'type': 'Signal',
+            'sampling_rate': _json_number(obj.sampling_rate),
+            'n_samples': int(obj.n_samples),
+            'domain': obj.domain,
+            'fft_norm': obj.fft_norm,
+            'dtype': np.dtype(obj.dtype).str,
+            'comment': obj.comment}
+        payload = {'data': obj._data}
+    elif isinstance(obj, Coordinates):
+        meta = {
+            'type': 'Coordinates',
+            'domain': obj._system['domain'],
+            'convention': obj._system['convention'],
+            'unit': obj._system['unit'],
+            'sh_order': None if obj.sh_order is None else int(obj.sh_order),
+            'comment': obj.comment}
+        payload = {'points': obj._points}
+        if obj.weights is not None:
+            payload['weights'] = obj.weights
+    elif isinstance(obj, (FilterFIR, FilterIIR, FilterSOS)):
+        # filter functions can be set by name or function
+        filter_funcs = [key for key, func in obj._FILTER_FUNCS.items()
+                        if obj.filter_func is func or obj.filter_func == key]
+        meta = {
+            'type': type(obj).__name__,
+            'sampling_rate': _json_number(obj.sampling_rate),
+            'filter_func': filter_funcs[0] if filter_funcs else None,
+            'comment': obj.comment}
+        payload = {'coefficients': obj._coefficients}
+        if obj.state is not None:
+            payload['state'] = obj.state
+    else:
+        raise ValueError(
+            f"Writing objects of type {type(obj).__name__} is not supported.")
+    return meta, payload
+
+
+def _json_number(value):
+    """Convert numpy scalars to Python numbers of the same kind, which keeps
+    integers and floats apart in the JSON metadata."""
+    if isinstance(value, np.ndarray) and value.size == 1:
+        value = value.reshape(())[()]
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _decode(meta, payload):
+    """Create a pyfar object from JSON metadata and a dict of arrays."""
+    if meta['type'] == 'Signal':
+        return Signal(
+            payload['data'], meta['sampling_rate'], meta['n_samples'],
+            meta['domain'], meta['fft_norm'], np.dtype(meta['dtype']),
+            meta['comment'])
+    if meta['type'] == 'Coordinates':
+        points = payload['points']
+        return Coordinates(
+            points[..., 0], points[..., 1], points[..., 2], meta['domain'],
+            meta['convention'], meta['unit'], payload.get('weights'),
+            meta['sh_order'], meta['comment'])
+
+    filters = {'FilterFIR': FilterFIR, 'FilterIIR': FilterIIR,
+               'FilterSOS': FilterSOS}
+    if meta['type'] not in filters:
+        raise ValueError(f"Reading objects of type {meta['type']} is not "
+                         "supported.")
+    # filters are small and their state changes during processing, which
+    # is why memory-mapped data is copied
+    coefficients = np.array(payload['coefficients'])
+    state = None if 'state' not in payload else np.array(payload['state'])
+    if meta['type'] == 'FilterFIR':
+        # FilterFIR takes the numerator coefficients only
+        coefficients = coefficients[..., 0, :]
+    obj = filters[meta['type']](
+        coefficients, meta['sampling_rate'], state=state)
+    if meta['filter_func'] is not None:
+        obj._filter_func = obj._FILTER_FUNCS[meta['filter_func']]
+    if meta['comment'] is not None:
+        obj.comment = meta['comment']
+    return obj
+
+
+def _npz_memmap(filename, info):
+    """Memory-map an array stored in an uncompressed npz file."""
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(
+            "Compressed files can not be memory-mapped. Write the file with "
+            "compress=False.")
+    with open(filename, 'rb') as fid:
+        # skip the local header of the zip entry
+        fid.seek(info.header_offset)
+        header = fid.read(30)
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        fid.seek(info.header_offset + 30 + name_length + extra_length)
+        # read the header of the npy file
+        version = np.lib.format.read_magic(fid)
+        if version == (1, 0):
+            shape, fortran_order, dtype = \
+                np.lib.format.read_array_header_1_0(fid)
+        else:
+            shape, fortran_order, dtype = \
+                np.lib.format.read_array_header_2_0(fid)
+        offset = fid.tell()
+
+    if not np.prod(shape):
+        return np.empty(shape, dtype)
+    return np.memmap(filename, dtype, 'r', offset, shape,
+                     'F' if fortran_order else 'C')
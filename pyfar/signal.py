@@ -7,8 +7,15 @@ operators `+`, `-`, `*`, `/`, and `**` are overloaded with the corresponding
 arithmetic operations in the frequency domain. For time domain operations, the
 functions have to be called explicitly. These the function documentation for
 more details.
+
+All operands of a call are evaluated into a single output array, i.e.,
+`add((a, b, c))` does not create intermediate arrays for `a + b`. The in-place
+operators `+=`, `-=`, `*=`, `/=`, and `**=` write the result to the data of the
+Signal on the left hand side if its shape, data type, and FFT normalization
+do not change. Otherwise a new Signal is returned.
 """
 
+import copy
 import warnings
 import numpy as np
 from pyfar import fft as fft
@@ -45,7 +52,11 @@ class Signal(Audio):
         Attributes
         ----------
         data : ndarray, double
-            Raw data of the signal in the frequency or time domain
+            Raw data of the signal in the frequency or time domain. If data is
+            a numpy.memmap of type `dtype`, it is kept on disk and only the
+            channels accessed by indexing or iterating the signal are read
+            into memory. Changing the domain of the signal reads the entire
+            data.
         sampling_rate : double
             Sampling rate in Hertz
         n_samples : int, optional
@@ -60,7 +71,10 @@ class Signal(Audio):
             'none', which is typically used to energy signals, such as impulse
             responses.
         dtype : string, optional
-            Raw data type of the signal. The default is float64
+            Raw data type of the signal. The default is float64. Frequency
+            domain data is stored as complex64 if dtype is float32 and as
+            complex128 otherwise. Single precision data remains single
+            precision during Fourier Transforms and arithmetic operations.
 
         References
         ----------
@@ -83,7 +97,7 @@ class Signal(Audio):
             raise ValueError("Invalid domain. Has to be 'time' or 'freq'.")
 
         if domain == 'time':
-            self._data = np.atleast_2d(np.asarray(data, dtype=dtype))
+            self._data = np.atleast_2d(_asarray(data, dtype))
             self._n_samples = self._data.shape[-1]
         elif domain == 'freq':
             if n_samples is None:
@@ -93,7 +107,11 @@ class Signal(Audio):
                 n_bins = data.shape[-1]
                 n_samples = (n_bins - 1)*2
             self._n_samples = n_samples
-            self._data = np.atleast_2d(np.asarray(data, dtype=np.complex))
+            self._data = np.atleast_2d(
+                _asarray(data, fft._complex_dtype(dtype)))
+        # the data might also be referenced by the array passed by the user
+        self._shared = isinstance(data, np.ndarray) \
+            and np.may_share_memory(self._data, data)
 
         self._VALID_FFT_NORMS = [
             "none", "unitary", "amplitude", "rms", "power", "psd"]
@@ -108,6 +126,12 @@ class Signal(Audio):
 
         self._comment = comment
 
+        # optional cache for the data in the domain that is currently not
+        # stored in self._data (see Signal.cache)
+        self._cache = None
+        self._cache_enabled = False
+        self._cache_max_bytes = None
+
     @property
     def domain(self):
         """The domain the data is stored in"""
@@ -120,19 +144,101 @@ class Signal(Audio):
 
         if not (self._domain == new_domain):
             # Only process if we change domain
-            if new_domain == 'time':
+            if self._cache is not None:
+                # The data in the new domain is still valid from a previous
+                # transform and can be used without a Fourier Transform
+                data = self._cache
+            elif new_domain == 'time':
                 # If the new domain should be time, we had a saved spectrum
                 # and need to do an inverse Fourier Transform
-                self.time = fft.irfft(
+                data = fft.irfft(
                     self._data, self.n_samples, self._sampling_rate,
                     self._fft_norm)
             elif new_domain == 'freq':
                 # If the new domain should be freq, we had sampled time data
                 # and need to do a Fourier Transform
-                self.freq = fft.rfft(
+                data = fft.rfft(
                     self._data, self.n_samples, self._sampling_rate,
                     self._fft_norm)
 
+            # keep the data of the old domain if caching is enabled and it
+            # fits into the memory budget. Shared data is copied, because it
+            # could be changed without invalidating the cache.
+            if self._cache_enabled and (
+                    self._cache_max_bytes is None
+                    or self._data.nbytes <= self._cache_max_bytes):
+                self._cache = np.array(self._data) if self._shared \
+                    else self._data
+            else:
+                self._cache = None
+            self._data = data
+            self._shared = False
+            self._domain = new_domain
+
+    @property
+    def cache(self):
+        """Keep the data in both domains after a domain change.
+
+        If True, the time and frequency data are both kept in memory once they
+        were computed, and switching between `time` and `freq` does not
+        require a Fourier Transform. The cached data is discarded whenever the
+        signal is written through the `time` or `freq` setters, item
+        assignment, or a change of `fft_norm` or `sampling_rate`. While both
+        domains are kept, the arrays returned by `time` and `freq` are
+        read-only to avoid that they silently run out of sync. The data is
+        copied before it is cached if it is shared with other objects, i.e.,
+        a cached signal does not share its data with the array it was created
+        from or with signals obtained by indexing it. The cache is not
+        inherited by signals obtained by indexing. The default is False.
+        """
+        return self._cache_enabled
+
+    @cache.setter
+    def cache(self, value):
+        self._cache_enabled = bool(value)
+        if not self._cache_enabled:
+            self._invalidate_cache()
+
+    @property
+    def cache_max_bytes(self):
+        """Maximum size of the cached data in bytes.
+
+        Data exceeding this size is dropped instead of being cached when the
+        domain changes. The default is None, which does not limit the size of
+        the cache.
+        """
+        return self._cache_max_bytes
+
+    @cache_max_bytes.setter
+    def cache_max_bytes(self, value):
+        if value is not None and value < 0:
+            raise ValueError("cache_max_bytes must be None or positive.")
+        self._cache_max_bytes = value
+        if self._cache is not None and value is not None \
+                and self._cache.nbytes > value:
+            self._invalidate_cache()
+
+    def _invalidate_cache(self):
+        """Discard the cached data and make the current data writeable."""
+        if self._cache is not None:
+            # cached data is never shared and can be made writeable
+            self._cache = None
+            self._data.flags.writeable = True
+
+    def _make_writeable(self):
+        """Discard the cache and copy the data if it is shared with other
+        objects before it is changed in place."""
+        self._invalidate_cache()
+        if self._shared:
+            self._data = np.array(self._data)
+            self._shared = False
+
+    def _protect_cache(self):
+        """Make the data read-only while data in both domains is kept."""
+        if self._cache is not None:
+            self._data.flags.writeable = False
+            self._cache.flags.writeable = False
+
     @property
     def n_samples(self):
         """Number of samples."""
@@ -196,12 +302,15 @@ class Signal(Audio):
     def time(self):
         """The signal data in the time domain."""
         self.domain = 'time'
+        self._protect_cache()
         return self._data
 
     @time.setter
     def time(self, value):
+        self._invalidate_cache()
         data = np.atleast_2d(value)
         self._domain = 'time'
+        self._shared = self._shared or data is not self._data
         self._data = data
         self._n_samples = data.shape[-1]
 
@@ -209,10 +318,12 @@ class Signal(Audio):
     def freq(self):
         """The signal data in the frequency domain."""
         self.domain = 'freq'
+        self._protect_cache()
         return self._data
 
     @freq.setter
     def freq(self, value):
+        self._invalidate_cache()
         spec = np.atleast_2d(value)
         new_num_bins = spec.shape[-1]
         if new_num_bins == self.n_bins:
@@ -223,6 +334,7 @@ class Signal(Audio):
                           "of frequency bins.")
             n_samples = (new_num_bins - 1)*2
 
+        self._shared = self._shared or spec is not self._data
         self._data = spec
         self._n_samples = n_samples
         self._domain = 'freq'
@@ -234,6 +346,8 @@ class Signal(Audio):
 
     @sampling_rate.setter
     def sampling_rate(self, value):
+        # the normalization of the spectrum can depend on the sampling rate
+        self._invalidate_cache()
         self._sampling_rate = value
 
     @property
@@ -274,16 +388,22 @@ class Signal(Audio):
                               f"{', '.join(self._VALID_FFT_NORMS)}, but found "
                               f"'{value}'"))
 
+        # cached spectra become invalid, cached time data remains valid
+        if self._fft_norm != value and self._domain == 'time':
+            self._invalidate_cache()
+
         # apply new normalization if Signal is in frequency domain
         if self._fft_norm != value and self._domain == 'freq':
             # de-normalize
-            self._data = fft.normalization(
+            data = fft.normalization(
                 self._data, self._n_samples, self._sampling_rate,
                 self._fft_norm, inverse=True)
-            # normalize
+            # normalize (in place only if the data was copied above, because
+            # the data of the signal might be shared with other arrays)
             self._data = fft.normalization(
-                self._data, self._n_samples, self._sampling_rate,
-                value, inverse=False)
+                data, self._n_samples, self._sampling_rate, value,
+                inverse=False, out=None if data is self._data else data)
+            self._shared = False
 
         self._fft_norm = value
 
@@ -338,6 +458,21 @@ class Signal(Audio):
     def __pow__(self, data):
         return power((self, data), 'freq')
 
+    def __iadd__(self, data):
+        return _arithmetic_inplace((self, data), 'freq', _add)
+
+    def __isub__(self, data):
+        return _arithmetic_inplace((self, data), 'freq', _subtract)
+
+    def __imul__(self, data):
+        return _arithmetic_inplace((self, data), 'freq', _multiply)
+
+    def __itruediv__(self, data):
+        return _arithmetic_inplace((self, data), 'freq', _divide)
+
+    def __ipow__(self, data):
+        return _arithmetic_inplace((self, data), 'freq', _power)
+
     def __repr__(self):
         """String representation of signal class.
         """
@@ -351,36 +486,86 @@ class Signal(Audio):
 
     def __getitem__(self, key):
         """Get signal channels at key.
+
+        Integers, slices, and tuples thereof return a Signal that shares the
+        data with the original signal without copying it. The data is copied
+        before it is changed by item assignment, arithmetic operations, or
+        setting the FFT normalization, i.e., this does not change the other
+        signal. Writing directly to the arrays returned by `time` and `freq`
+        changes both signals as for numpy views. Integer arrays and boolean
+        masks of shape `cshape`, e.g., as returned by
+        `Coordinates.get_nearest_k`, return a Signal with a copy of the
+        selected channels.
         """
-        if isinstance(key, (int, slice, tuple)):
+        if isinstance(key, (int, np.integer, slice, tuple, list, np.ndarray)):
             try:
                 data = self._data[key]
-            except KeyError:
-                raise KeyError("Index is out of bounds")
+            except IndexError:
+                raise IndexError("Index is out of bounds")
         else:
             raise TypeError(
-                    "Index must be int, not {}".format(type(key).__name__))
-        items = Signal(
-            data,
-            sampling_rate=self.sampling_rate,
-            domain=self.domain,
-            fft_norm=self.fft_norm,
-            dtype=self.dtype)
+                "Index must be int, slice, tuple, or array like, not "
+                f"{type(key).__name__}")
+        if isinstance(data, np.memmap):
+            # read only the requested channels from disk
+            data = np.array(data)
+
+        return self._view(data)
+
+    def _view(self, data):
+        """Return a Signal holding `data` with the meta data of this signal.
 
+        This avoids checking the meta data in Signal.__init__ and does not
+        copy `data` unless it is read-only, because it is protected by the
+        cache of this signal. The cache is not passed to the new signal.
+        """
+        data = np.atleast_2d(data)
+        if data.shape[-1] != self._data.shape[-1]:
+            if self._domain == 'freq':
+                raise IndexError("Frequency bins can not be indexed.")
+            n_samples = data.shape[-1]
+        else:
+            n_samples = self._n_samples
+
+        if not data.flags.writeable:
+            data = np.array(data)
+
+        shared = self._shared
+        items = copy.copy(self)
+        items._data = data
+        items._n_samples = n_samples
+        items._cache_enabled = False
+        items._shared = np.may_share_memory(data, self._data)
+        self._shared = shared or items._shared
+        return items
+
+    def __copy__(self):
+        """Return a shallow copy of the signal that does not share the cache.
+        """
+        items = self.__class__.__new__(self.__class__)
+        items.__dict__.update(self.__dict__)
+        items._cache = None
+        items._shared = self._shared = True
         return items
 
     def __setitem__(self, key, value):
         """Set signal channels at key.
+
+        The key can be of all types supported by `__getitem__`. The data of
+        `value` is set in the current domain of the signal.
         """
         self._assert_matching_meta_data(value)
-        if isinstance(key, (int, slice)):
+        if isinstance(key, (int, np.integer, slice, tuple, list, np.ndarray)):
+            self._make_writeable()
+            data = value.time if self._domain == 'time' else value.freq
             try:
-                self._data[key] = value._data
-            except KeyError:
-                raise KeyError("Index is out of bound")
+                self._data[key] = data
+            except IndexError:
+                raise IndexError("Index is out of bounds")
         else:
             raise TypeError(
-                    "Index must be int, not {}".format(type(key).__name__))
+                "Index must be int, slice, tuple, or array like, not "
+                f"{type(key).__name__}")
 
     def __len__(self):
         """Length of the object which is the number of samples stored.
@@ -414,7 +599,7 @@ class SignalIterator(object):
         self._array_iterator = array_iterator
         self._signal = signal
         self._iterated_sig = Signal(
-            signal._data[..., 0, :],
+            np.array(signal._data[..., 0, :]),
             sampling_rate=signal.sampling_rate,
             n_samples=signal.n_samples,
             domain=signal.domain,
@@ -424,6 +609,9 @@ class SignalIterator(object):
     def __next__(self):
         if self._signal.domain == self._iterated_sig.domain:
             data = self._array_iterator.__next__()
+            if isinstance(data, np.memmap):
+                # read only the current channel from disk
+                data = np.array(data)
             self._iterated_sig._data = np.atleast_2d(data)
         else:
             raise RuntimeError("domain changes during iterations break stuff!")
@@ -431,6 +619,13 @@ class SignalIterator(object):
         return self._iterated_sig
 
 
+def _asarray(data, dtype):
+    """Convert to numpy array but keep memory mapped data of type `dtype`."""
+    if isinstance(data, np.memmap) and data.dtype == dtype:
+        return data
+    return np.asarray(data, dtype=dtype)
+
+
 def add(data: tuple, domain='freq'):
     """Add signals and/or array likes.
 
@@ -573,26 +768,85 @@ def _arithmetic(data: tuple, domain: str, operation: Callable):
     sampling_rate, n_samples, fft_norm = \
         _assert_match_for_arithmetic(data, domain)
 
-    # apply arithmetic operation
-    result = _get_arithmetic_data(data[0], n_samples, domain)
+    # get the data of all operands without copying it
+    operands = [_get_arithmetic_data(d, n_samples, domain) for d in data]
 
-    for d in range(1, len(data)):
-        result = operation(
-            result, _get_arithmetic_data(data[d], n_samples, domain))
+    # apply arithmetic operation writing all intermediate results to a single
+    # output array
+    result = np.empty(np.broadcast(*operands).shape,
+                      _get_arithmetic_dtype(operands, operation))
+    if len(operands) == 1:
+        result[...] = operands[0]
+    else:
+        operation(operands[0], operands[1], out=result)
+    for operand in operands[2:]:
+        operation(result, operand, out=result)
 
     # check if to retun as Signal
     if sampling_rate is not None:
         # apply desried fft normalization
         if domain == 'freq':
             result = fft.normalization(result, n_samples, sampling_rate,
-                                       fft_norm)
+                                       fft_norm, out=result)
 
         result = Signal(
-            result, sampling_rate, n_samples, domain, fft_norm=fft_norm)
+            result, sampling_rate, n_samples, domain, fft_norm=fft_norm,
+            dtype=result.real.dtype)
 
     return result
 
 
+def _arithmetic_inplace(data: tuple, domain: str, operation: Callable):
+    """
+    Apply arithmetic operations and write the result to the Signal `data[0]`.
+
+    Returns NotImplemented if the shape, data type or FFT normalization of
+    `data[0]` would change, in which case Python falls back to the operator
+    that returns a new Signal.
+    """
+
+    # check input and obtain meta data of new signal
+    _, n_samples, fft_norm = _assert_match_for_arithmetic(data, domain)
+    signal = data[0]
+    if fft_norm != signal.fft_norm:
+        return NotImplemented
+
+    # get the data of all operands without copying it
+    operands = [_get_arithmetic_data(d, n_samples, domain) for d in data]
+    result = operands[0]
+    if result.shape != np.broadcast(*operands).shape \
+            or not np.can_cast(_get_arithmetic_dtype(operands, operation),
+                               result.dtype, 'same_kind'):
+        return NotImplemented
+
+    if result is signal._data:
+        # data of the signal is changed in place
+        signal._make_writeable()
+        result = signal._data
+
+    # apply arithmetic operation
+    for operand in operands[1:]:
+        operation(result, operand, out=result)
+
+    # apply desired fft normalization and set data
+    if domain == 'time':
+        signal.time = result
+    else:
+        signal.freq = fft.normalization(
+            result, n_samples, signal.sampling_rate, fft_norm, out=result)
+
+    return signal
+
+
+def _get_arithmetic_dtype(operands: list, operation: Callable):
+    """Return the data type of the result of an arithmetic operation."""
+    dtype = np.result_type(*operands)
+    if operation is _divide:
+        # true division of integers returns floats
+        dtype = np.result_type(dtype, 1.)
+    return dtype
+
+
 def _assert_match_for_arithmetic(data: tuple, domain: str):
     """Check if type and meta data of input is fine for arithmetic operations.
 
@@ -682,15 +936,17 @@ def _get_arithmetic_data(data, n_samples, domain):
     -------
     data_out : numpy array
         Data in desired domain without any fft normlaization if data is a
-        Signal. `np.asarray(data)` otherwise.
+        Signal. `np.asarray(data)` otherwise. The data is not copied and
+        must not be changed unless it is the result of removing the fft
+        normalization.
     """
     if isinstance(data, Signal):
 
         # get signal in correct domain
         if domain == "time":
-            data_out = data.time.copy()
+            data_out = data.time
         elif domain == "freq":
-            data_out = data.freq.copy()
+            data_out = data.freq
 
             if data.fft_norm != 'none':
                 # remove current fft normalization
@@ -708,21 +964,21 @@ def _get_arithmetic_data(data, n_samples, domain):
     return data_out
 
 
-def _add(a, b):
-    return a + b
+def _add(a, b, out=None):
+    return np.add(a, b, out=out)
 
 
-def _subtract(a, b):
-    return a - b
+def _subtract(a, b, out=None):
+    return np.subtract(a, b, out=out)
 
 
-def _multiply(a, b):
-    return a * b
+def _multiply(a, b, out=None):
+    return np.multiply(a, b, out=out)
 
 
-def _divide(a, b):
-    return a / b
+def _divide(a, b, out=None):
+    return np.true_divide(a, b, out=out)
 
 
-def _power(a, b):
-    return a**b
+def _power(a, b, out=None):
+    return np.power(a, b, out=out)
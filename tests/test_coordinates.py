@@ -231,6 +231,17 @@ def test_coordinates_init_sh_order():
     assert isinstance(coords, Coordinates)
 
 
+def test_coordinates_init_single_precision():
+    coords = Coordinates(np.array([1, 2], dtype=np.float32),
+                         np.array([0, 1], dtype=np.float32), 0)
+    assert coords._points.dtype == np.float32
+    assert coords.get_sph().dtype == np.float32
+
+    # double precision if any non scalar input is double precision
+    coords = Coordinates(np.array([1, 2], dtype=np.float32), [0, 1], 0)
+    assert coords._points.dtype == np.float64
+
+
 def test_show():
     coords = Coordinates([-1, 0, 1], 0, 0)
     # show without mask
@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 import numpy.testing as npt
+from scipy import signal as sgn
 from unittest import mock
 import copy
 from pyfar import Signal
@@ -80,10 +81,215 @@ def test_group_delay_custom_frequencies(impulse_mock):
     assert grp.shape == (2, )
     npt.assert_allclose(grp, np.array([1e3, 1e3]))
 
+
+def test_group_delay_scipy():
+    """Test the group delay against scipy for arbitrary signals."""
+    time = np.random.randn(3, 2, 64)
+    signal = Signal(time, 44100)
+    frequencies = [100, 1e3, 12345.6]
+    for freqs in [None, frequencies]:
+        grp = dsp.group_delay(signal, freqs)
+        desired = np.array([sgn.group_delay(
+            (tt, 1), signal.frequencies if freqs is None else freqs,
+            fs=44100)[1] for tt in time.reshape(-1, 64)])
+        npt.assert_allclose(
+            grp, desired.reshape(grp.shape), rtol=1e-6, atol=1e-8)
+
+
+def test_group_delay_singular():
+    """Test the group delay at frequencies with zero magnitude."""
+    signal = Signal([1, 1], 44100)
+    with pytest.warns(UserWarning, match="singular"):
+        grp = dsp.group_delay(signal)
+    npt.assert_allclose(grp, [.5, 0])
+
 # def test_wrap_to_2pi():
 # def test_nextpow2():
 
 
+def test_pad_zeros():
+    signal = Signal(np.ones((2, 1021)), 44100, fft_norm='rms')
+    padded = dsp.pad_zeros(signal)
+    assert padded.n_samples == 1024
+    assert padded.cshape == (2, )
+    assert padded.fft_norm == 'rms'
+    npt.assert_allclose(padded.time[:, :1021], signal.time)
+    npt.assert_allclose(padded.time[:, 1021:], 0)
+    # crop back after switching the domain
+    padded.domain = 'freq'
+    npt.assert_allclose(
+        dsp.crop(padded, 1021).time, signal.time, atol=1e-12)
+
+    padded = dsp.pad_zeros(signal, 2, 'before')
+    assert padded.n_samples == 1023
+    npt.assert_allclose(padded.time[:, :2], 0)
+    npt.assert_allclose(padded.time[:, 2:], signal.time)
+    npt.assert_allclose(
+        dsp.crop(padded, 1021, 'before').time, signal.time)
+
+    with pytest.raises(ValueError, match='mode'):
+        dsp.pad_zeros(signal, 2, 'center')
+    with pytest.raises(TypeError):
+        dsp.pad_zeros(np.ones(10))
+    with pytest.raises(ValueError, match='n_samples'):
+        dsp.crop(signal, 1022)
+    with pytest.raises(ValueError, match='mode'):
+        dsp.crop(signal, 2, 'center')
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_convolve(dtype):
+    signal_1 = Signal(np.random.randn(2, 1021), 44100, dtype=dtype)
+    signal_2 = Signal(np.random.randn(97), 44100)
+    convolved = dsp.convolve(signal_1, signal_2)
+    assert convolved.n_samples == 1021 + 97 - 1
+    assert convolved.dtype == dtype
+    reference = np.stack([np.convolve(channel, signal_2.time[0])
+                          for channel in signal_1.time])
+    npt.assert_allclose(convolved.time, reference, atol=1e-4)
+    convolved = dsp.convolve(signal_1, signal_2, 'cut')
+    npt.assert_allclose(convolved.time, reference[:, :1021], atol=1e-4)
+
+    with pytest.raises(ValueError, match='mode'):
+        dsp.convolve(signal_1, signal_2, 'cyclic')
+    with pytest.raises(ValueError, match='sampling rates'):
+        dsp.convolve(signal_1, Signal(np.ones(3), 48000))
+
+
+def test_spectrogram_n_fft():
+    signal = Signal(np.sin(np.arange(4000)), 44100, fft_norm='rms')
+    freqs, _, spec = dsp.spectrogram(signal, window_length=1000)
+    freqs_fast, _, spec_fast = dsp.spectrogram(
+        signal, window_length=1000, n_fft=1024)
+    assert spec.shape[0] == 501
+    assert spec_fast.shape[0] == 513
+    # zero padding changes the maximum only by the scalloping loss
+    npt.assert_allclose(np.max(spec), np.max(spec_fast), rtol=5e-2)
+
+    with pytest.raises(ValueError, match='n_fft'):
+        dsp.spectrogram(signal, window_length=1000, n_fft=500)
+
+
+def test_spectrogram_normalization():
+    """The normalization is applied along the frequency axis."""
+    signal = Signal(np.sin(2 * np.pi * 441 * np.arange(8000) / 44100),
+                    44100, fft_norm='rms')
+    _, _, spec = dsp.spectrogram(signal, window_length=1000)
+    # the rms value is the same for all time frames
+    npt.assert_allclose(np.max(spec, axis=0), 1 / np.sqrt(2), rtol=1e-2)
+
+
+def test_spectrogram_multichannel():
+    time = np.random.randn(2, 3, 4000)
+    signal = Signal(time, 44100, fft_norm='amplitude')
+    freqs, times, spec = dsp.spectrogram(signal, window_length=512)
+    assert spec.shape == (2, 3, 257, times.size)
+    _, _, desired = dsp.spectrogram(
+        Signal(time[1, 2], 44100, fft_norm='amplitude'), window_length=512)
+    npt.assert_allclose(spec[1, 2], desired)
+
+
+@pytest.mark.parametrize("block_size", [100, 512, 1500])
+def test_iter_spectrogram(block_size):
+    time = np.random.randn(2, 5000)
+    signal = Signal(time, 44100, fft_norm='rms')
+    freqs, times, spec = dsp.spectrogram(
+        signal, window_length=512, window_overlap_fct=.75)
+
+    blocks = (Signal(time[:, idx:idx + block_size], 44100, fft_norm='rms')
+              for idx in range(0, 5000, block_size))
+    results = list(dsp.iter_spectrogram(
+        blocks, window_length=512, window_overlap_fct=.75))
+    npt.assert_allclose(results[0][0], freqs)
+    npt.assert_allclose(np.concatenate([r[1] for r in results]), times)
+    npt.assert_allclose(
+        np.concatenate([r[2] for r in results], axis=-1), spec)
+
+
+@pytest.mark.parametrize("fft_norm", ['none', 'rms', 'power'])
+@pytest.mark.parametrize("window_length, window_overlap_fct, n_fft", [
+    (512, .5, None), (500, .75, 1024)])
+def test_stft_istft(fft_norm, window_length, window_overlap_fct, n_fft):
+    time = np.random.randn(2, 3, 5000)
+    signal = Signal(time, 44100, fft_norm=fft_norm)
+    kwargs = {'window_length': window_length, 'n_fft': n_fft,
+              'window_overlap_fct': window_overlap_fct}
+    freqs, times, spec = dsp.stft(signal, **kwargs)
+    n_fft = window_length if n_fft is None else n_fft
+    assert spec.shape == (2, 3, n_fft // 2 + 1, times.size)
+    npt.assert_allclose(freqs, np.fft.rfftfreq(n_fft, 1 / 44100))
+    # perfect reconstruction
+    inverse = dsp.istft(spec, 44100, fft_norm=fft_norm, n_samples=5000,
+                        **kwargs)
+    assert inverse.fft_norm == fft_norm
+    npt.assert_allclose(inverse.time, time, atol=1e-12)
+
+
+def test_stft_normalization():
+    signal = Signal(np.sin(2 * np.pi * 441 * np.arange(8000) / 44100),
+                    44100, fft_norm='rms')
+    _, _, spec = dsp.stft(signal, window_length=1000)
+    # rms value of the sine in all segments that are not zero padded
+    npt.assert_allclose(
+        np.max(np.abs(spec[0, :, 2:-2]), axis=0), 1 / np.sqrt(2), rtol=1e-2)
+
+
+def test_istft_cola():
+    spec = np.zeros((257, 10), dtype=complex)
+    with pytest.raises(ValueError, match='COLA'):
+        dsp.istft(spec, 44100, window_length=512, window_overlap_fct=.2)
+    with pytest.raises(ValueError, match='COLA'):
+        next(dsp.iter_istft([spec], 44100, window_length=512,
+                            window_overlap_fct=.2))
+
+
+@pytest.mark.parametrize("block_size", [100, 512, 1500])
+def test_iter_stft_istft(block_size):
+    time = np.random.randn(2, 5000)
+    signal = Signal(time, 44100, fft_norm='amplitude')
+    freqs, times, spec = dsp.stft(signal, window_length=256)
+
+    blocks = (Signal(time[:, idx:idx + block_size], 44100,
+                     fft_norm='amplitude')
+              for idx in range(0, 5000, block_size))
+    results = list(dsp.iter_stft(blocks, window_length=256))
+    npt.assert_allclose(results[0][0], freqs)
+    npt.assert_allclose(np.concatenate([r[1] for r in results]), times)
+    npt.assert_allclose(
+        np.concatenate([r[2] for r in results], axis=-1), spec)
+
+    # streaming resynthesis
+    inverse = dsp.iter_istft(
+        (r[2] for r in results), 44100, window_length=256,
+        fft_norm='amplitude')
+    inverse = np.concatenate([s.time for s in inverse], axis=-1)
+    npt.assert_allclose(
+        inverse, dsp.istft(spec, 44100, window_length=256,
+                           fft_norm='amplitude').time, atol=1e-12)
+    npt.assert_allclose(inverse[:, :5000], time, atol=1e-12)
+
+
+def test_stft_istft_single_precision():
+    time = np.random.randn(2, 5000).astype(np.float32)
+    signal = Signal(time, 44100, fft_norm='rms', dtype=np.float32)
+    _, _, spec = dsp.stft(signal, window_length=256)
+    assert spec.dtype == np.complex64
+    inverse = dsp.istft(spec, 44100, window_length=256, fft_norm='rms',
+                        n_samples=5000)
+    assert inverse.time.dtype == np.float32
+    npt.assert_allclose(inverse.time, time, atol=1e-5)
+
+    blocks = (Signal(time[:, idx:idx + 700], 44100, dtype=np.float32)
+              for idx in range(0, 5000, 700))
+    specs = [r[2] for r in dsp.iter_stft(blocks, window_length=256)]
+    assert all(spec.dtype == np.complex64 for spec in specs)
+    inverse = list(dsp.iter_istft(specs, 44100, window_length=256))
+    assert all(s.time.dtype == np.float32 for s in inverse)
+    npt.assert_allclose(
+        np.concatenate([s.time for s in inverse], axis=-1)[:, :5000], time,
+        atol=1e-5)
+
+
 @pytest.fixture
 def impulse_mock():
     """ Generate impulse signals, in order to test independently of the Signal
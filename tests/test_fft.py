@@ -1,3 +1,5 @@
+import os
+from types import SimpleNamespace
 import numpy as np
 import numpy.testing as npt
 import pytest
@@ -526,6 +528,45 @@ def test_normalization_with_window_value_error():
                           'amplitude', window=[1, 1, 1, 1, 1])
 
 
+def test_normalization_out():
+    """Test in-place normalization and that the input is not changed."""
+    fft_norms = ['none', 'unitary', 'amplitude', 'rms', 'power', 'psd']
+    for fft_norm in fft_norms:
+        spec = np.array([.5, 1, .5])
+        desired = fft.normalization(spec, 4, 44100, fft_norm)
+        npt.assert_allclose(spec, [.5, 1, .5])
+
+        out = np.zeros(3)
+        actual = fft.normalization(spec, 4, 44100, fft_norm, out=out)
+        assert actual is out
+        npt.assert_allclose(actual, desired)
+
+        actual = fft.normalization(spec, 4, 44100, fft_norm, out=spec)
+        assert actual is spec
+        npt.assert_allclose(actual, desired)
+
+
+def test_normalization_cache():
+    """Test if cached normalization factors are reused."""
+    fft._normalization_factors.cache_clear()
+    spec = np.array([.5, 1, .5])
+    fft.normalization(spec, 4, 44100, 'psd', window=[1, 1, 1, 1])
+    fft.normalization(spec, 4, 44100, 'psd', window=np.ones(4))
+    assert fft._normalization_factors.cache_info().hits == 1
+
+    # a different sampling rate changes the psd normalization
+    spec_48 = fft.normalization(spec, 4, 48000, 'psd')
+    spec_44 = fft.normalization(spec, 4, 44100, 'psd')
+    assert fft._normalization_factors.cache_info().misses == 3
+    npt.assert_allclose(spec_48 * 48000, spec_44 * 44100)
+
+    # cached values can not be changed
+    norm = fft._normalization_factors(
+        3, 4, None, 'rms', False, True, None, np.dtype(np.float64))
+    with raises(ValueError):
+        norm[0] = 1
+
+
 def test_normalization_exceptions():
     # try without numpy array
     with raises(ValueError):
@@ -667,10 +708,136 @@ def test_rfft_power_imp_odd_samples_fftw(sine_odd, fft_lib_pyfftw):
     npt.assert_allclose(np.imag(spec), np.imag(truth), atol=1e-10)
 
 
+def test_rfft_irfft_single_precision_np(sine, fft_lib_np):
+    n_samples = 1024
+    sampling_rate = 2e3
+    spec = fft.rfft(sine.astype(np.float32), n_samples, sampling_rate, 'rms')
+    assert spec.dtype == np.complex64
+    data = fft.irfft(spec, n_samples, sampling_rate, 'rms')
+    assert data.dtype == np.float32
+    npt.assert_allclose(data, sine, atol=1e-5)
+
+
+def test_rfft_irfft_single_precision_fftw(sine, fft_lib_pyfftw):
+    n_samples = 1024
+    sampling_rate = 2e3
+    spec = fft.rfft(sine.astype(np.float32), n_samples, sampling_rate, 'psd')
+    assert spec.dtype == np.complex64
+    data = fft.irfft(spec, n_samples, sampling_rate, 'psd')
+    assert data.dtype == np.float32
+    npt.assert_allclose(data, sine, atol=1e-5)
+
+
+def test_normalization_single_precision():
+    spec = np.ones((2, 5), dtype=np.complex64)
+    for fft_norm in ['unitary', 'amplitude', 'rms', 'power', 'psd']:
+        for inverse in [True, False]:
+            norm = fft.normalization(
+                spec.copy(), 8, 44100, fft_norm, inverse=inverse)
+            assert norm.dtype == np.complex64
+
+
+def test_next_fast_len():
+    assert fft.next_fast_len(1024) == 1024
+    assert fft.next_fast_len(1021) == 1024
+    assert fft.next_fast_len(1025) == 1080
+
+
 def test_fft_mock_numpy(fft_lib_np):
     assert 'numpy.fft' in fft.fft_lib.__name__
 
 
+def test_options(fft_options):
+    fft.set_options(threads=2, planner_effort='FFTW_MEASURE', cache=False)
+    assert fft.get_options() == {
+        'threads': 2, 'planner_effort': 'FFTW_MEASURE', 'cache': False}
+
+    # options that are not passed do not change
+    fft.set_options(cache=True)
+    assert fft.get_options() == {
+        'threads': 2, 'planner_effort': 'FFTW_MEASURE', 'cache': True}
+
+    with raises(ValueError, match='threads'):
+        fft.set_options(threads=0)
+    with raises(ValueError, match='planner_effort'):
+        fft.set_options(planner_effort='FFTW_FAST')
+
+
+def test_options_transform(sine, fft_options, fft_lib_pyfftw):
+    fft.set_options(threads=2, planner_effort='FFTW_MEASURE', cache=False)
+    spec = fft.rfft(sine, 1024, 2e3, 'rms')
+    npt.assert_allclose(fft.irfft(spec, 1024, 2e3, 'rms'), sine, atol=1e-10)
+
+
+def test_backends(sine):
+    assert fft.get_backends() == ['numpy', 'scipy', 'pyfftw']
+    assert fft.get_backend() == 'pyfftw'
+
+    for backend in fft.get_backends():
+        with fft.use_backend(backend):
+            assert fft.get_backend() == backend
+            spec = fft.rfft(sine, 1024, 2e3, 'rms')
+            npt.assert_allclose(
+                fft.irfft(spec, 1024, 2e3, 'rms'), sine, atol=1e-10)
+        assert fft.get_backend() == 'pyfftw'
+
+    with raises(ValueError, match='backend must be'):
+        fft.set_backend('matlab')
+
+
+def test_backend_scipy_threads(sine, fft_options):
+    fft.set_options(threads=2)
+    with fft.use_backend('scipy'):
+        spec = fft.rfft(sine.astype(np.float32), 1024, 2e3, 'none')
+        assert spec.dtype == np.complex64
+        npt.assert_allclose(spec, np.fft.rfft(sine), atol=1e-3)
+
+
+def test_register_backend(fft_lib_pyfftw):
+    backend = SimpleNamespace(
+        rfft=np.fft.rfft, irfft=np.fft.irfft, rfftfreq=np.fft.rfftfreq)
+    fft.register_backend('my_numpy', backend)
+    try:
+        fft.set_backend('my_numpy')
+        assert fft.get_backend() == 'my_numpy'
+        assert fft.fft_lib is backend
+    finally:
+        fft._backends.pop('my_numpy')
+
+    with raises(ValueError, match='must provide'):
+        fft.register_backend('bla', object())
+
+
+def test_wisdom(tmpdir, monkeypatch, fft_lib_pyfftw):
+    # use temporary folder as user cache directory
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir))
+    assert not fft.load_wisdom()
+
+    fft.rfft(np.ones(100), 100, 44100, 'none')
+    fft.save_wisdom()
+    filename = os.path.join(str(tmpdir), 'pyfar', 'fftw_wisdom.npz')
+    assert os.path.isfile(filename)
+    assert fft.load_wisdom()
+
+    # the wisdom is restored without pickling
+    filename = os.path.join(str(tmpdir), 'wisdom')
+    fft.save_wisdom(filename)
+    assert os.path.isfile(filename)
+    wisdom = fft.pyfftw.export_wisdom()
+    fft.pyfftw.forget_wisdom()
+    assert fft.load_wisdom(filename)
+    # FFTW does not keep the order of the plans
+    for actual, desired in zip(fft.pyfftw.export_wisdom(), wisdom):
+        assert sorted(actual.splitlines()) == sorted(desired.splitlines())
+
+
+@pytest.fixture
+def fft_options():
+    options = fft.get_options()
+    yield
+    fft.set_options(**options)
+
+
 @pytest.fixture
 def fft_lib_np(monkeypatch):
     # from pyfar.fft import fft_lib
@@ -491,6 +491,193 @@ def test_filter_sos_process_multi_dim_filt(impulse_mock):
     npt.assert_allclose(res.time[:, :3], coeff[:, 0])
 
 
+def test_filter_process_single_precision():
+    sig = Signal([1, 0, 0, 0], 2000, dtype=np.float32)
+    filt = fo.FilterFIR(np.array([1, 1/2, 0]), 2000)
+    res = filt.process(sig)
+    assert res.time.dtype == np.float32
+    npt.assert_allclose(res.time, np.atleast_2d([1, 1/2, 0, 0]))
+
+    sos = np.array([[[1, 1/2, 0, 1, 0, 0]], [[1, 1/4, 0, 1, 0, 0]]])
+    res = fo.FilterSOS(sos, 2000).process(sig)
+    assert res.time.dtype == np.float32
+
+
+def test_filter_process_multichannel_signal():
+    # a single filter is applied to all channels of the signal
+    sig = Signal([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]], 2000)
+    res = fo.FilterFIR(np.array([1, 1/2]), 2000).process(sig)
+    npt.assert_allclose(res.time, [[1, 1/2, 0, 0], [0, 1, 1/2, 0],
+                                   [0, 0, 1, 1/2]])
+
+    # filter banks are applied to all channels of the signal
+    coeff = np.array([[1, 1/2], [1, 1/4]])
+    res = fo.FilterFIR(coeff, 2000).process(sig)
+    assert res.cshape == (2, 3)
+    npt.assert_allclose(res.time[1, 2], [0, 0, 1, 1/4])
+
+    sos = np.array([[[1, 1/2, 0, 1, 0, 0]], [[1, 1/4, 0, 1, 0, 0]]])
+    res = fo.FilterSOS(sos, 2000).process(sig)
+    assert res.cshape == (2, 3)
+    npt.assert_allclose(res.time[0, 1], [0, 1, 1/2, 0])
+
+
+@pytest.mark.parametrize("filt, func", [
+    (fo.FilterFIR(np.random.randn(4, 100), 2000), fo.lfilter),
+    (fo.FilterSOS(np.array([
+        [[1, 1/2, 0, 1, -1/2, 0], [1, 0, 1, 1, 0, 1/4]],
+        [[1, 1/4, 0, 1, 1/2, 0], [1, 0, 1, 1, 0, 1/4]],
+        [[1, 1/2, 0, 1, -1/2, 0], [1, 0, 1, 1, 0, 1/4]],
+        [[1, 1/2, 0, 1, -1/2, 0], [1, 0, 1, 1, 0, 1/4]]]), 2000),
+     fo.sosfilt)])
+def test_filter_process_filter_bank(filt, func):
+    # all filter channels are applied at once and match filtering each
+    # channel separately, also with different states per filter channel
+    data = np.random.randn(2, 3, 1000)
+    filt.initialize((2, 3))
+    filt._state = np.random.randn(*filt.state.shape)
+    state = filt.state.copy()
+    actual = filt.process(Signal(data, 2000), reset=False).time
+    assert actual.shape == (4, 2, 3, 1000)
+    for idx, coeff in enumerate(filt._coefficients):
+        desired, zf = func(coeff, data, state[idx])
+        npt.assert_allclose(actual[idx], desired, atol=1e-12)
+        npt.assert_allclose(filt.state[idx], zf, atol=1e-12)
+
+    actual = filt.process(Signal(data, 2000)).time
+    for idx, coeff in enumerate(filt._coefficients):
+        npt.assert_allclose(
+            actual[idx], func(coeff, data, np.zeros_like(state[idx]))[0],
+            atol=1e-12)
+
+
+def test_filter_process_keeps_input():
+    sig = Signal([1, 0, 0, 0], 2000, comment='impulse')
+    sig.cache = True
+    sig.freq
+    time = sig.time
+    res = fo.FilterFIR(np.array([1, 1/2]), 2000).process(sig)
+    npt.assert_allclose(res.time, [[1, 1/2, 0, 0]])
+    assert res.comment == 'impulse'
+    # input signal and its cache are not changed
+    assert sig.time is time
+    assert not time.flags.writeable
+    npt.assert_allclose(sig.time, [[1, 0, 0, 0]])
+
+
+def test_filter_initialize():
+    sos = np.array([[[1, 1/2, 0, 1, -1/2, 0], [1, 0, 0, 1, 1/4, 0]]])
+    filt = fo.FilterSOS(sos, 2000)
+    filt.initialize((2, 3))
+    assert filt.state.shape == (1, 2, 2, 3, 2)
+    npt.assert_array_equal(filt.state, 0)
+
+    coeff = np.array([[[1, 1/2, 0], [1, -1/2, 0]], [[1, 0, 0], [1, 1/4, 0]]])
+    filt = fo.FilterIIR(coeff, 2000)
+    filt.initialize(4, state='step')
+    assert filt.state.shape == (2, 4, 2)
+    # steady state for constant input
+    res = filt.process(Signal(np.ones((4, 10)), 2000), reset=False)
+    npt.assert_allclose(res.time[0], 3)
+    npt.assert_allclose(res.time[1], 1/(1 + 1/4))
+
+    with pytest.raises(ValueError, match="'zeros' or 'step'"):
+        filt.initialize(state='ones')
+
+
+def test_filter_init_state():
+    state = np.array([[[1/2]]])
+    filt = fo.FilterFIR(np.array([1, 1]), 2000, state=state)
+    res = filt.process(Signal([1, 0, 0], 2000), reset=False)
+    npt.assert_allclose(res.time, [[1.5, 1, 0]])
+    npt.assert_array_equal(filt.state, 0)
+
+    sos = np.array([[1, 1/2, 0, 1, 0, 0]])
+    filt = fo.FilterSOS(sos, 2000, state=np.ones((1, 1, 1, 2)))
+    res = filt.process(Signal([1, 0, 0], 2000), reset=False)
+    npt.assert_allclose(res.time, [[2, 1.5, 0]])
+
+    with pytest.raises(ValueError, match="does not match"):
+        filt.process(Signal(np.zeros((2, 3)), 2000), reset=False)
+
+
+@pytest.mark.parametrize("filt", [
+    fo.FilterFIR(np.random.randn(2, 100), 2000),
+    fo.FilterIIR(np.array([[1, 1/2, 1/4], [1, -1/2, 1/8]]), 2000),
+    fo.FilterSOS(np.array([[1, 1/2, 0, 1, -1/2, 0], [1, 0, 1, 1, 0, 1/4]]),
+                 2000)])
+def test_filter_process_block(filt):
+    data = np.random.randn(3, 1024)
+    filt.initialize(3)
+    desired = filt.process(Signal(data, 2000), reset=False).time
+
+    filt.reset()
+    actual = [filt.process_block(Signal(data[:, idx:idx+256], 2000)).time
+              for idx in range(0, 1024, 256)]
+    npt.assert_allclose(np.concatenate(actual, axis=-1), desired)
+
+
+def test_filter_process_block_initializes():
+    filt = fo.FilterFIR(np.array([1, 1, 1]), 2000)
+    res = filt.process_block(Signal([[1, 0], [0, 1]], 2000))
+    npt.assert_allclose(res.time, [[1, 1], [0, 1]])
+    res = filt.process_block(Signal([[0, 0], [0, 0]], 2000))
+    npt.assert_allclose(res.time, [[1, 0], [1, 1]])
+
+
+@pytest.mark.parametrize("n_taps, n_samples", [
+    (1, 10), (3, 1000), (100, 50), (100, 1000), (500, 100)])
+def test_fftfilt(n_taps, n_samples):
+    b = np.random.randn(n_taps)
+    a = np.zeros(n_taps)
+    a[0] = 1
+    coeff = np.stack((b, a))
+    data = np.random.randn(2, 3, n_samples)
+    npt.assert_allclose(
+        fo.fftfilt(coeff, data, zi=None), fo.lfilter(coeff, data, zi=None),
+        atol=1e-12)
+
+    zi = np.random.randn(2, 3, n_taps - 1)
+    actual = fo.fftfilt(coeff, data, zi)
+    desired = fo.lfilter(coeff, data, zi)
+    npt.assert_allclose(actual[0], desired[0], atol=1e-12)
+    npt.assert_allclose(actual[1], desired[1], atol=1e-12)
+
+
+def test_fftfilt_single_precision():
+    coeff = np.stack((np.random.randn(100), np.eye(1, 100)[0]))
+    data = np.random.randn(2, 1000).astype(np.float32)
+    zi = np.zeros((2, 99), dtype=np.float32)
+    actual, state = fo.fftfilt(coeff, data, zi)
+    assert actual.dtype == np.float32
+    assert state.dtype == np.float32
+    npt.assert_allclose(
+        actual, fo.lfilter(coeff, data, zi=None), rtol=1e-4, atol=1e-4)
+
+    # the precision does not depend on the selected filter function
+    sig = Signal(data, 2000, dtype=np.float32)
+    for n_taps in [64, 65]:
+        res = fo.FilterFIR(np.random.randn(n_taps), 2000).process(sig)
+        assert res.time.dtype == np.float32
+
+
+def test_filter_fir_filter_func():
+    # the filter function is selected by the number of coefficients
+    assert fo.FilterFIR(np.ones(64), 2000).filter_func is fo.lfilter
+    assert fo.FilterFIR(np.ones(65), 2000).filter_func is fo.fftfilt
+    filt = fo.FilterFIR(np.ones(3), 2000, filter_func='fft')
+    assert filt.filter_func is fo.fftfilt
+    filt.filter_func = 'default'
+    assert filt.filter_func is fo.lfilter
+
+    sig = Signal(np.random.randn(2, 1000), 2000)
+    coeff = np.random.randn(2, 300)
+    npt.assert_allclose(
+        fo.FilterFIR(coeff, 2000).process(sig).time,
+        fo.FilterFIR(coeff, 2000, filter_func='default').process(sig).time,
+        atol=1e-12)
+
+
 def test_atleast_3d_first_dim():
     arr = np.array([1, 0, 0])
     desired = np.array([[[1, 0, 0]]])
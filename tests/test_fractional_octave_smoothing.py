@@ -4,6 +4,7 @@ from pytest import approx
 import pyfar.dsp.fractional_octave_smoothing as fs
 from pyfar import Signal
 import numpy as np
+import numpy.testing as npt
 
 
 @pytest.fixture
@@ -44,7 +45,7 @@ def test_init_exceptions():
         assert fs.FractionalSmoothing(
             wrong_ndarray_type, win_width)
     assert str(
-        error.value) == "ndarry must by of type: numpy.complex182."
+        error.value) == "ndarray must be of a complex type."
 
     with pytest.raises(Exception) as error:
         assert fs.FractionalSmoothing(data, 'str')
@@ -52,69 +53,48 @@ def test_init_exceptions():
 
 
 def test_calc_integration_limits(smoother):
-    # 1.    Check if cutoff values are correct and at correct position
-    # 2.    Check if sum of cutoff values == win_width
-    # 3.    Check each limit between cutoff limits
-    # Window size
+    # Check if cutoff values are correct and span win_width in log2
     win_width = smoother._smoothing_width
-    # Get integration_limits
     limits = smoother._limits
-    # Check limits:
+    assert limits.shape == (smoother._n_bins, 2)
     # Freq bin zero:
-    assert limits[0, :, :].all() == 0.0
+    assert np.all(limits[0] == 0.0)
     # Freq bin greater then zero:
     for k, limit in enumerate(limits[1:], start=1):
-        # Compute cutoff bin of rectangular window:
-        expected_lower_cutoff = k*2**(-win_width/2)
-        expected_upper_cutoff = k*2**(win_width/2)
-        # Indices of cutoff bins in array:
-        k_i = np.arange(limit.shape[1])
-        # Last element that is smaller then lower cutoff
-        exp_i_low_cutoff = np.argmin(
-            (k_i - .5) < expected_lower_cutoff) - 1
-        # First element that is larger then upper cutoff:
-        exp_i_upper_cutoff = np.argmax(
-            expected_upper_cutoff < (k_i + .5))
-
-        # Limits at cutoff in scaled log:
-        expected_lower_limit = np.log2(expected_lower_cutoff/k)
-        expected_upper_limit = np.log2(expected_upper_cutoff/k)
-        # Check value at expected position
-        assert limit[1][exp_i_low_cutoff] == expected_lower_limit
-        assert limit[0][exp_i_upper_cutoff] == expected_upper_limit
-        # Check if sum of upper and lower limit equal win_width:
-        assert limit[0][exp_i_upper_cutoff] + abs(
-            limit[1][exp_i_low_cutoff]) == approx(win_width)
-
-        for k_ii in range(exp_i_low_cutoff+1, exp_i_upper_cutoff):
-            # Upper limit:
-            assert limit[0][k_ii] == np.log2((k_ii+.5)/k)
-            # Lower limit:
-            assert limit[1][k_ii] == np.log2((k_ii-.5)/k)
+        assert limit[0] == approx(k*2**(win_width/2))
+        assert limit[1] == approx(k*2**(-win_width/2))
+        assert np.log2(limit[0]/limit[1]) == approx(win_width)
 
 
 def test_calc_weights(smoother):
-    # Signal length
     signal_length = smoother._n_bins
-    # Window size
     win_width = smoother._smoothing_width
-    # Get weights:
     weights = smoother._weights
-    # Check size of weighting matrix:
-    assert weights.shape[0] == signal_length
-    # Expected length of axis 1:
-    # max_cutoff_bin = ceil(max_cutoff_value) + 1 (for k=0)
-    expected_axis1_length = np.ceil((signal_length - 1)*2**(win_width/2)) + 1
-    assert weights.shape[1] == int(expected_axis1_length)
+    # Bins completely inside a window are weighted by their log2 width
+    k = np.arange(2, signal_length)
+    npt.assert_allclose(
+        weights[2:], np.log2((k + .5) / (k - .5)) / win_width)
+    # Bins containing the limits
+    bins = smoother._bins
+    assert np.all(bins[1:, 0] == np.minimum(
+        np.floor(smoother._limits[1:, 0] + .5), signal_length - 1))
+    assert np.all(bins[1:, 1] == np.floor(smoother._limits[1:, 1] + .5))
+    # Padding only for windows exceeding the last bin
+    assert np.all((smoother._pad_weights > 0) == (
+        smoother._limits[:, 0] > signal_length - .5))
+
+
+def test_apply_constant(smoother):
     # Sum of weights for each bin == 1
-    assert np.allclose(np.sum(weights, axis=1), np.full(signal_length, 1.),
-                       atol=1e-16)
+    smoothed_data = smoother.apply()
+    assert smoothed_data.shape == (2, 100)
+    npt.assert_allclose(smoothed_data, 1., atol=1e-14)
 
 
-def test_apply(smoother):
+def test_apply():
     channel_number = 1
     signal_length = 30      # Signal length in freq domain
-    data = np.zeros((channel_number, signal_length), dtype=np.complex)
+    data = np.zeros((channel_number, signal_length), dtype=np.complex128)
     data[:, 3] = 1
     win_width = 3
     # Create smoothing object
@@ -125,19 +105,75 @@ def test_apply(smoother):
     smoother.calc_weights()
     # Apply
     smoothed_data = smoother.apply()
-    weights = smoother._weights
     # Check shape
     assert smoothed_data.shape == data.shape
 
-    # Pad data array for multiplication:
-    # neglect padding with mean value
-    # --> boundary effects if signal size too small
-    pad_size_diff = smoother._limits.shape[-1] - data.shape[1]
-    padded_data = np.pad(data[0], (0, pad_size_diff))
+    # Check each freq bin against integrating the triangular window over
+    # the bins in the log2 frequency domain
+    magnitude = np.abs(data[0])
+    for k in range(1, signal_length):
+        low, up = smoother._limits[k, 1], smoother._limits[k, 0]
+        edges = np.clip(np.arange(signal_length + 1) - .5, low, up)
+        weights = np.diff(np.log2(edges)) / win_width
+        # pad with mean value within the window
+        start = int(np.floor(low + .5))
+        pad = np.log2(up / max(low, signal_length - .5)) / win_width
+        expected = np.sum(weights * magnitude) \
+            + max(pad, 0) * np.mean(magnitude[start:])
+        assert smoothed_data[0, k] == approx(expected, abs=1e-15)
+
+
+def test_apply_cshape():
+    data = np.random.rand(3, 2, 50) + 1j * np.random.rand(3, 2, 50)
+    smoother = fs.FractionalSmoothing(data, 1)
+    smoother.calc_integration_limits()
+    smoother.calc_weights()
+    smoothed_data = smoother.apply()
+    assert smoothed_data.shape == (3, 2, 50)
+    # phase is kept
+    npt.assert_allclose(np.angle(smoothed_data), np.angle(data))
+    # channels are smoothed independently
+    smoother = fs.FractionalSmoothing(data[1, 0], 1)
+    smoother.calc_integration_limits()
+    smoother.calc_weights()
+    npt.assert_allclose(smoother.apply()[0], smoothed_data[1, 0])
+
 
-    # Check each freq bin:
-    for k in range(smoothed_data.shape[1]):
-        assert np.sum(weights[0, k]*padded_data) == smoothed_data[0, k]
+def test_apply_magnitude_only():
+    data = np.random.rand(2, 50) * np.exp(1j * np.random.rand(2, 50))
+    data[0, 10] = 0
+    smoother = fs.FractionalSmoothing(data, 1)
+    smoother.calc_integration_limits()
+    smoother.calc_weights()
+    magnitude = smoother.apply(magnitude_only=True)
+    assert np.isrealobj(magnitude)
+    npt.assert_allclose(np.abs(smoother.apply()), magnitude)
+    # zero phase for bins without magnitude
+    assert smoother.apply()[0, 10] == magnitude[0, 10]
+
+
+def test_polar2cartesian():
+    amplitude = np.random.rand(3, 2, 10)
+    phase = np.random.rand(3, 2, 10)
+    npt.assert_allclose(fs.polar2cartesian(amplitude, phase),
+                        amplitude * (np.cos(phase) + 1j * np.sin(phase)))
+    with pytest.raises(ValueError, match="same shapes"):
+        fs.polar2cartesian(amplitude, phase[0])
+
+
+def test_smoothing_operator_cache():
+    fs._smoothing_operator.cache_clear()
+    data = np.ones((2, 64), dtype=np.complex128)
+    for _ in range(3):
+        fs.frac_smooth_hrtf(data, 1)
+    assert fs._smoothing_operator.cache_info().misses == 1
+    # different keys
+    fs.frac_smooth_hrtf(data[..., :32], 1)
+    fs.frac_smooth_hrtf(data, 1/3)
+    assert fs._smoothing_operator.cache_info().misses == 3
+    # cached arrays can not be changed
+    for array in fs._smoothing_operator(64, 1):
+        assert not array.flags.writeable
 
 
 # TODO
@@ -152,6 +188,28 @@ def test_smooth_signal():
     assert smoothed_signal._data.shape == signal._data.shape
 
 
+def test_smooth_signal_magnitude_only():
+    signal = Signal(np.random.randn(2, 64), 44100)
+    smoothed = fs.frac_smooth_signal(signal, 1, magnitude_only=True)
+    npt.assert_allclose(smoothed.freq, np.abs(fs.frac_smooth_signal(
+        signal, 1).freq))
+    smoothed = fs.frac_smooth_hrtf(signal.freq, 1, magnitude_only=True)
+    assert np.isrealobj(smoothed)
+
+
+def test_smooth_single_precision():
+    signal = Signal(np.random.randn(2, 64), 44100)
+    signal_32 = Signal(signal.time, 44100, dtype=np.float32)
+    smoothed = fs.frac_smooth_signal(signal_32, 1)
+    assert smoothed.dtype == np.float32
+    assert smoothed.freq.dtype == np.complex64
+    npt.assert_allclose(
+        smoothed.freq, fs.frac_smooth_signal(signal, 1).freq,
+        rtol=1e-4, atol=1e-5)
+    smoothed = fs.frac_smooth_hrtf(signal_32.freq, 1, magnitude_only=True)
+    assert smoothed.dtype == np.float32
+
+
 # TODO
 def DISABLED_test_smooth_hrtf():
     hrtf_data = np.empty((1, 1), dtype=np.complex128)
@@ -6,9 +6,13 @@ from unittest import mock
 import os.path
 import scipy.io.wavfile as wavfile
 import sofa
+import netCDF4
 
 from pyfar import io
 from pyfar import Signal
+from pyfar import Coordinates
+from pyfar.dsp import FilterFIR, FilterIIR, FilterSOS
+from pyfar.dsp.classes import fftfilt, filtfilt
 
 
 def test_read_wav(tmpdir):
@@ -27,6 +31,87 @@ def test_read_wav(tmpdir):
     assert signal.sampling_rate == sampling_rate
 
 
+def test_read_wav_single_precision(tmpdir):
+    """Test reading into a single precision signal."""
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    signal_ref, sampling_rate = reference_signal()
+    wavfile.write(filename, sampling_rate, signal_ref.T.astype(np.float32))
+    signal = io.read_wav(filename, dtype=np.float32)
+    assert signal.time.dtype == np.float32
+    npt.assert_allclose(signal.time, np.atleast_2d(signal_ref), rtol=1e-6)
+
+
+def test_read_wav_mmap(tmpdir):
+    """Test reading a memory mapped WAV file."""
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    signal_ref, sampling_rate = reference_signal((2, ))
+    wavfile.write(filename, sampling_rate, signal_ref.T.astype(np.float32))
+    signal = io.read_wav(filename, mmap=True)
+    assert isinstance(signal._data, np.memmap)
+    assert signal.dtype == np.float32
+    npt.assert_allclose(signal[1].time, signal_ref[1:], rtol=1e-6)
+
+    with pytest.raises(ValueError, match='dtype must be None'):
+        io.read_wav(filename, dtype=np.double, mmap=True)
+
+
+def test_read_wav_normalize(tmpdir):
+    """Test reading integer PCM data scaled to single precision."""
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    data = np.array([[-32768, -16384, 0, 16384, 32767]], dtype=np.int16)
+    wavfile.write(filename, 44100, data.T)
+    signal = io.read_wav(filename, dtype=np.float32, normalize=True)
+    assert signal.time.dtype == np.float32
+    npt.assert_array_equal(signal.time, data / 2**15)
+
+    wavfile.write(filename, 44100, np.array([0, 64, 128, 255], np.uint8))
+    signal = io.read_wav(filename, normalize=True)
+    npt.assert_array_equal(signal.time, [[-1, -.5, 0, 127 / 128]])
+
+    with pytest.raises(ValueError, match='floating point'):
+        io.read_wav(filename, dtype=np.int16, normalize=True)
+    with pytest.raises(ValueError, match='mmap'):
+        io.read_wav(filename, mmap=True, normalize=True)
+
+
+def test_read_write_wav_24bit(tmpdir):
+    """Test reading and writing 24-bit PCM data."""
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    data = np.random.randint(-2**23, 2**23, (3, 1001))
+    data[:, :2] = [-2**23, 2**23 - 1]
+    io.write_wav(Signal(data, 44100), filename, dtype='int24')
+
+    # scipy returns 24-bit data in the upper bytes of int32
+    npt.assert_array_equal(wavfile.read(filename)[-1].T, data * 2**8)
+    npt.assert_array_equal(io.read_wav(filename).time, data)
+    signal = io.read_wav(filename, dtype=np.float32, normalize=True)
+    assert signal.time.dtype == np.float32
+    npt.assert_allclose(signal.time, data / 2**23, rtol=1e-7)
+    blocks = list(io.iter_wav(filename, 300, normalize=True))
+    npt.assert_array_equal(
+        np.concatenate([block.time for block in blocks], axis=-1),
+        data / 2**23)
+
+    with pytest.raises(ValueError, match='24-bit'):
+        io.read_wav(filename, mmap=True)
+
+
+def test_write_wav_normalize(tmpdir):
+    """Test writing data in the range -1 to 1 as integer PCM."""
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    signal = Signal([-2, -1, -.5, 0, .5, 1], 44100)
+    io.write_wav(signal, filename, dtype='int16', normalize=True)
+    npt.assert_array_equal(
+        wavfile.read(filename)[-1], [-32768, -32768, -16384, 0, 16384, 32767])
+    io.write_wav(signal, filename, dtype='int24', normalize=True)
+    npt.assert_array_equal(
+        io.read_wav(filename).time,
+        [[-2**23, -2**23, -2**22, 0, 2**22, 2**23 - 1]])
+    io.write_wav(signal, filename, dtype='uint8', normalize=True)
+    npt.assert_array_equal(
+        wavfile.read(filename)[-1], [0, 0, 64, 128, 192, 255])
+
+
 def test_write_wav(signal_mock, tmpdir):
     """Test default without optional parameters."""
     filename = os.path.join(tmpdir, 'test_wav.wav')
@@ -60,6 +145,178 @@ def test_write_wav_nd(signal_mock_nd, tmpdir):
         rtol=1e-10)
 
 
+@pytest.mark.parametrize("dtype", ['uint8', 'int16', 'int32', 'float32',
+                                   'float64'])
+@pytest.mark.parametrize("block_size, overlap", [
+    (100, 0), (100, 30), (10000, 10)])
+def test_iter_wav(dtype, block_size, overlap, tmpdir):
+    """Test reading WAV files block by block."""
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    data = (np.random.rand(3, 1001) * 100).astype(dtype)
+    wavfile.write(filename, 44100, data.T)
+
+    blocks = list(io.iter_wav(filename, block_size, overlap))
+    assert all(isinstance(block, Signal) for block in blocks)
+    assert all(block.n_samples == block_size for block in blocks[:-1])
+    assert blocks[0].sampling_rate == 44100
+    npt.assert_array_equal(blocks[0].time, data[:, :block_size])
+    time = np.concatenate(
+        [blocks[0].time] + [block.time[:, overlap:] for block in blocks[1:]],
+        axis=-1)
+    npt.assert_array_equal(time, data)
+
+
+def test_iter_wav_errors(tmpdir):
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    wavfile.write(filename, 44100, np.zeros(10))
+    with pytest.raises(ValueError, match='block_size'):
+        next(io.iter_wav(filename, 0))
+    with pytest.raises(ValueError, match='overlap'):
+        next(io.iter_wav(filename, 10, 10))
+    with open(filename, 'wb') as fid:
+        fid.write(b'RIFX')
+    with pytest.raises(ValueError, match='RIFF'):
+        next(io.iter_wav(filename, 10))
+
+
+@pytest.mark.parametrize("dtype", ['uint8', 'int16', 'int32', 'float32',
+                                   'float64'])
+def test_wav_writer(dtype, tmpdir):
+    """Test writing WAV files block by block."""
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    data = (np.random.rand(3, 1001) * 100).astype(dtype)
+    with io.WavWriter(filename, dtype=dtype) as writer:
+        for idx in range(0, 1001, 300):
+            writer.write(Signal(data[:, idx:idx + 300], 44100))
+    assert writer.n_samples == 1001
+
+    sampling_rate, reload = wavfile.read(filename)
+    assert sampling_rate == 44100
+    assert reload.dtype == dtype
+    npt.assert_array_equal(reload.T, data)
+
+
+def test_wav_writer_not_closed(tmpdir):
+    """Test reading a WAV file before the writer is closed."""
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    data = np.random.rand(2, 1000)
+    writer = io.WavWriter(filename)
+    writer.write(Signal(data[:, :600], 44100))
+    npt.assert_array_equal(io.read_wav(filename).time, data[:, :600])
+    writer.write(Signal(data[:, 600:], 44100))
+    blocks = list(io.iter_wav(filename, 300))
+    npt.assert_array_equal(
+        np.concatenate([block.time for block in blocks], axis=-1), data)
+    writer.close()
+    npt.assert_array_equal(wavfile.read(filename)[-1].T, data)
+
+    # files without data are removed
+    writer = io.WavWriter(filename)
+    with pytest.warns(UserWarning, match='No data'):
+        writer.close()
+    assert not os.path.isfile(filename)
+
+
+def test_wav_writer_errors(tmpdir):
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    writer = io.WavWriter(filename)
+    writer.write(Signal(np.zeros((2, 10)), 44100))
+    with pytest.raises(ValueError, match='sampling rates'):
+        writer.write(Signal(np.zeros((2, 10)), 48000))
+    with pytest.raises(ValueError, match='number of channels'):
+        writer.write(Signal(np.zeros((3, 10)), 44100))
+    writer.close()
+    with pytest.raises(FileExistsError):
+        io.WavWriter(filename, overwrite=False)
+    with pytest.raises(ValueError, match='not supported'):
+        with io.WavWriter(filename, dtype=np.int64) as writer:
+            writer.write(Signal(np.zeros((2, 10)), 44100))
+
+
+@pytest.mark.parametrize("domain", ['time', 'freq'])
+@pytest.mark.parametrize("compress, mmap", [
+    (False, False), (False, True), (True, False)])
+def test_write_read_signal(domain, compress, mmap, tmpdir):
+    """Test writing and reading signals."""
+    filename = os.path.join(tmpdir, 'test.npz')
+    signal = Signal(np.random.rand(3, 2, 100), 44100, fft_norm='rms',
+                    dtype=np.float32, comment='noise')
+    signal.domain = domain
+    io.write(filename, compress=compress, noise=signal)
+
+    reload = io.read(filename, mmap=mmap)['noise']
+    assert isinstance(reload._data, np.memmap) == mmap
+    assert reload.domain == domain
+    assert reload.sampling_rate == 44100
+    assert type(reload.sampling_rate) is int
+    assert reload.n_samples == 100
+    assert reload.fft_norm == 'rms'
+    assert reload.dtype == np.float32
+    assert reload.comment == 'noise'
+    npt.assert_array_equal(reload.freq, signal.freq)
+
+
+def test_write_read_coordinates(tmpdir):
+    """Test writing and reading coordinates."""
+    filename = os.path.join(tmpdir, 'test.npz')
+    coordinates = Coordinates(
+        [0, 90], [0, 45], 1, domain='sph', convention='top_elev', unit='deg',
+        weights=[.3, .7], sh_order=1, comment='grid')
+    io.write(filename, grid=coordinates, empty=Coordinates())
+
+    objs = io.read(filename, mmap=True)
+    reload = objs['grid']
+    assert reload._system == coordinates._system
+    npt.assert_array_equal(reload._points, coordinates._points)
+    npt.assert_array_equal(reload.weights, [.3, .7])
+    assert reload.sh_order == 1
+    assert reload.comment == 'grid'
+    assert objs['empty'].csize == 0
+    assert objs['empty'].weights is None
+
+
+def test_write_read_filter(tmpdir):
+    """Test writing and reading filters."""
+    filename = os.path.join(tmpdir, 'test.npz')
+    fir = FilterFIR(np.random.rand(2, 100), 44100)
+    fir.initialize((3, ))
+    iir = FilterIIR([[1, .5], [1, -.2]], 44100.5, filter_func='zerophase')
+    sos = FilterSOS([[[1, 0, 0, 1, -.5, 0]]], np.int64(48000))
+    sos.comment = 'sos'
+    io.write(filename, fir=fir, iir=iir, sos=sos)
+
+    objs = io.read(filename, mmap=True)
+    assert isinstance(objs['fir'], FilterFIR)
+    npt.assert_array_equal(objs['fir']._coefficients, fir._coefficients)
+    npt.assert_array_equal(objs['fir'].state, fir.state)
+    assert objs['fir'].filter_func == fftfilt
+    assert objs['iir'].filter_func == filtfilt
+    assert objs['iir'].state is None
+    assert objs['sos'].sampling_rate == 48000
+    assert type(objs['sos'].sampling_rate) is int
+    assert objs['iir'].sampling_rate == 44100.5
+    assert type(objs['iir'].sampling_rate) is float
+    assert objs['sos'].comment == 'sos'
+    signal = Signal(np.random.rand(3, 200), 48000)
+    npt.assert_allclose(
+        objs['sos'].process(signal).time, sos.process(signal).time)
+
+
+def test_write_read_errors(tmpdir):
+    filename = os.path.join(tmpdir, 'test.npz')
+    with pytest.raises(ValueError, match='not supported'):
+        io.write(filename, data=np.zeros(10))
+    with pytest.raises(ValueError, match="must not contain '/'"):
+        io.write(filename, **{'a/b': Coordinates()})
+    io.write(filename, compress=True, grid=Coordinates(0, 0, 1))
+    with pytest.raises(ValueError, match='Compressed'):
+        io.read(filename, mmap=True)
+    with pytest.raises(FileExistsError):
+        io.write(filename, overwrite=False, grid=Coordinates())
+    with pytest.warns(UserWarning, match='.npz'):
+        io.write(filename[:-4], grid=Coordinates())
+
+
 def test_read_sofa_GeneralFIR(tmpdir):
     """Test for sofa datatype GeneralFIR"""
     sofatype = 'GeneralFIR'
@@ -131,6 +388,128 @@ def test_read_sofa_position_type(tmpdir):
         io.read_sofa(filename)
 
 
+def test_sofa_reader(tmpdir):
+    """Test reading parts of a SOFA file."""
+    filename, data = generate_sofa_hrirs(tmpdir)
+    with io.SofaReader(filename, dtype=np.float32) as hrirs:
+        assert hrirs.n_measurements == 6
+        assert hrirs.n_receivers == 2
+        assert hrirs.n_samples == 8
+        assert hrirs.sampling_rate == 48000
+        assert hrirs.source_coordinates.cshape == (6, )
+        npt.assert_array_equal(hrirs.read().time, data)
+        assert hrirs.read().dtype == np.float32
+        npt.assert_array_equal(hrirs[2].time, data[2])
+        npt.assert_array_equal(hrirs[1:3, 0].time, data[1:3, 0])
+        npt.assert_array_equal(hrirs[[4, 1, 4]].time, data[[4, 1, 4]])
+        with pytest.raises(IndexError, match='Too many indices'):
+            hrirs[0, 0, 0]
+        npt.assert_array_equal(
+            hrirs.read([[0, 5], [3, 0]], 1).time, data[[[0, 5], [3, 0]], 1])
+
+
+def test_sofa_reader_get_nearest_k(tmpdir):
+    """Test reading the measurements closest to a source position."""
+    filename, data = generate_sofa_hrirs(tmpdir)
+    with io.SofaReader(filename) as hrirs:
+        signal, index = hrirs.get_nearest_k(
+            [5, 250], 0, 1, domain='sph', convention='top_elev', unit='deg')
+        npt.assert_array_equal(index, [0, 4])
+        npt.assert_array_equal(signal.time, data[[0, 4]])
+
+        signal, index = hrirs.get_nearest_k(
+            125, 0, 1, k=2, domain='sph', convention='top_elev', unit='deg')
+        npt.assert_array_equal(index, [2, 3])
+        assert signal.cshape == (2, 2)
+
+
+def test_write_sofa(tmpdir):
+    """Test writing and reading SOFA files."""
+    filename = os.path.join(tmpdir, 'test.sofa')
+    data = np.random.rand(10, 2, 64)
+    source_coordinates = Coordinates(
+        np.arange(10) * 36., 0, 1.5, domain='sph', convention='top_elev',
+        unit='deg')
+    receiver_coordinates = Coordinates(0, [.1, -.1], 0)
+    io.write_sofa(Signal(data, 44100), source_coordinates,
+                  receiver_coordinates, filename)
+
+    signal, source, receiver = io.read_sofa(filename)
+    npt.assert_allclose(signal.time, data)
+    assert signal.sampling_rate == 44100
+    npt.assert_allclose(
+        source.get_sph('top_elev', 'deg'),
+        source_coordinates.get_sph('top_elev', 'deg'), atol=1e-12)
+    npt.assert_allclose(receiver.get_cart(), receiver_coordinates.get_cart())
+    with io.SofaReader(filename) as hrirs:
+        index = hrirs.get_nearest_k(
+            72, 0, 1.5, domain='sph', convention='top_elev', unit='deg')[1]
+    assert index == 2
+
+    # per-measurement chunks with zlib compression
+    with netCDF4.Dataset(filename) as dataset:
+        assert dataset['Data.IR'].chunking() == [1, 2, 64]
+        assert dataset['Data.IR'].filters()['zlib']
+        assert dataset['Data.IR'].filters()['complevel'] == 4
+
+    # single receiver, fixed source position, no compression
+    io.write_sofa(Signal(data[:, 0], 44100), Coordinates(1, 0, 0),
+                  Coordinates(0, 0, 0), filename, chunks=(5, 1, 64),
+                  compression=0)
+    signal, source, receiver = io.read_sofa(filename)
+    npt.assert_allclose(signal.time, data[:, :1])
+    assert source.csize == 1
+    with netCDF4.Dataset(filename) as dataset:
+        assert dataset['Data.IR'].chunking() == [5, 1, 64]
+        assert not dataset['Data.IR'].filters()['zlib']
+
+
+def test_write_sofa_errors(tmpdir):
+    filename = os.path.join(tmpdir, 'test.sofa')
+    signal = Signal(np.zeros((3, 2, 10)), 44100)
+    source = Coordinates(0, 0, [1, 2, 3])
+    receiver = Coordinates(0, [1, 2], 0)
+    with pytest.raises(ValueError, match='Signal'):
+        io.write_sofa(np.zeros((3, 2, 10)), source, receiver, filename)
+    with pytest.raises(ValueError, match='cshape'):
+        io.write_sofa(Signal(np.zeros((3, 2, 1, 10)), 44100), source,
+                      receiver, filename)
+    with pytest.raises(ValueError, match='source'):
+        io.write_sofa(signal, receiver, receiver, filename)
+    with pytest.raises(ValueError, match='receiver'):
+        io.write_sofa(signal, source, source, filename)
+    with pytest.raises(ValueError, match='chunks'):
+        io.write_sofa(signal, source, receiver, filename, chunks=0)
+    with pytest.raises(ValueError, match='chunks'):
+        io.write_sofa(signal, source, receiver, filename, chunks=(1, 1, 1, 1))
+    io.write_sofa(signal, source, receiver, filename)
+    with pytest.raises(FileExistsError):
+        io.write_sofa(signal, source, receiver, filename, overwrite=False)
+
+
+def generate_sofa_hrirs(filedir):
+    """Generate a SOFA file with six source positions on the horizontal
+    plane and return the file name and impulse responses."""
+    data = np.arange(6 * 2 * 8.).reshape(6, 2, 8)
+    filename = os.path.join(filedir, 'hrirs.sofa')
+    sofafile = sofa.Database.create(
+        filename, 'GeneralFIR', dimensions={"M": 6, "R": 2, "N": 8})
+    sofafile.Listener.initialize(fixed=["Position", "View", "Up"])
+    sofafile.Source.initialize(variances=["Position"], fixed=["View", "Up"])
+    sofafile.Source.Position.Type = 'spherical'
+    sofafile.Source.Position = np.stack(
+        (np.arange(6) * 60., np.zeros(6), np.ones(6)), axis=-1)
+    sofafile.Receiver.initialize(fixed=["Position", "View", "Up"])
+    sofafile.Receiver.Position = reference_coordinates()[1]
+    sofafile.Emitter.initialize(fixed=["Position", "View", "Up"], count=1)
+    sofafile.Data.Type = 'FIR'
+    sofafile.Data.initialize()
+    sofafile.Data.IR = data
+    sofafile.Data.SamplingRate = 48000
+    sofafile.close()
+    return filename, data
+
+
 def generate_sofa_file(filedir, sofatype):
     """ Generate the reference sofa files used for testing the read_sofa function.
     Parameters
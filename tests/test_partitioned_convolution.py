@@ -0,0 +1,94 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import scipy.signal as sgn
+
+from pyfar import Signal
+from pyfar.dsp import PartitionedConvolution
+
+
+def convolve_blocks(conv, data, sampling_rate=44100):
+    """Convolve data block by block and return the concatenated blocks."""
+    block_size = conv.block_size
+    return np.concatenate([
+        conv.process_block(
+            Signal(data[..., idx:idx + block_size], sampling_rate)).time
+        for idx in range(0, data.shape[-1], block_size)], axis=-1)
+
+
+@pytest.mark.parametrize("partitions", [
+    None, [64, 64, 128, 128, 256, 256, 512], [64, 64, 128, 256, 512]])
+def test_partitioned_convolution(partitions):
+    ir = np.random.randn(1000)
+    data = np.random.randn(64 * 40)
+    conv = PartitionedConvolution(Signal(ir, 44100), 64, partitions)
+
+    actual = convolve_blocks(conv, data)
+    desired = np.convolve(ir, data)[:data.size]
+    npt.assert_allclose(actual[0], desired, atol=1e-12)
+
+
+def test_partitioned_convolution_fast_length():
+    """Block sizes without a fast FFT length are zero padded."""
+    ir = np.random.randn(500)
+    data = np.random.randn(61 * 20)
+    conv = PartitionedConvolution(
+        Signal(ir, 44100), 61, [61, 61, 122, 122, 244])
+    assert [stage.n_fft for stage in conv._stages] == [125, 250, 500]
+
+    actual = convolve_blocks(conv, data)
+    desired = np.convolve(ir, data)[:data.size]
+    npt.assert_allclose(actual[0], desired, atol=1e-12)
+
+
+def test_partitioned_convolution_cshape():
+    ir = np.random.randn(2, 3, 100)
+    data = np.random.randn(3, 32 * 10)
+    conv = PartitionedConvolution(Signal(ir, 44100), 32)
+
+    actual = convolve_blocks(conv, data)
+    assert actual.shape == (2, 3, 320)
+    desired = sgn.oaconvolve(ir, data[np.newaxis], axes=-1)[..., :320]
+    npt.assert_allclose(actual, desired, atol=1e-12)
+
+
+def test_partitioned_convolution_reset():
+    ir = np.random.randn(100)
+    data = np.random.randn(2, 32 * 10)
+    conv = PartitionedConvolution(Signal(ir, 44100), 32)
+    convolve_blocks(conv, data)
+
+    # cshape can not change without reset
+    with pytest.raises(ValueError, match="cshape of the signal changed"):
+        conv.process_block(Signal(np.zeros(32), 44100))
+    conv.reset()
+    actual = convolve_blocks(conv, data[0])
+    npt.assert_allclose(
+        actual[0], np.convolve(ir, data[0])[:320], atol=1e-12)
+
+
+def test_partitioned_convolution_properties():
+    conv = PartitionedConvolution(Signal(np.ones(100), 48000), 32)
+    assert conv.block_size == 32
+    assert conv.sampling_rate == 48000
+    npt.assert_array_equal(conv.partitions, [32, 32, 32, 32])
+
+
+def test_partitioned_convolution_errors():
+    ir = Signal(np.ones(100), 44100)
+    with pytest.raises(ValueError, match="pyfar.Signal"):
+        PartitionedConvolution(np.ones(100), 32)
+    with pytest.raises(ValueError, match="positive integer"):
+        PartitionedConvolution(ir, 0)
+    with pytest.raises(ValueError, match="multiples of the block size"):
+        PartitionedConvolution(ir, 32, [32, 48, 64])
+    with pytest.raises(ValueError, match="must start at least"):
+        PartitionedConvolution(ir, 32, [32, 128])
+    with pytest.raises(ValueError, match="shorter than"):
+        PartitionedConvolution(ir, 32, [32, 32])
+
+    conv = PartitionedConvolution(ir, 32)
+    with pytest.raises(ValueError, match="sampling rates"):
+        conv.process_block(Signal(np.zeros(32), 48000))
+    with pytest.raises(ValueError, match="32 samples"):
+        conv.process_block(Signal(np.zeros(31), 44100))
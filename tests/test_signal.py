@@ -93,6 +93,108 @@ def test_domain_setter_time_when_freq(sine):
         signal._data, np.atleast_2d(sine), atol=1e-14, rtol=1e-14)
 
 
+def test_cache_default(sine):
+    signal = Signal(sine, 44100)
+    assert signal.cache is False
+    assert signal.cache_max_bytes is None
+    signal.freq
+    assert signal._cache is None
+
+
+def test_cache_domain_switch(sine):
+    signal = Signal(sine, 44100, fft_norm='rms')
+    signal.cache = True
+    spec = signal.freq
+    time = signal.time
+    # the cached arrays are reused without a Fourier Transform
+    assert signal.freq is spec
+    assert signal.time is time
+    npt.assert_allclose(time, np.atleast_2d(sine), atol=1e-14)
+    # data is read-only while both domains are kept
+    with pytest.raises(ValueError, match='read-only'):
+        signal.time[0, 0] = 1
+
+
+def test_cache_invalidate_on_write(sine, impulse):
+    signal = Signal(sine, 44100)
+    signal.cache = True
+    signal.freq
+    signal.time = impulse
+    assert signal._cache is None
+    npt.assert_allclose(signal.freq, np.ones((1, 501)), atol=1e-14)
+
+    # item assignment
+    signal.time
+    signal[0] = Signal(sine, 44100)
+    assert signal._cache is None
+    npt.assert_allclose(signal.freq, np.atleast_2d(np.fft.rfft(sine)))
+
+
+def test_cache_invalidate_on_fft_norm(sine):
+    signal = Signal(sine, 44100, fft_norm='unitary')
+    signal.cache = True
+    signal.freq
+    signal.time
+    signal.fft_norm = 'rms'
+    assert signal._cache is None
+    npt.assert_allclose(
+        signal.freq, fft.rfft(sine, len(sine), 44100, 'rms')[np.newaxis],
+        atol=1e-14)
+    # time data stays valid if the spectrum is re-normalized
+    signal.fft_norm = 'amplitude'
+    assert signal._cache is not None
+    npt.assert_allclose(signal.time, np.atleast_2d(sine), atol=1e-14)
+
+
+def test_cache_max_bytes(sine):
+    signal = Signal(sine, 44100)
+    signal.cache = True
+    signal.cache_max_bytes = 10
+    signal.freq
+    assert signal._cache is None
+
+    signal.cache_max_bytes = None
+    signal.time
+    assert signal._cache is not None
+    signal.cache_max_bytes = 10
+    assert signal._cache is None
+    signal.time[0, 0] = 1
+
+    with pytest.raises(ValueError, match='cache_max_bytes'):
+        signal.cache_max_bytes = -1
+
+
+def test_cache_disable(sine):
+    signal = Signal(sine, 44100)
+    signal.cache = True
+    signal.freq
+    signal.cache = False
+    assert signal._cache is None
+    signal.freq[0, 0] = 1
+
+
+def test_cache_shared_data():
+    """Test if the cache is not changed through shared data."""
+    data = np.ones((2, 8))
+    signal = Signal(data, 44100)
+    channel = signal[0]
+    signal.cache = True
+    npt.assert_allclose(signal.freq[:, 0], [8, 8])
+
+    # changing the view or the input array does not change the cache
+    channel.time[0, 0] = 100
+    data[1, 0] = 100
+    npt.assert_allclose(signal.freq[:, 0], [8, 8])
+    npt.assert_allclose(signal.time, np.ones((2, 8)))
+
+    # the cache is not passed to views, which are writeable
+    channel = signal[0]
+    assert channel.cache is False
+    assert channel._cache is None
+    channel.time[0, 0] = 100
+    npt.assert_allclose(signal.time[:, 0], [1, 1])
+
+
 def test_signal_init_val(sine):
     """Test to init Signal with complete parameters."""
     signal = Signal(sine, 44100, domain="time", fft_norm='rms')
@@ -233,6 +335,38 @@ def test_setter_fft_norm(sine):
         signal.fft_norm = 'bullshit'
 
 
+@pytest.mark.parametrize('fft_norm', ['unitary', 'rms'])
+def test_setter_fft_norm_shared_data(fft_norm):
+    """Test if changing the fft_norm from 'none' does not change shared
+    data."""
+    spec = np.atleast_2d([1, 2, 1]).astype(complex)
+    expected = fft.normalization(spec, 4, 44100, fft_norm)
+
+    # data passed by the user
+    data = spec.copy()
+    signal = Signal(data, 44100, n_samples=4, domain='freq')
+    signal.fft_norm = fft_norm
+    npt.assert_allclose(signal.freq, expected)
+    npt.assert_allclose(data, spec)
+
+    # data shared with a view
+    signal = Signal(np.concatenate((spec, spec)), 44100, n_samples=4,
+                    domain='freq')
+    channel = signal[0]
+    channel.fft_norm = fft_norm
+    npt.assert_allclose(channel.freq, expected)
+    npt.assert_allclose(signal.freq, np.concatenate((spec, spec)))
+    assert signal.fft_norm == 'none'
+
+    # read-only data kept in the cache
+    signal = Signal(spec, 44100, n_samples=4, domain='freq')
+    signal.cache = True
+    signal.time
+    signal.freq
+    signal.fft_norm = fft_norm
+    npt.assert_allclose(signal.freq, expected)
+
+
 def test_dtype(sine):
     """Test for the getter od dtype."""
     dtype = np.float64
@@ -240,6 +374,19 @@ def test_dtype(sine):
     assert signal.dtype == dtype
 
 
+def test_dtype_single_precision(sine):
+    """Test if single precision is kept during domain changes."""
+    signal = Signal(sine, 44100, dtype=np.float32, fft_norm='rms')
+    assert signal.time.dtype == np.float32
+    assert signal.freq.dtype == np.complex64
+    assert signal.time.dtype == np.float32
+    npt.assert_allclose(signal.time, np.atleast_2d(sine), atol=1e-5)
+
+    signal = Signal(signal.freq, 44100, 1000, 'freq', dtype=np.float32)
+    assert signal.freq.dtype == np.complex64
+    assert signal.time.dtype == np.float32
+
+
 def test_signal_length(sine):
     """Test for the signal length."""
     signal = Signal(sine, 44100)
@@ -278,6 +425,101 @@ def test_magic_getitem_allslice(sine, impulse):
     npt.assert_allclose(Signal(data, sr)._data, signal[:]._data)
 
 
+def test_signal_memmap(tmpdir):
+    """Test if memory mapped data stays on disk until it is indexed."""
+    filename = str(tmpdir.join('signal.dat'))
+    data = np.memmap(filename, dtype=np.double, mode='w+', shape=(3, 10))
+    data[:] = np.arange(3)[:, np.newaxis]
+    data.flush()
+
+    data = np.memmap(filename, dtype=np.double, mode='r', shape=(3, 10))
+    signal = Signal(data, 44100)
+    assert isinstance(signal._data, np.memmap)
+    assert signal.cshape == (3, )
+
+    # indexing returns channels in memory
+    channel = signal[1]
+    assert not isinstance(channel._data, np.memmap)
+    npt.assert_allclose(channel.time, np.ones((1, 10)))
+    channel.time[0, 0] = 2
+
+    for idx, channel in enumerate(signal):
+        assert not isinstance(channel._data, np.memmap)
+        npt.assert_allclose(channel.time, np.full((1, 10), idx))
+
+    # data of other type is converted
+    signal = Signal(data, 44100, dtype=np.float32)
+    assert not isinstance(signal._data, np.memmap)
+
+
+def test_magic_getitem_view(sine, impulse):
+    """Test if basic indexing shares the data with the original signal."""
+    data = np.array([sine, impulse])
+    signal = Signal(data, 44100, fft_norm='rms', comment='Bla')
+    channel = signal[1]
+    assert np.shares_memory(channel._data, signal._data)
+    assert channel.fft_norm == 'rms'
+    assert channel.comment == 'Bla'
+    channel.time[0, 1] = 2
+    assert signal.time[1, 1] == 2
+
+    # the data is copied before it is changed through the signals
+    expected = signal.time.copy()
+    channel[0] = Signal(np.zeros_like(impulse), 44100, fft_norm='rms')
+    assert not np.shares_memory(channel._data, signal._data)
+    npt.assert_allclose(signal.time, expected)
+    channel = signal[1]
+    channel += 1
+    npt.assert_allclose(
+        channel.time, (Signal(expected[1], 44100, fft_norm='rms') + 1).time)
+    npt.assert_allclose(signal.time, expected)
+    channel = signal[1]
+    signal *= 2
+    npt.assert_allclose(channel.time, expected[[1]])
+    npt.assert_allclose(signal.time, 2 * expected, atol=1e-14)
+
+    # frequency domain keeps the number of samples
+    signal = Signal(np.ones((2, 3, 6)), 44100)
+    signal.domain = 'freq'
+    assert signal[0].n_samples == 6
+    assert signal[0, 1:].cshape == (2, )
+    with pytest.raises(IndexError, match='Frequency bins'):
+        signal[..., :2]
+
+
+def test_magic_getitem_fancy(sine, impulse):
+    """Test indexing with integer arrays and boolean masks."""
+    data = np.ones((3, 4, 10)) * np.arange(12).reshape(3, 4, 1)
+    signal = Signal(data, 44100)
+    npt.assert_allclose(signal[[0, 2]]._data, data[[0, 2]])
+
+    mask = np.zeros((3, 4), dtype=bool)
+    mask[0, 1] = True
+    mask[2, 3] = True
+    selection = signal[mask]
+    assert selection.cshape == (2, )
+    npt.assert_allclose(selection.time, data[mask])
+
+    with pytest.raises(IndexError, match='out of bounds'):
+        signal[5]
+    with pytest.raises(TypeError, match='Index must be'):
+        signal['bla']
+
+
+def test_magic_setitem_fancy(sine, impulse):
+    """Test the magic function __setitem__ with a boolean mask."""
+    signal = Signal(np.zeros((3, 10)), 44100)
+    signal[np.array([True, False, True])] = Signal(np.ones(10), 44100)
+    npt.assert_allclose(signal.time[:, 0], [1, 0, 1])
+
+    # data is set in the domain of the signal
+    signal.domain = 'freq'
+    value = Signal(impulse[:10], 44100)
+    signal[1] = value
+    assert signal.domain == 'freq'
+    npt.assert_allclose(signal.freq[1], np.ones(6))
+
+
 def test_magic_setitem(sine, impulse):
     """Test the magic function __setitem__."""
     sr = 44100
@@ -36,6 +36,22 @@ def test_add_two_signals_freq():
     npt.assert_allclose(y.freq, np.atleast_2d([2, 2]), atol=1e-15)
 
 
+def test_arithmetic_single_precision():
+    x = Signal([1, 0, 0], 44100, dtype=np.float32, fft_norm='rms')
+
+    y = signal.add((x, x), 'time')
+    assert y.time.dtype == np.float32
+    y = signal.multiply((x, x, 2), 'freq')
+    assert y.freq.dtype == np.complex64
+    assert y.time.dtype == np.float32
+    y = x / 2
+    assert y.freq.dtype == np.complex64
+
+    # double precision wins if precisions are mixed
+    y = signal.add((x, Signal([1, 0, 0], 44100)), 'time')
+    assert y.time.dtype == np.float64
+
+
 # test adding three signals
 def test_add_three_signals():
     # generate and add signals
@@ -142,6 +158,77 @@ def test_overloaded_operators():
     npt.assert_allclose(z.freq, np.array([4, 1, 0], ndmin=2), atol=1e-15)
 
 
+def test_arithmetic_n_ary():
+    x = Signal([[1, 0, 0], [2, 0, 0]], 44100)
+    y = Signal([1, 0, 0], 44100)
+    z = signal.add((y, x, 1, y), 'time')
+    npt.assert_allclose(z.time, [[4, 1, 1], [5, 1, 1]], atol=1e-15)
+    # inputs did not change
+    npt.assert_allclose(y.time, np.atleast_2d([1, 0, 0]), atol=1e-15)
+    npt.assert_allclose(x.time, [[1, 0, 0], [2, 0, 0]], atol=1e-15)
+
+    # integer division returns floats
+    npt.assert_allclose(signal.divide(([1, 2], 2), 'time'), [.5, 1])
+
+
+def test_inplace_operators():
+    x = Signal([1, 0, 0], 44100)
+    x_id = id(x)
+    x.freq
+    data_id = id(x._data)
+
+    x += 1
+    x *= Signal([2, 0, 0], 44100)
+    x -= 1
+    x /= 3
+    x **= 2
+    assert id(x) == x_id
+    assert id(x._data) == data_id
+    npt.assert_allclose(x.freq, np.atleast_2d([1, 1]), atol=1e-15)
+
+    # with fft normalization
+    x = Signal([1, 0, 0], 44100, fft_norm='rms')
+    x_id = id(x)
+    x *= 2
+    assert id(x) == x_id
+    assert x.fft_norm == 'rms'
+    npt.assert_allclose(x.time, np.atleast_2d([2, 0, 0]), atol=1e-15)
+
+
+def test_inplace_operators_fallback():
+    # broadcasting changes the shape
+    x = Signal([1, 0, 0], 44100)
+    y = x
+    x += Signal([[1, 0, 0], [2, 0, 0]], 44100)
+    assert x is not y
+    assert x.cshape == (2, )
+    npt.assert_allclose(y.time, np.atleast_2d([1, 0, 0]), atol=1e-15)
+
+    # the cache is kept if the operation falls back
+    x = Signal([1, 0, 0], 44100)
+    x.cache = True
+    x.time
+    x.freq
+    cache = x._cache
+    y = x
+    x += Signal([[1, 0, 0], [2, 0, 0]], 44100)
+    assert y._cache is cache
+
+    # fft normalization changes
+    x = Signal([1, 0, 0], 44100)
+    y = x
+    x += Signal([1, 0, 0], 44100, fft_norm='rms')
+    assert x is not y
+    assert x.fft_norm == 'rms'
+
+    # the data type is kept as in numpy
+    x = Signal([1, 0, 0], 44100, dtype=np.float32)
+    y = x
+    x += Signal([1, 0, 0], 44100)
+    assert x is y
+    assert x.freq.dtype == np.complex64
+
+
 def test_assert_match_for_arithmetic():
     s = Signal([1, 2, 3, 4], 44100)
     s1 = Signal([1, 2, 3, 4], 48000)